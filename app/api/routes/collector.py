@@ -1,43 +1,119 @@
 import base64
+from dataclasses import dataclass
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.core.cache import interview_cache
+from app.core.config import settings
 from app.db.session import get_db
 from app.repositories.collector_repository import CollectorRepository
 from app.repositories.interview_repository import InterviewRepository
+from app.repositories.question_bank_repository import QuestionBankRepository
 from app.repositories.transcript_repository import TranscriptRepository
-from app.schemas.collector import CollectorStartRequest, CollectorStartResponse, CollectorTurnRequest, CollectorTurnResponse
+from app.schemas.collector import (
+    AudioPolicy,
+    CollectorStartRequest,
+    CollectorStartResponse,
+    CollectorTurnRequest,
+    CollectorTurnResponse,
+)
 from app.services.interview_flow_service import FIELD_PROMPTS, InterviewFlowService
 from app.services.openai_service import OpenAIService
+from app.services.question_audio import schedule_question_audio
+from app.services.question_stream import open_question_stream
+from app.services.session_actor import CollectorSessionState
 
 router = APIRouter(prefix="/collector", tags=["collector"])
 
 
-def process_collector_turn(
+@dataclass
+class CollectorReplyPrompt:
+    field_name: str
+    user_response: str
+    next_field_prompt: str | None
+
+
+@dataclass
+class CollectorTurnDraft:
+    """Outcome of a collector turn before the assistant reply is rendered.
+
+    Either ``assistant_message`` is a fixed text, or ``reply_prompt`` holds the
+    inputs for an LLM-written reply. Callers render the reply (whole or
+    streamed) and its audio exactly once according to their AudioPolicy, then
+    store it with ``finish_collector_turn`` (the voice socket stores it itself
+    to keep the transcript entry id for resume tokens).
+    """
+
+    collector_session_id: int
+    user_id: str | None
+    expected_field: str | None
+    completed: bool = False
+    interview_id: int | None = None
+    assistant_message: str | None = None
+    reply_prompt: CollectorReplyPrompt | None = None
+
+
+def _synthesize_inline(
+    openai_service: OpenAIService | None, text: str, audio_format: str | None = None
+) -> tuple[str | None, str | None]:
+    """TTS for the "inline" audio policy; failures (including building the service) fall back to a text-only reply."""
+    try:
+        openai_service = openai_service or OpenAIService(audio_format=audio_format)
+        assistant_audio, assistant_audio_content_type = openai_service.synthesize_speech(text)
+        return base64.b64encode(assistant_audio).decode("utf-8"), assistant_audio_content_type
+    except Exception as exc:
+        print(f"[collector] Speech unavailable, replying with text only: {exc}")
+        return None, None
+
+
+def prepare_collector_turn(
     collector_session_id: int,
     user_message: str,
     db: Session,
     user_id: str | None = None,
     openai_service: OpenAIService | None = None,
-) -> CollectorTurnResponse:
+    state: CollectorSessionState | None = None,
+) -> CollectorTurnDraft:
+    """Apply the user's message to the collector state and persist it.
+
+    ``state`` is the in-memory session owned by a socket's SessionActor; it is
+    updated only after each write succeeds. Without it the session is loaded
+    from the database (REST turns).
+    """
     collector_repo = CollectorRepository(db)
     interview_repo = InterviewRepository(db)
     transcript_repo = TranscriptRepository(db)
-    openai_service = openai_service or OpenAIService()
 
-    session = collector_repo.get(collector_session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Collector session not found")
-    if session.status == "completed":
+    if state is None:
+        session = collector_repo.get(collector_session_id)
+        if not session:
+            raise HTTPException(status_code=404, detail="Collector session not found")
+        state = CollectorSessionState.from_model(session)
+    if state.status == "completed":
         raise HTTPException(status_code=400, detail="Collector session already completed")
 
-    effective_user_id = user_id or session.user_id
-    payload = collector_repo.parse_payload(session)
-    current_field = session.current_field
+    effective_user_id = user_id or state.user_id
+    payload = dict(state.payload)
+    current_field = state.current_field
+
+    transcript_repo.add("collector", state.id, "user", user_message, user_id=effective_user_id, refresh=False)
+
+    def save(next_field: str, status: str):
+        collector_repo.write_state(state.id, payload, current_field=next_field, status=status, user_id=effective_user_id)
+        state.payload = payload
+        state.current_field = next_field
+        state.status = status
+        if effective_user_id is not None:
+            state.user_id = effective_user_id
 
-    transcript_repo.add("collector", session.id, "user", user_message, user_id=effective_user_id)
+    def reply(message: str) -> CollectorTurnDraft:
+        return CollectorTurnDraft(
+            collector_session_id=state.id,
+            user_id=effective_user_id,
+            expected_field=current_field,
+            assistant_message=message,
+        )
 
     correction = InterviewFlowService.detect_correction(current_field, payload, user_message)
     if correction:
@@ -45,230 +121,158 @@ def process_collector_turn(
         try:
             corrected_value = InterviewFlowService.normalize_field_value(target_field, corrected_text)
         except ValueError as exc:
-            msg = f"Got it. I couldn’t update {target_field} yet: {exc}"
-            assistant_audio_base64 = None
-            assistant_audio_content_type = None
-            try:
-                assistant_audio, assistant_audio_content_type = openai_service.synthesize_speech(msg)
-                assistant_audio_base64 = base64.b64encode(assistant_audio).decode("utf-8")
-            except Exception:
-                assistant_audio_base64 = None
-                assistant_audio_content_type = None
-            transcript_repo.add("collector", session.id, "assistant", msg, user_id=effective_user_id)
-            return CollectorTurnResponse(
-                collector_session_id=session.id,
-                user_id=effective_user_id,
-                assistant_message=msg,
-                assistant_audio_base64=assistant_audio_base64,
-                assistant_audio_content_type=assistant_audio_content_type,
-                expected_field=current_field,
-                completed=False,
-            )
+            return reply(InterviewFlowService.build_correction_failed_reply(target_field, exc))
 
         payload[target_field] = corrected_value
-        collector_repo.update_payload(
-            session,
-            payload,
-            current_field=current_field,
-            status="collecting",
-            user_id=effective_user_id,
-        )
+        save(current_field, "collecting")
 
         if isinstance(corrected_value, list):
             corrected_display = ", ".join(corrected_value)
         else:
             corrected_display = str(corrected_value)
 
-        assistant_message = (
+        return reply(
             f"Understood, {corrected_display} it is. {FIELD_PROMPTS[current_field]}"
             if current_field in FIELD_PROMPTS
             else f"Understood, {corrected_display} it is."
         )
 
-        assistant_audio_base64 = None
-        assistant_audio_content_type = None
-        try:
-            assistant_audio, assistant_audio_content_type = openai_service.synthesize_speech(assistant_message)
-            assistant_audio_base64 = base64.b64encode(assistant_audio).decode("utf-8")
-        except Exception:
-            assistant_audio_base64 = None
-            assistant_audio_content_type = None
-
-        transcript_repo.add("collector", session.id, "assistant", assistant_message, user_id=effective_user_id)
-        return CollectorTurnResponse(
-            collector_session_id=session.id,
-            user_id=effective_user_id,
-            assistant_message=assistant_message,
-            assistant_audio_base64=assistant_audio_base64,
-            assistant_audio_content_type=assistant_audio_content_type,
-            expected_field=current_field,
-            completed=False,
-        )
-
     intent = InterviewFlowService.detect_turn_intent(current_field, user_message)
     if intent in {"repeat", "examples", "clarify", "clarify_readiness", "not_ready"}:
-        assistant_message = InterviewFlowService.build_intent_reply(current_field, intent)
-        assistant_audio_base64 = None
-        assistant_audio_content_type = None
-        try:
-            assistant_audio, assistant_audio_content_type = openai_service.synthesize_speech(assistant_message)
-            assistant_audio_base64 = base64.b64encode(assistant_audio).decode("utf-8")
-        except Exception:
-            assistant_audio_base64 = None
-            assistant_audio_content_type = None
-        transcript_repo.add("collector", session.id, "assistant", assistant_message, user_id=effective_user_id)
-        return CollectorTurnResponse(
-            collector_session_id=session.id,
-            user_id=effective_user_id,
-            assistant_message=assistant_message,
-            assistant_audio_base64=assistant_audio_base64,
-            assistant_audio_content_type=assistant_audio_content_type,
-            expected_field=current_field,
-            completed=False,
-        )
+        return reply(InterviewFlowService.build_intent_reply(current_field, intent))
 
     if current_field == "readiness" and intent != "confirm_ready":
-        assistant_message = InterviewFlowService.build_intent_reply(current_field, "clarify_readiness")
-        assistant_audio_base64 = None
-        assistant_audio_content_type = None
-        try:
-            assistant_audio, assistant_audio_content_type = openai_service.synthesize_speech(assistant_message)
-            assistant_audio_base64 = base64.b64encode(assistant_audio).decode("utf-8")
-        except Exception:
-            assistant_audio_base64 = None
-            assistant_audio_content_type = None
-        transcript_repo.add("collector", session.id, "assistant", assistant_message, user_id=effective_user_id)
-        return CollectorTurnResponse(
-            collector_session_id=session.id,
-            user_id=effective_user_id,
-            assistant_message=assistant_message,
-            assistant_audio_base64=assistant_audio_base64,
-            assistant_audio_content_type=assistant_audio_content_type,
-            expected_field=current_field,
-            completed=False,
-        )
+        return reply(InterviewFlowService.build_intent_reply(current_field, "clarify_readiness"))
 
     try:
         normalized_value = InterviewFlowService.normalize_field_value(current_field, user_message)
     except ValueError as exc:
-        msg = f"Thanks. I need a valid value for {current_field}: {exc}"
-        assistant_audio_base64 = None
-        assistant_audio_content_type = None
-        try:
-            assistant_audio, assistant_audio_content_type = openai_service.synthesize_speech(msg)
-            assistant_audio_base64 = base64.b64encode(assistant_audio).decode("utf-8")
-        except Exception:
-            assistant_audio_base64 = None
-            assistant_audio_content_type = None
-        transcript_repo.add("collector", session.id, "assistant", msg, user_id=effective_user_id)
-        return CollectorTurnResponse(
-            collector_session_id=session.id,
-            user_id=effective_user_id,
-            assistant_message=msg,
-            assistant_audio_base64=assistant_audio_base64,
-            assistant_audio_content_type=assistant_audio_content_type,
-            expected_field=current_field,
-            completed=False,
-        )
+        return reply(InterviewFlowService.build_invalid_value_reply(current_field, exc))
     except Exception:
-        msg = f"Thanks. Could you provide {current_field} in a clear format?"
-        assistant_audio_base64 = None
-        assistant_audio_content_type = None
-        try:
-            assistant_audio, assistant_audio_content_type = openai_service.synthesize_speech(msg)
-            assistant_audio_base64 = base64.b64encode(assistant_audio).decode("utf-8")
-        except Exception:
-            assistant_audio_base64 = None
-            assistant_audio_content_type = None
-        transcript_repo.add("collector", session.id, "assistant", msg, user_id=effective_user_id)
-        return CollectorTurnResponse(
-            collector_session_id=session.id,
-            user_id=effective_user_id,
-            assistant_message=msg,
-            assistant_audio_base64=assistant_audio_base64,
-            assistant_audio_content_type=assistant_audio_content_type,
-            expected_field=current_field,
-            completed=False,
-        )
+        return reply(InterviewFlowService.build_unclear_value_reply(current_field))
 
     payload[current_field] = normalized_value
     progress = InterviewFlowService.get_next_field(current_field)
 
     if progress.completed:
+        openai_service = openai_service or OpenAIService()
         interview_payload = InterviewFlowService.build_payload(payload)
         interview_payload.user_id = effective_user_id
-        questions = openai_service.generate_interview_questions(interview_payload)
+        question_bank = QuestionBankRepository(db)
+        questions = question_bank.assemble(interview_payload)
+        generated = questions is None
+        stream = None
+        if generated and settings.question_stream_enabled:
+            # Streaming takes the question-set cache's generation slot for the
+            # setup, so identical concurrent setups share one generation.
+            questions, stream = open_question_stream(openai_service, interview_payload)
+            if stream:
+                # The interview is created as soon as its first question exists;
+                # the stream stores the rest on the row as they arrive.
+                questions = stream.wait_for(1)
+                if not questions:
+                    raise stream.error or ValueError("OpenAI returned invalid question payload.")
+        elif generated:
+            questions = openai_service.generate_interview_questions(interview_payload)
         interview = interview_repo.create(interview_payload, questions, user_id=effective_user_id)
-        interview_cache.set_interview_questions(interview.id, questions)
+        if stream:
+            stream.attach(interview.id, questions)
+        else:
+            if generated:
+                question_bank.add(interview_payload, questions, source_interview_id=interview.id)
+            interview_cache.set_interview_questions(interview.id, questions)
+            schedule_question_audio(interview.id, questions)
 
-        collector_repo.update_payload(
-            session,
-            payload,
-            current_field="amount",
-            status="completed",
-            user_id=effective_user_id,
-        )
+        save("amount", "completed")
 
-        assistant_message = openai_service.build_collector_reply(
-            field_name=current_field,
-            user_response=user_message,
-            next_field_prompt=(
-                f"Perfect. I generated your interview and saved it to your dashboard. "
-                f"You can now start interview #{interview.id}."
-            ),
-        )
-        assistant_audio_base64 = None
-        assistant_audio_content_type = None
-        try:
-            assistant_audio, assistant_audio_content_type = openai_service.synthesize_speech(assistant_message)
-            assistant_audio_base64 = base64.b64encode(assistant_audio).decode("utf-8")
-        except Exception:
-            assistant_audio_base64 = None
-            assistant_audio_content_type = None
-        transcript_repo.add("collector", session.id, "assistant", assistant_message, user_id=effective_user_id)
-
-        return CollectorTurnResponse(
-            collector_session_id=session.id,
+        return CollectorTurnDraft(
+            collector_session_id=state.id,
             user_id=effective_user_id,
-            assistant_message=assistant_message,
-            assistant_audio_base64=assistant_audio_base64,
-            assistant_audio_content_type=assistant_audio_content_type,
+            expected_field=None,
             completed=True,
             interview_id=interview.id,
+            reply_prompt=CollectorReplyPrompt(
+                field_name=current_field,
+                user_response=user_message,
+                next_field_prompt=(
+                    f"Perfect. I generated your interview and saved it to your dashboard. "
+                    f"You can now start interview #{interview.id}."
+                ),
+            ),
         )
 
     next_field = progress.next_field
-    collector_repo.update_payload(
-        session,
-        payload,
-        current_field=next_field,
-        status="collecting",
+    save(next_field, "collecting")
+
+    return CollectorTurnDraft(
+        collector_session_id=state.id,
         user_id=effective_user_id,
+        expected_field=next_field,
+        reply_prompt=CollectorReplyPrompt(
+            field_name=current_field,
+            user_response=user_message,
+            next_field_prompt=FIELD_PROMPTS[next_field],
+        ),
     )
 
-    assistant_message = openai_service.build_collector_reply(
-        field_name=current_field,
-        user_response=user_message,
-        next_field_prompt=FIELD_PROMPTS[next_field],
-    )
-    assistant_audio_base64 = None
-    assistant_audio_content_type = None
-    try:
-        assistant_audio, assistant_audio_content_type = openai_service.synthesize_speech(assistant_message)
-        assistant_audio_base64 = base64.b64encode(assistant_audio).decode("utf-8")
-    except Exception:
-        assistant_audio_base64 = None
-        assistant_audio_content_type = None
-    transcript_repo.add("collector", session.id, "assistant", assistant_message, user_id=effective_user_id)
 
+def finish_collector_turn(
+    draft: CollectorTurnDraft,
+    assistant_message: str,
+    db: Session,
+    assistant_audio_base64: str | None = None,
+    assistant_audio_content_type: str | None = None,
+) -> CollectorTurnResponse:
+    transcript_repo = TranscriptRepository(db)
+    transcript_repo.add(
+        "collector", draft.collector_session_id, "assistant", assistant_message, user_id=draft.user_id, refresh=False
+    )
     return CollectorTurnResponse(
-        collector_session_id=session.id,
-        user_id=effective_user_id,
+        collector_session_id=draft.collector_session_id,
+        user_id=draft.user_id,
         assistant_message=assistant_message,
         assistant_audio_base64=assistant_audio_base64,
         assistant_audio_content_type=assistant_audio_content_type,
-        expected_field=next_field,
-        completed=False,
+        expected_field=draft.expected_field,
+        completed=draft.completed,
+        interview_id=draft.interview_id,
+    )
+
+
+def process_collector_turn(
+    collector_session_id: int,
+    user_message: str,
+    db: Session,
+    user_id: str | None = None,
+    openai_service: OpenAIService | None = None,
+    audio_policy: AudioPolicy = "inline",
+) -> CollectorTurnResponse:
+    openai_service = openai_service or OpenAIService()
+    draft = prepare_collector_turn(
+        collector_session_id=collector_session_id,
+        user_message=user_message,
+        db=db,
+        user_id=user_id,
+        openai_service=openai_service,
+    )
+
+    assistant_message = draft.assistant_message
+    if assistant_message is None:
+        assistant_message = openai_service.build_collector_reply(
+            field_name=draft.reply_prompt.field_name,
+            user_response=draft.reply_prompt.user_response,
+            next_field_prompt=draft.reply_prompt.next_field_prompt,
+        )
+
+    assistant_audio_base64, assistant_audio_content_type = None, None
+    if audio_policy == "inline":
+        assistant_audio_base64, assistant_audio_content_type = _synthesize_inline(openai_service, assistant_message)
+    return finish_collector_turn(
+        draft,
+        assistant_message,
+        db,
+        assistant_audio_base64=assistant_audio_base64,
+        assistant_audio_content_type=assistant_audio_content_type,
     )
 
 
@@ -289,16 +293,15 @@ def start_collector(body: CollectorStartRequest | None = None, db: Session = Dep
         payload["candidate_name"] = body.candidate_name
     collector_repo.update_payload(session, payload, current_field="readiness", status="collecting", user_id=session.user_id)
 
+    audio_format = body.audio_format if body else None
+    if audio_format:
+        interview_cache.set_session_audio_format("collector", session.id, audio_format)
+
     assistant_message = InterviewFlowService.build_opening_prompt(body.candidate_name if body else None)
     assistant_audio_base64 = None
     assistant_audio_content_type = None
-    try:
-        openai_service = OpenAIService()
-        assistant_audio, assistant_audio_content_type = openai_service.synthesize_speech(assistant_message)
-        assistant_audio_base64 = base64.b64encode(assistant_audio).decode("utf-8")
-    except Exception:
-        assistant_audio_base64 = None
-        assistant_audio_content_type = None
+    if not body or body.audio_policy == "inline":
+        assistant_audio_base64, assistant_audio_content_type = _synthesize_inline(None, assistant_message, audio_format)
 
     transcript_repo = TranscriptRepository(db)
     transcript_repo.add("collector", session.id, "assistant", assistant_message, user_id=session.user_id)
@@ -319,10 +322,12 @@ def collector_turn(
     body: CollectorTurnRequest,
     db: Session = Depends(get_db),
 ):
+    audio_format = body.audio_format or interview_cache.get_session_audio_format("collector", collector_session_id)
     return process_collector_turn(
         collector_session_id=collector_session_id,
         user_message=body.user_message,
         user_id=body.user_id,
         db=db,
-        openai_service=OpenAIService(),
+        openai_service=OpenAIService(audio_format=audio_format, user_id=body.user_id),
+        audio_policy=body.audio_policy,
     )
@@ -1,7 +1,10 @@
+import base64
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.core.cache import interview_cache
+from app.core.config import settings
 from app.db.session import get_db
 from app.repositories.interview_repository import InterviewRepository
 from app.repositories.interview_session_repository import InterviewSessionRepository
@@ -14,7 +17,10 @@ from app.schemas.interview import (
     InterviewTurnRequest,
     InterviewTurnResponse,
 )
+from app.services.interview_flow_service import InterviewFlowService
 from app.services.openai_service import OpenAIService
+from app.services.question_audio import load_question_audio, store_question_audio
+from app.services.question_stream import QuestionsUnavailable, ensure_questions
 
 router = APIRouter(prefix="/interviews", tags=["interviews"])
 
@@ -79,13 +85,36 @@ def start_interview(
     effective_user_id = requested_user_id or interview.user_id
     interview_session = session_repo.create(interview_id, user_id=effective_user_id)
     interview_cache.set_session_questions(interview_session.id, questions)
-    assistant_message = f"Great, let’s begin. First question: {questions[0]}"
+    assistant_message = InterviewFlowService.build_question_prompt(questions[0], 0)
     transcript_repo.add("interview", interview_session.id, "assistant", assistant_message, user_id=effective_user_id)
 
+    assistant_audio_base64 = None
+    assistant_audio_content_type = None
+    audio_format = body.audio_format if body else None
+    if audio_format:
+        interview_cache.set_session_audio_format("interview", interview_session.id, audio_format)
+    if not body or body.audio_policy == "inline":
+        assistant_audio = load_question_audio(interview.id, 0, assistant_message, audio_format)
+        if assistant_audio:
+            assistant_audio_content_type = OpenAIService.speech_content_type(audio_format)
+        else:
+            try:
+                assistant_audio, assistant_audio_content_type = OpenAIService(
+                    audio_format=audio_format
+                ).synthesize_speech(assistant_message)
+                store_question_audio(interview.id, 0, assistant_message, assistant_audio, audio_format)
+            except Exception:
+                assistant_audio = None
+                assistant_audio_content_type = None
+        if assistant_audio:
+            assistant_audio_base64 = base64.b64encode(assistant_audio).decode("utf-8")
+
     return InterviewSessionStartResponse(
         interview_session_id=interview_session.id,
         user_id=effective_user_id,
         assistant_message=assistant_message,
+        assistant_audio_base64=assistant_audio_base64,
+        assistant_audio_content_type=assistant_audio_content_type,
         question_index=0,
     )
 
@@ -99,7 +128,7 @@ def interview_turn(
     interview_repo = InterviewRepository(db)
     session_repo = InterviewSessionRepository(db)
     transcript_repo = TranscriptRepository(db)
-    openai_service = OpenAIService()
+    openai_service = OpenAIService(user_id=body.user_id)
 
     interview_session = session_repo.get(interview_session_id, user_id=body.user_id)
     if not interview_session:
@@ -118,9 +147,16 @@ def interview_turn(
     if not questions:
         questions = interview_repo.parse_questions(interview)
         interview_cache.set_interview_questions(interview.id, questions)
-    interview_cache.set_session_questions(interview_session.id, questions)
 
     idx = interview_session.current_index
+    # Blocks only when the candidate is ahead of streamed question generation.
+    try:
+        questions = ensure_questions(
+            interview.id, questions, idx + 2, lambda: interview_repo.load_question_progress(interview.id)
+        )
+    except QuestionsUnavailable as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+    interview_cache.set_session_questions(interview_session.id, questions)
     if idx >= len(questions):
         interview_session.status = "completed"
         session_repo.save(interview_session)
@@ -133,11 +169,20 @@ def interview_turn(
     next_idx = idx + 1
     next_question = questions[next_idx] if next_idx < len(questions) else None
 
-    assistant_message = openai_service.build_interview_turn_reply(
-        user_answer=body.user_message,
-        current_question=current_question,
-        next_question=next_question,
-    )
+    reply_mode = body.reply_mode or settings.interview_reply_mode
+    if reply_mode == "split":
+        acknowledgement = openai_service.build_interview_ack(
+            user_answer=body.user_message,
+            current_question=current_question,
+            is_last=next_question is None,
+        )
+        assistant_message = InterviewFlowService.build_split_reply(acknowledgement, next_question)
+    else:
+        assistant_message = openai_service.build_interview_turn_reply(
+            user_answer=body.user_message,
+            current_question=current_question,
+            next_question=next_question,
+        )
 
     if next_question is None:
         interview_session.current_index = len(questions)
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+from starlette.datastructures import UploadFile
+from starlette.formparsers import MultiPartException
 
 from app.db.session import get_db
 from app.repositories.transcript_repository import TranscriptRepository
 from app.schemas.transcript import TranscriptItem, TranscriptListResponse, VoiceTranscribeResponse
-from app.services.openai_service import OpenAIService
+from app.services.audio_upload import UploadTooLarge, read_audio_form
+from app.services.openai_service import AsyncOpenAIService
+from app.services.provider_scheduler import Priority
+from app.services.segmented_stt import transcribe_recording
 
 router = APIRouter(prefix="/transcripts", tags=["transcripts"])
 
@@ -38,25 +44,82 @@ def get_transcripts(
     )
 
 
-@router.post("/voice/transcribe", response_model=VoiceTranscribeResponse)
-async def transcribe_voice(
-    audio_file: UploadFile = File(...),
-    session_type: str | None = Form(default=None),
-    session_id: int | None = Form(default=None),
-    user_id: str | None = Form(default=None),
-    db: Session = Depends(get_db),
-):
-    content = await audio_file.read()
-    if not content:
-        raise HTTPException(status_code=400, detail="audio_file is empty")
+# The upload is parsed by read_audio_form rather than File/Form parameters
+# (which FastAPI would read in full before the route runs), so the request
+# body is described here for the OpenAPI docs.
+TRANSCRIBE_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["audio_file"],
+                    "properties": {
+                        "audio_file": {"type": "string", "format": "binary"},
+                        "session_type": {"type": "string", "enum": ["collector", "interview"]},
+                        "session_id": {"type": "integer"},
+                        "user_id": {"type": "string"},
+                    },
+                }
+            }
+        },
+    }
+}
 
-    openai_service = OpenAIService()
-    text = openai_service.transcribe_audio(audio_file.filename or "audio.wav", content)
 
-    if session_type and session_id:
-        if session_type not in {"collector", "interview"}:
+def _form_text(form, name: str) -> str | None:
+    """A text field of the upload form; a file sent under its name is a 400, not a 500."""
+    value = form.get(name) or None
+    if value is not None and not isinstance(value, str):
+        raise HTTPException(status_code=400, detail=f"{name} must be a text field")
+    return value
+
+
+@router.post(
+    "/voice/transcribe",
+    response_model=VoiceTranscribeResponse,
+    openapi_extra=TRANSCRIBE_REQUEST_BODY,
+)
+async def transcribe_voice(request: Request, db: Session = Depends(get_db)):
+    try:
+        form = await read_audio_form(request)
+    except UploadTooLarge as exc:
+        raise HTTPException(status_code=413, detail=str(exc))
+    except MultiPartException as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    try:
+        audio_file = form.get("audio_file")
+        if not isinstance(audio_file, UploadFile):
+            raise HTTPException(status_code=400, detail="audio_file is required")
+        if not audio_file.size:
+            raise HTTPException(status_code=400, detail="audio_file is empty")
+
+        session_type = _form_text(form, "session_type")
+        user_id = _form_text(form, "user_id")
+        session_id = _form_text(form, "session_id")
+        if session_id is not None:
+            if not session_id.isdigit():
+                raise HTTPException(status_code=400, detail="session_id must be an integer")
+            session_id = int(session_id)
+        if session_type and session_id and session_type not in {"collector", "interview"}:
             raise HTTPException(status_code=400, detail="session_type must be collector or interview")
+
+        openai_service = AsyncOpenAIService(priority=Priority.INTERACTIVE, user_id=user_id)
+        text = await transcribe_recording(openai_service, audio_file.filename or "audio.wav", audio_file.file)
+    finally:
+        await form.close()
+
+    if session_type and session_id:
         repo = TranscriptRepository(db)
-        repo.add(session_type=session_type, session_id=session_id, speaker="user", message=text, user_id=user_id)
+        await run_in_threadpool(
+            repo.add,
+            session_type=session_type,
+            session_id=session_id,
+            speaker="user",
+            message=text,
+            user_id=user_id,
+        )
 
     return VoiceTranscribeResponse(text=text, user_id=user_id)
@@ -1,354 +1,1528 @@
+import asyncio
 import base64
 import json
+from dataclasses import dataclass, field
+from io import BytesIO
+from threading import Lock
+from typing import AsyncIterator, Awaitable, BinaryIO, Callable
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
 
 from app.core.cache import interview_cache
-from app.api.routes.collector import process_collector_turn
+from app.core.config import settings
+from app.core.last_reply_cache import LastReply, last_reply_cache
+from app.api.routes.collector import CollectorTurnDraft, prepare_collector_turn
 from app.db.session import SessionLocal
 from app.repositories.collector_repository import CollectorRepository
 from app.repositories.interview_repository import InterviewRepository
 from app.repositories.interview_session_repository import InterviewSessionRepository
 from app.repositories.transcript_repository import TranscriptRepository
+from app.services.audio_upload import AudioUploadBuffer
 from app.services.interview_flow_service import FIELD_PROMPTS, InterviewFlowService
-from app.services.openai_service import OpenAIService
+from app.services.openai_service import SPEECH_FORMATS, AsyncOpenAIService, OpenAIService
+from app.services.provider_guard import SPEECH, provider_guard
+from app.services.provider_scheduler import Priority
+from app.services.question_audio import load_question_audio, pending_question_audio, store_question_audio
+from app.services.question_stream import QuestionsUnavailable, ensure_questions, ensure_questions_async
+from app.services.segmented_stt import transcribe_recording
+from app.services.session_actor import (
+    CollectorSessionState,
+    InterviewSessionState,
+    SessionActor,
+    session_actors,
+)
+from app.services.speech_pipeline import iter_sentences, synthesize_in_order
+from app.services.streaming_stt import StreamingTranscriber
 
 router = APIRouter(tags=["voice"])
 
+AUDIO_MODES = {"base64", "binary"}
+REPLY_MODES = {"combined", "split"}
+STT_MODES = {"batch", "streaming"}
+HANDOFF_MODES = {"none", "interview"}
+# Client events that start a turn; any of them supersedes a turn still running.
+TURN_EVENTS = {"user_audio", "audio_end", "user_text"}
+# Client events that mean the candidate is speaking over the assistant.
+BARGE_IN_EVENTS = {"user_audio", "audio_chunk", "interrupt"}
+INTERRUPTED_SUFFIX = " [interrupted]"
+# Text and audio of every speech segment sent for one assistant message.
+SpokenSegments = list[tuple[str, bytes | bytearray]]
+HANDOFF_PROMPT = (
+    "Perfect. I generated your interview and saved it to your dashboard. "
+    "Let's begin with the first question right away."
+)
 
-@router.websocket("/collector/sessions/{collector_session_id}/voice")
-async def collector_voice_socket(websocket: WebSocket, collector_session_id: int):
-    await websocket.accept()
-    user_id = websocket.query_params.get("user_id")
 
-    db = SessionLocal()
-    openai_service = OpenAIService()
+@dataclass
+class _InterviewReply:
+    assistant_text: str
+    audio_sent: bool = False
+    audio_bytes: bytes | None = None
+    # False once TTS has failed for this reply; it is then sent text-only.
+    speech: bool = True
+    extra: dict = field(default_factory=dict)
 
-    try:
-        collector_repo = CollectorRepository(db)
-        transcript_repo = TranscriptRepository(db)
 
-        collector_session = collector_repo.get(collector_session_id)
-        if not collector_session:
-            await websocket.send_json({"type": "error", "message": "Collector session not found"})
-            await websocket.close(code=1008)
+class _ReplyFailed(Exception):
+    """The reply's text stream failed after its audio had started; audio_end was sent."""
+
+
+class _SocketSession:
+    """The socket's SQLAlchemy session, used by one threadpool call at a time.
+
+    Cancelling a turn cannot stop the threadpool call it was awaiting, so the
+    next call waits for that one to release the session instead of sharing it.
+    """
+
+    def __init__(self):
+        self.session = SessionLocal()
+        self._lock = Lock()
+
+    def _call(self, fn, *args, **kwargs):
+        with self._lock:
+            return fn(self.session, *args, **kwargs)
+
+    async def run(self, fn, *args, **kwargs):
+        return await run_in_threadpool(self._call, fn, *args, **kwargs)
+
+    async def close(self):
+        await self.run(lambda session: session.close())
+
+
+class _SerializedWebSocket:
+    """Serializes sends so the turn task and the receive loop can share a socket."""
+
+    def __init__(self, websocket: WebSocket):
+        self.websocket = websocket
+        self._send_lock = asyncio.Lock()
+
+    async def send_json(self, data: dict):
+        async with self._send_lock:
+            await self.websocket.send_json(data)
+
+    async def send_bytes(self, data: bytes):
+        async with self._send_lock:
+            await self.websocket.send_bytes(data)
+
+    def __getattr__(self, name):
+        return getattr(self.websocket, name)
+
+
+class _TurnRunner:
+    """Runs a socket's turns one at a time as cancellable tasks (barge-in).
+
+    The running turn appends the text of every audio segment it starts sending
+    to ``spoken`` and calls ``store_input`` once its user message is
+    transcribed and stored. An interrupt before that waits for it, so the
+    candidate's answer is never lost; after it, the interrupt cancels all
+    pending LLM/TTS work and records only what the candidate actually heard.
+    Once the reply's audio is complete the turn calls ``commit``; from then on
+    it only persists and sends its final message, so an interrupt lets it
+    finish instead.
+    """
+
+    def __init__(self, websocket: _SerializedWebSocket):
+        self.websocket = websocket
+        self.task: asyncio.Task | None = None
+        self.spoken: SpokenSegments = []
+        self.persisted = False
+        self.record_truncated: Callable[[str], Awaitable[None]] | None = None
+        self._input_stored = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def start(self, turn: Callable[..., Awaitable[None]], *args):
+        self.spoken = []
+        self.persisted = False
+        self.record_truncated = None
+        self._input_stored = asyncio.Event()
+        self.task = asyncio.create_task(self._run(turn, *args))
+
+    async def _run(self, turn: Callable[..., Awaitable[None]], *args):
+        try:
+            await turn(self, *args)
+        except WebSocketDisconnect:
             return
+        except Exception as exc:
+            try:
+                await self.websocket.send_json({"type": "error", "message": str(exc)})
+                await self.websocket.close(code=1011)
+            except Exception:
+                pass
 
-        if collector_session.status == "completed":
-            await websocket.send_json({"type": "completed", "message": "Collector session already completed"})
-            await websocket.close(code=1000)
+    def store_input(self, record_truncated: Callable[[str], Awaitable[None]]):
+        """Mark the user's message as stored; ``record_truncated`` saves a reply cut off by barge-in."""
+        self.record_truncated = record_truncated
+        self._input_stored.set()
+
+    def hold(self):
+        """Let an interrupt wait for the running turn instead of cancelling it."""
+        self.persisted = True
+
+    async def commit(self, persist: Awaitable):
+        self.hold()
+        return await persist
+
+    async def _cancel(self):
+        self.task.cancel()
+        await asyncio.gather(self.task, return_exceptions=True)
+
+    async def interrupt(self):
+        """Abort the running turn's LLM/TTS work and unsent audio."""
+        if not self.running:
+            return
+        if not self._input_stored.is_set():
+            stored = asyncio.create_task(self._input_stored.wait())
+            await asyncio.wait({self.task, stored}, return_when=asyncio.FIRST_COMPLETED)
+            stored.cancel()
+            if not self.running:
+                return
+        if self.persisted:
+            await asyncio.gather(self.task, return_exceptions=True)
             return
+        await self._cancel()
+        spoken = " ".join(text for text, _ in self.spoken)
+        if spoken and self.record_truncated:
+            await self.record_truncated(spoken + INTERRUPTED_SUFFIX)
+        await self.websocket.send_json({"type": "interrupted", "assistant_text": spoken or None})
+
+    async def close(self):
+        if self.running:
+            await self._cancel()
+
+
+# The socket handlers below run on the event loop. Everything that blocks
+# (SQLAlchemy, the sync OpenAI client, base64 of whole clips) goes through
+# these helpers via run_in_threadpool so one slow turn never stalls the other
+# sockets and HTTP requests served by the same worker.
+
+
+def _encode_audio(audio_bytes: bytes) -> str:
+    return base64.b64encode(audio_bytes).decode("utf-8")
+
+
+def _load_collector_opening(db: Session, collector_session_id: int, user_id: str | None) -> dict | None:
+    collector_repo = CollectorRepository(db)
+    transcript_repo = TranscriptRepository(db)
+
+    collector_session = collector_repo.get(collector_session_id)
+    if not collector_session:
+        return None
+
+    effective_user_id = user_id or collector_session.user_id
+    state = CollectorSessionState.from_model(collector_session)
+    opening = {
+        "id": collector_session.id,
+        "user_id": effective_user_id,
+        "status": collector_session.status,
+        "expected_field": collector_session.current_field,
+        "assistant_text": None,
+        "entry_id": None,
+        "state": state,
+    }
+    if collector_session.status == "completed":
+        return opening
+
+    last_entry = transcript_repo.last("collector", collector_session.id, user_id=effective_user_id)
+    if last_entry:
+        opening["assistant_text"] = last_entry.message
+        opening["entry_id"] = last_entry.id
+        return opening
+
+    candidate_name = state.payload.get("candidate_name")
+    if state.current_field == "readiness":
+        opening_text = InterviewFlowService.build_opening_prompt(candidate_name)
+    else:
+        opening_text = FIELD_PROMPTS.get(state.current_field, "Let's continue.")
+
+    entry = transcript_repo.add(
+        session_type="collector",
+        session_id=collector_session.id,
+        speaker="assistant",
+        message=opening_text,
+        user_id=effective_user_id,
+        refresh=False,
+    )
+    opening["assistant_text"] = opening_text
+    opening["entry_id"] = entry.id
+    return opening
+
+
+def _load_interview_opening(db: Session, interview_session_id: int, user_id: str | None) -> dict:
+    interview_repo = InterviewRepository(db)
+    session_repo = InterviewSessionRepository(db)
+    transcript_repo = TranscriptRepository(db)
+
+    interview_session = session_repo.get(interview_session_id, user_id=user_id)
+    if not interview_session:
+        return {"error": "Interview session not found"}
+
+    interview = interview_repo.get_by_id(interview_session.interview_id, user_id=user_id)
+    if not interview:
+        return {"error": "Interview not found"}
+
+    questions = interview_cache.get_session_questions(interview_session.id)
+    if not questions:
+        questions = interview_cache.get_interview_questions(interview.id)
+    if not questions:
+        questions = interview_repo.parse_questions(interview)
+        interview_cache.set_interview_questions(interview.id, questions)
+    try:
+        questions = ensure_questions(
+            interview.id,
+            questions,
+            interview_session.current_index + 1,
+            lambda: interview_repo.load_question_progress(interview.id),
+        )
+    except QuestionsUnavailable as exc:
+        return {"error": str(exc)}
+    interview_cache.set_session_questions(interview_session.id, questions)
+
+    if not questions:
+        return {"error": "Interview has no questions"}
+
+    opening = {
+        "id": interview_session.id,
+        "interview_id": interview.id,
+        "status": interview_session.status,
+        "question_index": interview_session.current_index,
+        "assistant_text": None,
+        "entry_id": None,
+        "state": InterviewSessionState(
+            id=interview_session.id,
+            interview_id=interview.id,
+            user_id=user_id,
+            status=interview_session.status,
+            current_index=interview_session.current_index,
+            questions=questions,
+        ),
+    }
+    if interview_session.status == "completed" or interview_session.current_index >= len(questions):
+        opening["status"] = "completed"
+        return opening
+
+    current_index = interview_session.current_index
+    prompt_text = InterviewFlowService.build_question_prompt(questions[current_index], current_index)
+
+    last_entry = transcript_repo.last("interview", interview_session.id, user_id=user_id)
+    if last_entry is None:
+        last_entry = transcript_repo.add(
+            session_type="interview",
+            session_id=interview_session.id,
+            speaker="assistant",
+            message=prompt_text,
+            user_id=user_id,
+            refresh=False,
+        )
+    opening["assistant_text"] = prompt_text
+    opening["entry_id"] = last_entry.id
+    return opening
+
+
+def _write_interview_progress(db: Session, state: InterviewSessionState, current_index: int, status: str):
+    InterviewSessionRepository(db).write_progress(state.id, current_index, status)
+    state.current_index = current_index
+    state.status = status
+    if status == "completed":
+        interview_cache.clear_session(state.id)
+
+
+def _record_interview_answer(db: Session, state: InterviewSessionState, user_text: str):
+    TranscriptRepository(db).add(
+        session_type="interview",
+        session_id=state.id,
+        speaker="user",
+        message=user_text,
+        user_id=state.user_id,
+        refresh=False,
+    )
+
+
+def _record_assistant_message(
+    db: Session, session_type: str, session_id: int, user_id: str | None, text: str
+) -> int:
+    return TranscriptRepository(db).add(
+        session_type=session_type,
+        session_id=session_id,
+        speaker="assistant",
+        message=text,
+        user_id=user_id,
+        refresh=False,
+    ).id
+
+
+def _complete_interview_turn(
+    db: Session,
+    state: InterviewSessionState,
+    next_index: int | None,
+    assistant_text: str,
+) -> int:
+    if next_index is None:
+        _write_interview_progress(db, state, len(state.questions), "completed")
+    else:
+        _write_interview_progress(db, state, next_index, state.status)
+    return _record_assistant_message(db, "interview", state.id, state.user_id, assistant_text)
+
+
+def _issue_resume_token(session_type: str, session_id: int, entry_id: int | None) -> str | None:
+    """Opaque token naming the last transcript entry the client has been sent.
+
+    It carries no authority (the session id in the URL already grants
+    access); it only lets a reconnecting client say what it already has.
+    """
+    if entry_id is None:
+        return None
+    raw = f"{session_type}:{session_id}:{entry_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _read_resume_token(websocket: WebSocket, session_type: str, session_id: int) -> int | None:
+    """Transcript entry id from the ``resume_token`` query parameter, if it belongs to this session."""
+    token = websocket.query_params.get("resume_token")
+    if not token:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode("utf-8")
+        token_type, token_session_id, entry_id = raw.split(":")
+        if token_type != session_type or int(token_session_id) != session_id:
+            return None
+        return int(entry_id)
+    except ValueError:
+        return None
+
+
+def _remember_reply(
+    session_type: str, session_id: int, entry_id: int, audio_format: str, text: str, spoken: SpokenSegments
+):
+    clips = [(segment_text, bytes(audio)) for segment_text, audio in spoken]
+    last_reply_cache.put(session_type, session_id, LastReply(entry_id, text, audio_format, clips))
+
+
+async def _speech_or_none(openai_service: AsyncOpenAIService, text: str) -> bytes | None:
+    """Whole-clip TTS, or None when it fails so the reply can go out text-only.
+
+    While the speech breaker is open this returns cached audio or fails fast.
+    """
+    try:
+        audio_bytes, _ = await openai_service.synthesize_speech(text)
+    except Exception as exc:
+        print(f"[voice] Speech unavailable, replying with text only: {exc}")
+        return None
+    return audio_bytes
+
 
-        effective_user_id = user_id or collector_session.user_id
-        entries = transcript_repo.list("collector", collector_session.id, user_id=effective_user_id)
+async def _single_segment(openai_service: AsyncOpenAIService, text: str) -> AsyncIterator[tuple[str, AsyncIterator[bytes]]]:
+    yield text, openai_service.stream_speech(text)
 
-        if entries:
-            opening_text = entries[-1].message
+
+async def _prerendered_segment(text: str, audio_bytes: bytes) -> AsyncIterator[tuple[str, AsyncIterator[bytes]]]:
+    async def chunks() -> AsyncIterator[bytes]:
+        for offset in range(0, len(audio_bytes), settings.voice_audio_chunk_bytes):
+            yield audio_bytes[offset:offset + settings.voice_audio_chunk_bytes]
+
+    yield text, chunks()
+
+
+async def _sentence_segments(
+    openai_service: AsyncOpenAIService,
+    deltas: AsyncIterator[str],
+) -> AsyncIterator[tuple[str, AsyncIterator[bytes]]]:
+    failure: Exception | None = None
+
+    async def synthesize(sentence: str) -> bytes | Exception:
+        # After the first TTS failure the remaining sentences are passed on
+        # without calling TTS again; the reply still completes as text.
+        nonlocal failure
+        if failure is None:
+            try:
+                audio_bytes, _ = await openai_service.synthesize_speech(sentence)
+                return audio_bytes
+            except Exception as exc:
+                failure = exc
+        return failure
+
+    async def once(audio: bytes | Exception) -> AsyncIterator[bytes]:
+        if isinstance(audio, Exception):
+            raise audio
+        yield audio
+
+    sentences = iter_sentences(deltas)
+    async for sentence, audio in synthesize_in_order(sentences, synthesize):
+        yield sentence, once(audio)
+
+
+async def _reply_segments(
+    segments: AsyncIterator[tuple[str, AsyncIterator[bytes]]],
+) -> AsyncIterator[tuple[str, AsyncIterator[bytes]]]:
+    # Tells errors of the reply text (e.g. the LLM stream breaking off) apart
+    # from errors of a segment's audio and of the socket.
+    try:
+        async for segment in segments:
+            yield segment
+    except Exception as exc:
+        raise _ReplyFailed(str(exc)) from exc
+
+
+async def _send_audio_segments(
+    websocket: WebSocket,
+    openai_service: AsyncOpenAIService,
+    for_type: str,
+    segments: AsyncIterator[tuple[str, AsyncIterator[bytes]]],
+    spoken: SpokenSegments | None = None,
+) -> tuple[str, bool]:
+    """Stream speech segments as binary frames; returns the text and whether all audio was sent.
+
+    Each segment is announced by an audio_segment message carrying its text,
+    followed by its audio as one or more binary frames; every segment is an
+    independently playable clip. Segments are appended to ``spoken`` as their
+    audio starts (and filled as it is sent), so an interrupted turn knows what
+    was heard and a finished message can be replayed on reconnect. When a
+    segment's audio fails, audio_end closes what was streamed; the remaining
+    segments only contribute their text. When the text itself fails, audio_end
+    still closes the stream and _ReplyFailed is raised so the caller can fall
+    back to a fixed reply.
+    """
+    content_type = openai_service.speech_content_type(openai_service.audio_format)
+    await websocket.send_json({"type": "audio_start", "for": for_type, "content_type": content_type})
+    texts = []
+    announced = 0
+    total_bytes = 0
+    complete = True
+    try:
+        async for text, chunks in _reply_segments(segments):
+            texts.append(text)
+            if not complete:
+                continue
+            await websocket.send_json({"type": "audio_segment", "for": for_type, "index": announced, "text": text})
+            announced += 1
+            clip = bytearray()
+            if spoken is not None:
+                spoken.append((text, clip))
+            try:
+                async for chunk in chunks:
+                    total_bytes += len(chunk)
+                    if spoken is not None:
+                        clip += chunk
+                    await websocket.send_bytes(chunk)
+            except Exception as exc:
+                print(f"[voice] Speech failed mid-reply, finishing it as text only: {exc}")
+                complete = False
+    except _ReplyFailed as exc:
+        print(f"[voice] Reply failed mid-stream, falling back to a fixed reply: {exc}")
+        await websocket.send_json(
+            {"type": "audio_end", "for": for_type, "bytes": total_bytes, "segments": announced}
+        )
+        raise
+    await websocket.send_json(
+        {"type": "audio_end", "for": for_type, "bytes": total_bytes, "segments": announced}
+    )
+    return " ".join(texts), complete
+
+
+async def _stream_reply(
+    websocket: WebSocket,
+    openai_service: AsyncOpenAIService,
+    for_type: str,
+    deltas: AsyncIterator[str],
+    spoken: SpokenSegments | None = None,
+) -> tuple[str, bool]:
+    """Speak an LLM reply sentence by sentence while it is still being generated."""
+    return await _send_audio_segments(
+        websocket, openai_service, for_type, _sentence_segments(openai_service, deltas), spoken
+    )
+
+
+async def _send_assistant_message(
+    websocket: WebSocket,
+    openai_service: AsyncOpenAIService,
+    message: dict,
+    audio_mode: str,
+    audio_sent: bool = False,
+    audio_bytes: bytes | None = None,
+    spoken: SpokenSegments | None = None,
+    speech: bool = True,
+) -> bool:
+    """Send an assistant_prompt/assistant_turn message together with its speech.
+
+    In "base64" mode the whole clip is synthesized and embedded in the JSON
+    message. In "binary" mode the speech is streamed first (see
+    _send_audio_segments) unless ``audio_sent`` says a pipelined reply already
+    streamed it, and the JSON message follows without audio. Pre-rendered
+    ``audio_bytes`` are sent as-is instead of calling TTS. When TTS fails
+    (also midway through a stream), its breaker is open, or ``speech`` is
+    False, the message is sent text-only with ``audio_unavailable`` set.
+    Returns whether the speech was delivered in full.
+    """
+    text = message["assistant_text"]
+    if speech and not (audio_sent or audio_bytes):
+        if audio_mode != "binary" or not provider_guard.available(SPEECH):
+            audio_bytes = await _speech_or_none(openai_service, text)
+            speech = audio_bytes is not None
+    if speech and audio_mode == "binary" and not audio_sent:
+        if audio_bytes:
+            segments = _prerendered_segment(text, audio_bytes)
         else:
-            payload = collector_repo.parse_payload(collector_session)
-            candidate_name = payload.get("candidate_name")
-            if collector_session.current_field == "readiness":
-                opening_text = InterviewFlowService.build_opening_prompt(candidate_name)
-            else:
-                opening_text = FIELD_PROMPTS.get(collector_session.current_field, "Let's continue.")
-
-            transcript_repo.add(
-                session_type="collector",
-                session_id=collector_session.id,
-                speaker="assistant",
-                message=opening_text,
-                user_id=effective_user_id,
-            )
+            segments = _single_segment(openai_service, text)
+        _, speech = await _send_audio_segments(websocket, openai_service, message["type"], segments, spoken)
+    if not speech:
+        text_only = {
+            **message,
+            "assistant_audio_base64": None,
+            "assistant_audio_content_type": None,
+            "audio_unavailable": True,
+        }
+        if audio_mode == "binary":
+            text_only["audio_streamed"] = False
+        await websocket.send_json(text_only)
+        return False
 
-        opening_audio, opening_content_type = openai_service.synthesize_speech(opening_text)
+    if audio_mode == "binary":
         await websocket.send_json(
             {
-                "type": "assistant_prompt",
-                "user_id": effective_user_id,
-                "collector_session_id": collector_session.id,
-                "status": collector_session.status,
-                "expected_field": collector_session.current_field,
-                "assistant_text": opening_text,
-                "assistant_audio_base64": base64.b64encode(opening_audio).decode("utf-8"),
-                "assistant_audio_content_type": opening_content_type,
+                **message,
+                "assistant_audio_base64": None,
+                "assistant_audio_content_type": openai_service.speech_content_type(openai_service.audio_format),
+                "audio_streamed": True,
             }
         )
+        return True
 
-        while True:
-            incoming = await websocket.receive_text()
-            try:
-                payload = json.loads(incoming)
-            except json.JSONDecodeError:
-                await websocket.send_json({"type": "error", "message": "Invalid JSON payload"})
-                continue
+    await websocket.send_json(
+        {
+            **message,
+            "assistant_audio_base64": await run_in_threadpool(_encode_audio, audio_bytes),
+            "assistant_audio_content_type": openai_service.speech_content_type(openai_service.audio_format),
+        }
+    )
+    if spoken is not None:
+        spoken.append((text, audio_bytes))
+    return True
 
-            event_type = payload.get("type")
-            if event_type == "ping":
-                await websocket.send_json({"type": "pong"})
-                continue
 
-            collector_session = collector_repo.get(collector_session_id)
-            if not collector_session:
-                await websocket.send_json({"type": "error", "message": "Collector session not found"})
-                await websocket.close(code=1008)
-                return
+async def _replayed_segments(clips: list[tuple[str, bytes]]) -> AsyncIterator[tuple[str, AsyncIterator[bytes]]]:
+    for text, audio_bytes in clips:
+        async for segment in _prerendered_segment(text, audio_bytes):
+            yield segment
 
-            if collector_session.status == "completed":
-                await websocket.send_json({"type": "completed", "message": "Collector session already completed"})
-                continue
 
-            if event_type == "user_audio":
-                audio_base64 = payload.get("audio_base64")
-                if not audio_base64:
-                    await websocket.send_json({"type": "error", "message": "audio_base64 is required"})
-                    continue
+async def _send_collector_opening(
+    websocket: WebSocket,
+    openai_service: AsyncOpenAIService,
+    audio_mode: str,
+    opening: dict,
+    resume_entry_id: int | None = None,
+):
+    """Speak the collector's last message on connect.
 
-                try:
-                    audio_bytes = base64.b64decode(audio_base64)
-                except Exception:
-                    await websocket.send_json({"type": "error", "message": "Invalid base64 audio"})
-                    continue
-
-                filename = payload.get("filename") or "collector_input.webm"
-                user_text = openai_service.transcribe_audio(filename=filename, file_bytes=audio_bytes)
-            elif event_type == "user_text":
-                user_text = str(payload.get("text") or "").strip()
-                if not user_text:
-                    await websocket.send_json({"type": "error", "message": "text is required for user_text"})
-                    continue
-            else:
-                await websocket.send_json(
-                    {"type": "error", "message": "Unsupported type. Use user_audio, user_text, or ping"}
-                )
-                continue
+    A client whose resume token already covers that message only gets a
+    ``resumed`` confirmation. Otherwise the message is replayed from the
+    last-reply cache when its audio is there, and synthesized (then cached)
+    when it is not.
+    """
+    session_id, entry_id = opening["id"], opening["entry_id"]
+    text = opening["assistant_text"]
+    message = {
+        "type": "assistant_prompt",
+        "user_id": opening["user_id"],
+        "collector_session_id": session_id,
+        "status": opening["status"],
+        "expected_field": opening["expected_field"],
+        "assistant_text": text,
+        "resume_token": _issue_resume_token("collector", session_id, entry_id),
+    }
+    if resume_entry_id is not None and resume_entry_id == entry_id:
+        await websocket.send_json({**message, "type": "resumed"})
+        return
+
+    if await _replay_last_reply(websocket, openai_service, audio_mode, "collector", session_id, entry_id, message):
+        return
+
+    spoken: SpokenSegments = []
+    if await _send_assistant_message(websocket, openai_service, message, audio_mode, spoken=spoken):
+        _remember_reply("collector", session_id, entry_id, openai_service.audio_format, text, spoken)
+
+
+async def _replay_last_reply(
+    websocket: WebSocket,
+    openai_service: AsyncOpenAIService,
+    audio_mode: str,
+    session_type: str,
+    session_id: int,
+    entry_id: int,
+    message: dict,
+) -> bool:
+    """Resend the session's last reply from the last-reply cache; returns False on a miss."""
+    cached = last_reply_cache.get(session_type, session_id, entry_id, openai_service.audio_format)
+    if not cached:
+        return False
+    message = {**message, "assistant_text": cached.text}
+    if audio_mode == "binary":
+        await _send_audio_segments(websocket, openai_service, message["type"], _replayed_segments(cached.clips))
+        await _send_assistant_message(websocket, openai_service, message, audio_mode, audio_sent=True)
+        return True
+    if len(cached.clips) == 1:
+        await _send_assistant_message(websocket, openai_service, message, audio_mode, audio_bytes=cached.clips[0][1])
+        return True
+    return False
+
+
+async def _question_audio(
+    openai_service: AsyncOpenAIService,
+    interview_id: int,
+    question_index: int,
+    text: str,
+) -> bytes | None:
+    audio_format = openai_service.audio_format
+    if audio_format == settings.openai_tts_format:
+        pending = pending_question_audio(interview_id, question_index, text)
+        if pending:
+            # Shared with every reader of the pre-render: cancelling this turn must not cancel it.
+            await asyncio.shield(asyncio.wrap_future(pending))
+    audio_bytes = await run_in_threadpool(load_question_audio, interview_id, question_index, text, audio_format)
+    if audio_bytes is None:
+        audio_bytes = await _speech_or_none(openai_service, text)
+        if audio_bytes is not None:
+            await run_in_threadpool(store_question_audio, interview_id, question_index, text, audio_bytes, audio_format)
+    return audio_bytes
+
+
+async def _chain_segments(*sources: AsyncIterator[tuple[str, AsyncIterator[bytes]]]):
+    for source in sources:
+        async for segment in source:
+            yield segment
 
-            turn = process_collector_turn(
-                collector_session_id=collector_session_id,
-                user_message=user_text,
-                user_id=effective_user_id,
-                db=db,
-                openai_service=openai_service,
+
+async def _awaited_segment(text: str, audio: asyncio.Task) -> AsyncIterator[tuple[str, AsyncIterator[bytes]]]:
+    # Without audio the segment still carries the question text, so the
+    # candidate can read the question even though it is not spoken.
+    audio_bytes = await audio
+    async for segment in _prerendered_segment(text, audio_bytes or b""):
+        yield segment
+
+
+async def _render_split_interview_reply(
+    websocket: WebSocket,
+    openai_service: AsyncOpenAIService,
+    audio_mode: str,
+    interview_id: int,
+    user_text: str,
+    current_question: str,
+    next_index: int,
+    next_question: str | None,
+    spoken: SpokenSegments | None = None,
+) -> _InterviewReply:
+    """Live one-sentence acknowledgement followed by the pre-rendered next question.
+
+    The next question's audio is fetched (or synthesized as a fallback)
+    concurrently with the acknowledgement, so it is ready the moment the
+    acknowledgement has been spoken.
+    """
+    is_last = next_question is None
+    question_text = None if is_last else InterviewFlowService.build_next_question_prompt(next_question)
+    question_audio = None
+    if question_text:
+        question_audio = asyncio.create_task(_question_audio(openai_service, interview_id, next_index, question_text))
+
+    try:
+        # With the speech breaker open the reply is built whole and sent text-only.
+        if audio_mode == "binary" and provider_guard.available(SPEECH):
+            segments = _sentence_segments(
+                openai_service,
+                openai_service.stream_interview_ack(user_text, current_question, is_last),
+            )
+            if question_audio:
+                segments = _chain_segments(segments, _awaited_segment(question_text, question_audio))
+            assistant_text, complete = await _send_audio_segments(
+                websocket, openai_service, "assistant_turn", segments, spoken
             )
+            return _InterviewReply(assistant_text=assistant_text, audio_sent=True, speech=complete)
 
-            assistant_audio, assistant_content_type = openai_service.synthesize_speech(turn.assistant_message)
-            await websocket.send_json(
-                {
-                    "type": "assistant_turn",
-                    "user_id": turn.user_id,
-                    "collector_session_id": turn.collector_session_id,
-                    "status": "completed" if turn.completed else "collecting",
-                    "expected_field": turn.expected_field,
-                    "completed": turn.completed,
-                    "interview_id": turn.interview_id,
-                    "user_text": user_text,
-                    "assistant_text": turn.assistant_message,
-                    "assistant_audio_base64": base64.b64encode(assistant_audio).decode("utf-8"),
-                    "assistant_audio_content_type": assistant_content_type,
-                }
+        acknowledgement = await openai_service.build_interview_ack(user_text, current_question, is_last)
+        acknowledgement_audio = await _speech_or_none(openai_service, acknowledgement)
+        extra = {"acknowledgement_text": acknowledgement}
+        if question_audio:
+            extra["question_text"] = question_text
+            question_audio_bytes = await question_audio
+            extra["question_audio_base64"] = (
+                await run_in_threadpool(_encode_audio, question_audio_bytes) if question_audio_bytes else None
             )
+        return _InterviewReply(
+            assistant_text=InterviewFlowService.build_split_reply(acknowledgement, next_question),
+            audio_bytes=acknowledgement_audio,
+            speech=acknowledgement_audio is not None,
+            extra=extra,
+        )
+    finally:
+        if question_audio and not question_audio.done():
+            question_audio.cancel()
 
-            if turn.completed:
-                await websocket.send_json(
-                    {
-                        "type": "completed",
-                        "collector_session_id": turn.collector_session_id,
-                        "interview_id": turn.interview_id,
-                        "message": "Collector completed",
-                    }
-                )
 
-    except WebSocketDisconnect:
-        return
-    except Exception as exc:
-        await websocket.send_json({"type": "error", "message": str(exc)})
-        await websocket.close(code=1011)
-    finally:
-        db.close()
+async def _read_query_choice(websocket: WebSocket, name: str, choices: set[str], default: str) -> str | None:
+    value = websocket.query_params.get(name) or default
+    if value not in choices:
+        await websocket.send_json(
+            {"type": "error", "message": f"Unsupported {name}. Use one of: {', '.join(sorted(choices))}"}
+        )
+        await websocket.close(code=1008)
+        return None
+    return value
 
 
-@router.websocket("/interviews/sessions/{interview_session_id}/voice")
-async def interview_voice_socket(websocket: WebSocket, interview_session_id: int):
-    await websocket.accept()
-    user_id = websocket.query_params.get("user_id")
+async def _read_audio_format(websocket: WebSocket, session_type: str, session_id: int) -> str | None:
+    """Speech format for this socket: the query string, else what the start request negotiated."""
+    default = interview_cache.get_session_audio_format(session_type, session_id) or settings.openai_tts_format
+    return await _read_query_choice(websocket, "audio_format", set(SPEECH_FORMATS), default)
 
-    db = SessionLocal()
-    openai_service = OpenAIService()
+
+async def _read_stt_mode(
+    websocket: WebSocket,
+    openai_service: AsyncOpenAIService,
+) -> tuple[str, StreamingTranscriber | None] | None:
+    stt_mode = await _read_query_choice(websocket, "stt_mode", STT_MODES, "batch")
+    if not stt_mode:
+        return None
+    if stt_mode == "batch":
+        return stt_mode, None
 
     try:
-        interview_repo = InterviewRepository(db)
-        session_repo = InterviewSessionRepository(db)
-        transcript_repo = TranscriptRepository(db)
+        sample_rate = int(websocket.query_params.get("sample_rate") or settings.stt_sample_rate)
+        if sample_rate <= 0:
+            raise ValueError
+    except ValueError:
+        await websocket.send_json({"type": "error", "message": "sample_rate must be a positive integer"})
+        await websocket.close(code=1008)
+        return None
+    return stt_mode, StreamingTranscriber(openai_service.transcribe_audio, sample_rate=sample_rate)
 
-        interview_session = session_repo.get(interview_session_id, user_id=user_id)
-        if not interview_session:
-            await websocket.send_json({"type": "error", "message": "Interview session not found"})
-            await websocket.close(code=1008)
-            return
 
-        interview = interview_repo.get_by_id(interview_session.interview_id, user_id=user_id)
-        if not interview:
-            await websocket.send_json({"type": "error", "message": "Interview not found"})
-            await websocket.close(code=1008)
-            return
+async def _receive_event(
+    websocket: WebSocket,
+    upload: AudioUploadBuffer,
+    stt: StreamingTranscriber | None = None,
+) -> dict | None:
+    """Receive the next client message.
 
-        questions = interview_cache.get_session_questions(interview_session.id)
-        if not questions:
-            questions = interview_cache.get_interview_questions(interview.id)
-        if not questions:
-            questions = interview_repo.parse_questions(interview)
-            interview_cache.set_interview_questions(interview.id, questions)
-        interview_cache.set_session_questions(interview_session.id, questions)
+    Binary frames are audio_chunk data for the current utterance and are
+    appended to the upload buffer without any JSON or base64 work; only text
+    frames are parsed into events. They are reported as an audio_chunk event
+    so a turn still running can be interrupted.
 
-        if not questions:
-            await websocket.send_json({"type": "error", "message": "Interview has no questions"})
-            await websocket.close(code=1008)
-            return
+    With streaming STT the frames are raw PCM fed to the transcriber instead:
+    new partial transcripts are pushed to the client as they complete, chunks
+    count as audio_chunk only once the VAD has heard speech (so playback
+    picked up by the microphone does not barge in), and when the server
+    detects the end of the utterance an audio_end event is returned as if the
+    client had sent it.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
 
-        if interview_session.status == "completed" or interview_session.current_index >= len(questions):
-            await websocket.send_json({"type": "completed", "message": "Interview already completed"})
-            await websocket.close(code=1000)
-            return
+    if message.get("bytes") is not None and stt is not None:
+        endpointed = stt.feed(message["bytes"])
+        partial = stt.take_partial()
+        if partial is not None:
+            await websocket.send_json({"type": "transcript_partial", "text": partial})
+        if endpointed:
+            return {"type": "audio_end", "endpointed": True}
+        return {"type": "audio_chunk"} if stt.heard_speech else None
 
-        current_index = interview_session.current_index
-        if current_index == 0:
-            prompt_text = f"Great, let’s begin. First question: {questions[current_index]}"
-        else:
-            prompt_text = f"Welcome back. Next question: {questions[current_index]}"
-
-        entries = transcript_repo.list("interview", interview_session.id, user_id=user_id)
-        if len(entries) == 0:
-            transcript_repo.add(
-                session_type="interview",
-                session_id=interview_session.id,
-                speaker="assistant",
-                message=prompt_text,
-                user_id=user_id,
-            )
+    if message.get("bytes") is not None:
+        try:
+            upload.append(message["bytes"])
+        except ValueError as exc:
+            upload.reset()
+            await websocket.send_json({"type": "error", "message": str(exc)})
+        # Without a VAD the frames may be silence, so they never barge in.
+        return None
 
-        opening_audio, opening_content_type = openai_service.synthesize_speech(prompt_text)
+    try:
+        return json.loads(message.get("text") or "")
+    except json.JSONDecodeError:
+        await websocket.send_json({"type": "error", "message": "Invalid JSON payload"})
+        return None
+
+
+async def _transcribed_or_none(
+    websocket: WebSocket, openai_service: AsyncOpenAIService, filename: str, audio_file: BinaryIO
+) -> str | None:
+    user_text = (await transcribe_recording(openai_service, filename, audio_file)).strip()
+    if not user_text:
+        await websocket.send_json({"type": "error", "message": "No speech detected in the recording"})
+        return None
+    return user_text
+
+
+async def _read_user_text(
+    websocket: WebSocket,
+    openai_service: AsyncOpenAIService,
+    payload: dict,
+    default_filename: str,
+    upload: AudioUploadBuffer | None = None,
+    utterance: asyncio.Future | None = None,
+) -> str | None:
+    """Transcribe (or read) the user's side of a turn.
+
+    ``upload`` is the binary-chunk buffer and ``utterance`` the streaming-STT
+    transcription handed over by the receive loop when audio_end arrived.
+    """
+    event_type = payload.get("type")
+    if event_type == "audio_end" and utterance is not None:
+        user_text = StreamingTranscriber.join_segments(await utterance)
+        if not user_text:
+            await websocket.send_json({"type": "error", "message": "No speech detected before audio_end"})
+            return None
         await websocket.send_json(
-            {
-                "type": "assistant_prompt",
-                "user_id": user_id,
-                "interview_session_id": interview_session.id,
-                "status": interview_session.status,
-                "question_index": current_index,
-                "assistant_text": prompt_text,
-                "assistant_audio_base64": base64.b64encode(opening_audio).decode("utf-8"),
-                "assistant_audio_content_type": opening_content_type,
-            }
+            {"type": "transcript_final", "text": user_text, "endpointed": bool(payload.get("endpointed"))}
         )
+        return user_text
+
+    if event_type == "audio_end":
+        if upload is None or upload.is_empty():
+            await websocket.send_json({"type": "error", "message": "No audio received before audio_end"})
+            return None
+
+        filename = payload.get("filename") or default_filename
+        try:
+            return await _transcribed_or_none(websocket, openai_service, filename, upload.open())
+        finally:
+            upload.reset()
 
+    if event_type == "user_audio":
+        audio_base64 = payload.get("audio_base64")
+        if not audio_base64:
+            await websocket.send_json({"type": "error", "message": "audio_base64 is required"})
+            return None
+
+        try:
+            audio_bytes = await run_in_threadpool(base64.b64decode, audio_base64)
+        except Exception:
+            await websocket.send_json({"type": "error", "message": "Invalid base64 audio"})
+            return None
+
+        filename = payload.get("filename") or default_filename
+        return await _transcribed_or_none(websocket, openai_service, filename, BytesIO(audio_bytes))
+
+    user_text = str(payload.get("text") or "").strip()
+    if not user_text:
+        await websocket.send_json({"type": "error", "message": "text is required for user_text"})
+        return None
+    return user_text
+
+
+async def _serve_turns(
+    websocket: _SerializedWebSocket,
+    runner: _TurnRunner,
+    stt: StreamingTranscriber | None,
+    handle_turn: Callable[..., Awaitable[None]],
+):
+    """Receive loop shared by the voice sockets.
+
+    Turns run as tasks on ``runner`` while this loop keeps reading, so barge-in
+    events can cancel them. On audio_end the buffered utterance is handed to
+    the turn and a fresh buffer collects whatever the candidate says next.
+    ``handle_turn(runner, payload, upload, utterance)`` owns the handed-over
+    upload buffer.
+    """
+    upload = AudioUploadBuffer()
+    try:
         while True:
-            incoming = await websocket.receive_text()
-            try:
-                payload = json.loads(incoming)
-            except json.JSONDecodeError:
-                await websocket.send_json({"type": "error", "message": "Invalid JSON payload"})
+            payload = await _receive_event(websocket, upload, stt)
+            if payload is None:
                 continue
 
             event_type = payload.get("type")
             if event_type == "ping":
                 await websocket.send_json({"type": "pong"})
                 continue
+            if event_type in BARGE_IN_EVENTS:
+                await runner.interrupt()
+            if event_type in {"audio_chunk", "interrupt"}:
+                continue
+            if event_type == "audio_cancel":
+                upload.reset()
+                if stt:
+                    stt.cancel()
+                continue
+            if event_type not in TURN_EVENTS:
+                await websocket.send_json(
+                    {
+                        "type": "error",
+                        "message": "Unsupported type. Use user_audio, audio_end, audio_cancel, user_text, interrupt, or ping",
+                    }
+                )
+                continue
 
-            interview_session = session_repo.get(interview_session_id, user_id=user_id)
-            if not interview_session:
-                await websocket.send_json({"type": "error", "message": "Interview session not found"})
-                await websocket.close(code=1008)
-                return
+            await runner.interrupt()
+            turn_upload, utterance = None, None
+            if event_type == "audio_end":
+                if stt:
+                    utterance = stt.take_utterance()
+                else:
+                    turn_upload, upload = upload, AudioUploadBuffer()
+            runner.start(handle_turn, payload, turn_upload, utterance)
+    finally:
+        await runner.close()
+        upload.close()
+        if stt:
+            stt.cancel()
 
-            if interview_session.status == "completed":
-                await websocket.send_json({"type": "completed", "message": "Interview already completed"})
-                continue
 
-            current_index = interview_session.current_index
-            if current_index >= len(questions):
-                interview_session.status = "completed"
-                session_repo.save(interview_session)
-                interview_cache.clear_session(interview_session.id)
-                await websocket.send_json({"type": "completed", "message": "Interview completed"})
-                continue
+class _InterviewTurns:
+    """Interview turns on a voice socket, served from the session's actor.
 
-            if event_type == "user_audio":
-                audio_base64 = payload.get("audio_base64")
-                if not audio_base64:
-                    await websocket.send_json({"type": "error", "message": "audio_base64 is required"})
-                    continue
+    Used by the interview socket, and by the collector socket once it has
+    handed off to the interview it just created.
+    """
 
-                try:
-                    audio_bytes = base64.b64decode(audio_base64)
-                except Exception:
-                    await websocket.send_json({"type": "error", "message": "Invalid base64 audio"})
-                    continue
-
-                filename = payload.get("filename") or "voice_input.webm"
-                user_text = openai_service.transcribe_audio(filename=filename, file_bytes=audio_bytes)
-            elif event_type == "user_text":
-                user_text = str(payload.get("text") or "").strip()
-                if not user_text:
-                    await websocket.send_json({"type": "error", "message": "text is required for user_text"})
-                    continue
+    def __init__(
+        self,
+        websocket: _SerializedWebSocket,
+        db: _SocketSession,
+        openai_service: AsyncOpenAIService,
+        actor: SessionActor,
+        audio_mode: str,
+        reply_mode: str,
+        user_id: str | None,
+    ):
+        self.websocket = websocket
+        self.db = db
+        self.openai_service = openai_service
+        self.actor = actor
+        self.audio_mode = audio_mode
+        self.reply_mode = reply_mode
+        self.user_id = user_id
+
+    async def send_opening(self, opening: dict, resume_entry_id: int | None = None):
+        """Replay the last reply or speak the current question, or only confirm an up-to-date resume."""
+        message = {
+            "type": "assistant_prompt",
+            "user_id": self.user_id,
+            "interview_session_id": opening["id"],
+            "status": opening["status"],
+            "question_index": opening["question_index"],
+            "assistant_text": opening["assistant_text"],
+            "resume_token": _issue_resume_token("interview", opening["id"], opening["entry_id"]),
+        }
+        if resume_entry_id is not None and resume_entry_id == opening["entry_id"]:
+            await self.websocket.send_json({**message, "type": "resumed"})
+            return
+        if await _replay_last_reply(
+            self.websocket, self.openai_service, self.audio_mode, "interview", opening["id"], opening["entry_id"], message
+        ):
+            return
+
+        audio_bytes = opening.get("assistant_audio")
+        if audio_bytes is None:
+            audio_bytes = await _question_audio(
+                self.openai_service, opening["interview_id"], opening["question_index"], opening["assistant_text"]
+            )
+        spoken: SpokenSegments = []
+        if await _send_assistant_message(
+            self.websocket, self.openai_service, message, self.audio_mode, audio_bytes=audio_bytes, spoken=spoken
+        ):
+            _remember_reply(
+                "interview", opening["id"], opening["entry_id"], self.openai_service.audio_format,
+                opening["assistant_text"], spoken,
+            )
+
+    async def handle(
+        self,
+        turn: _TurnRunner,
+        payload: dict,
+        upload: AudioUploadBuffer | None,
+        utterance: asyncio.Future | None,
+    ):
+        try:
+            async with self.actor.lock:
+                await self._run(turn, payload, upload, utterance)
+        finally:
+            if upload:
+                upload.close()
+
+    async def _questions_through(self, count: int) -> list[str]:
+        state: InterviewSessionState = self.actor.state
+        return await ensure_questions_async(
+            state.interview_id,
+            state.questions,
+            count,
+            lambda: self.db.run(
+                lambda session: InterviewRepository(session).load_question_progress(state.interview_id)
+            ),
+        )
+
+    async def _run(
+        self,
+        turn: _TurnRunner,
+        payload: dict,
+        upload: AudioUploadBuffer | None,
+        utterance: asyncio.Future | None,
+    ):
+        websocket, db, openai_service, actor = self.websocket, self.db, self.openai_service, self.actor
+        audio_mode = self.audio_mode
+        state: InterviewSessionState = actor.state
+        try:
+            state.questions = await self._questions_through(state.current_index + 1)
+        except QuestionsUnavailable as exc:
+            await websocket.send_json({"type": "error", "message": str(exc)})
+            return
+        questions = state.questions
+        if state.status != "completed" and state.current_index >= len(questions):
+            await actor.write_through(db.run(_write_interview_progress, state, state.current_index, "completed"))
+            await websocket.send_json({"type": "completed", "message": "Interview completed"})
+            return
+        if state.status == "completed":
+            await websocket.send_json({"type": "completed", "message": "Interview already completed"})
+            return
+
+        user_text = await _read_user_text(websocket, openai_service, payload, "voice_input.webm", upload, utterance)
+        if user_text is None:
+            return
+
+        await actor.write_through(db.run(_record_interview_answer, state, user_text))
+        # An interrupted reply leaves the session on the same question: the
+        # candidate's next utterance continues their answer.
+        turn.store_input(
+            lambda text: db.run(_record_assistant_message, "interview", state.id, state.user_id, text)
+        )
+
+        current_index = state.current_index
+        # Generation has had the whole answer to catch up; wait only if it has not.
+        # If it still cannot supply the next question, the answer stays
+        # recorded and the candidate's next utterance continues it.
+        try:
+            state.questions = questions = await self._questions_through(current_index + 2)
+        except QuestionsUnavailable as exc:
+            await websocket.send_json({"type": "error", "message": str(exc)})
+            return
+        current_question = questions[current_index]
+        next_index = current_index + 1
+        next_question = questions[next_index] if next_index < len(questions) else None
+
+        try:
+            if self.reply_mode == "split":
+                reply = await _render_split_interview_reply(
+                    websocket,
+                    openai_service,
+                    audio_mode,
+                    state.interview_id,
+                    user_text,
+                    current_question,
+                    next_index,
+                    next_question,
+                    turn.spoken,
+                )
+            elif audio_mode == "binary" and provider_guard.available(SPEECH):
+                assistant_text, complete = await _stream_reply(
+                    websocket,
+                    openai_service,
+                    "assistant_turn",
+                    openai_service.stream_interview_turn_reply(user_text, current_question, next_question),
+                    turn.spoken,
+                )
+                reply = _InterviewReply(assistant_text=assistant_text, audio_sent=True, speech=complete)
             else:
-                await websocket.send_json(
-                    {"type": "error", "message": "Unsupported type. Use user_audio, user_text, or ping"}
+                reply = _InterviewReply(
+                    assistant_text=await openai_service.build_interview_turn_reply(
+                        user_answer=user_text,
+                        current_question=current_question,
+                        next_question=next_question,
+                    )
                 )
-                continue
+        except _ReplyFailed:
+            # The partial reply is replaced; the turn still moves on.
+            turn.spoken.clear()
+            reply = _InterviewReply(assistant_text=InterviewFlowService.build_fallback_turn_reply(next_question))
+        assistant_text = reply.assistant_text
+        if not reply.audio_sent and reply.audio_bytes is None and reply.speech:
+            reply.audio_bytes = await _speech_or_none(openai_service, assistant_text)
+            reply.speech = reply.audio_bytes is not None
+
+        if next_question is None:
+            status = "completed"
+            question_index = None
+        else:
+            status = "active"
+            question_index = next_index
+
+        entry_id = await turn.commit(
+            actor.write_through(db.run(_complete_interview_turn, state, question_index, assistant_text))
+        )
+
+        delivered = await _send_assistant_message(
+            websocket,
+            openai_service,
+            {
+                "type": "assistant_turn",
+                "user_id": self.user_id,
+                "interview_session_id": state.id,
+                "status": status,
+                "question_index": question_index,
+                "user_text": user_text,
+                "assistant_text": assistant_text,
+                "resume_token": _issue_resume_token("interview", state.id, entry_id),
+                **reply.extra,
+            },
+            audio_mode,
+            audio_sent=reply.audio_sent,
+            audio_bytes=reply.audio_bytes,
+            spoken=turn.spoken,
+            speech=reply.speech,
+        )
+        # A base64 split reply carries the question clip outside the spoken
+        # segments, so it cannot be replayed from them.
+        if delivered and not reply.extra:
+            _remember_reply("interview", state.id, entry_id, openai_service.audio_format, assistant_text, turn.spoken)
+
+
+def _start_handoff_session(db: Session, interview_id: int, user_id: str | None, audio_format: str) -> dict:
+    """Create the interview session a collector socket hands off to.
+
+    Mirrors POST /interviews/{id}/start and returns an opening like
+    _load_interview_opening (without the audio).
+    """
+    questions = interview_cache.get_interview_questions(interview_id)
+    if not questions:
+        interview_repo = InterviewRepository(db)
+        interview = interview_repo.get_by_id(interview_id)
+        questions = interview_repo.parse_questions(interview) if interview else []
+        interview_cache.set_interview_questions(interview_id, questions)
+    if not questions:
+        raise ValueError("Interview has no questions")
+
+    interview_session = InterviewSessionRepository(db).create(interview_id, user_id=user_id)
+    interview_cache.set_session_questions(interview_session.id, questions)
+    interview_cache.set_session_audio_format("interview", interview_session.id, audio_format)
+    prompt_text = InterviewFlowService.build_question_prompt(questions[0], 0)
+    entry = TranscriptRepository(db).add(
+        "interview", interview_session.id, "assistant", prompt_text, user_id=user_id, refresh=False
+    )
+    return {
+        "id": interview_session.id,
+        "interview_id": interview_id,
+        "status": interview_session.status,
+        "question_index": 0,
+        "assistant_text": prompt_text,
+        "entry_id": entry.id,
+        "state": InterviewSessionState(
+            id=interview_session.id,
+            interview_id=interview_id,
+            user_id=user_id,
+            status=interview_session.status,
+            current_index=0,
+            questions=questions,
+        ),
+    }
+
+
+async def _prepare_handoff(
+    db: _SocketSession,
+    openai_service: AsyncOpenAIService,
+    interview_id: int,
+    user_id: str | None,
+) -> dict:
+    """Session row and first-question audio, prepared while the closing message plays."""
+    opening = await db.run(_start_handoff_session, interview_id, user_id, openai_service.audio_format)
+    opening["assistant_audio"] = await _question_audio(openai_service, interview_id, 0, opening["assistant_text"])
+    return opening
 
-            transcript_repo.add(
-                session_type="interview",
-                session_id=interview_session.id,
-                speaker="user",
-                message=user_text,
-                user_id=user_id,
-            )
 
-            current_question = questions[current_index]
-            next_index = current_index + 1
-            next_question = questions[next_index] if next_index < len(questions) else None
+@router.websocket("/collector/sessions/{collector_session_id}/voice")
+async def collector_voice_socket(websocket: WebSocket, collector_session_id: int):
+    await websocket.accept()
+    websocket = _SerializedWebSocket(websocket)
+    user_id = websocket.query_params.get("user_id")
+    audio_mode = await _read_query_choice(websocket, "audio_mode", AUDIO_MODES, "base64")
+    if not audio_mode:
+        return
+    audio_format = await _read_audio_format(websocket, "collector", collector_session_id)
+    if not audio_format:
+        return
+    handoff = await _read_query_choice(websocket, "handoff", HANDOFF_MODES, "none")
+    if not handoff:
+        return
+    reply_mode = await _read_query_choice(websocket, "reply_mode", REPLY_MODES, settings.interview_reply_mode)
+    if not reply_mode:
+        return
+
+    # Anonymous sockets are scheduled fairly per session rather than sharing one lane.
+    scheduler_user = user_id or f"collector:{collector_session_id}"
+    openai_service = AsyncOpenAIService(audio_format=audio_format, user_id=scheduler_user)
+    stt_choice = await _read_stt_mode(websocket, openai_service)
+    if not stt_choice:
+        return
+    _, stt = stt_choice
+
+    db = _SocketSession()
+    runner = _TurnRunner(websocket)
+    actor: SessionActor | None = None
+    # Set once the socket has handed off to the interview it created.
+    interview_turns: _InterviewTurns | None = None
+    # prepare_collector_turn is shared with the REST route and stays sync; it
+    # runs in the threadpool with its own client for question generation.
+    sync_openai_service = OpenAIService(priority=Priority.LIVE, user_id=scheduler_user)
 
-            assistant_text = openai_service.build_interview_turn_reply(
-                user_answer=user_text,
-                current_question=current_question,
-                next_question=next_question,
+    async def handle_turn(
+        turn: _TurnRunner,
+        payload: dict,
+        upload: AudioUploadBuffer | None,
+        utterance: asyncio.Future | None,
+    ):
+        if interview_turns:
+            await interview_turns.handle(turn, payload, upload, utterance)
+            return
+        try:
+            async with actor.lock:
+                await run_turn(turn, payload, upload, utterance)
+        finally:
+            if upload:
+                upload.close()
+
+    async def run_turn(
+        turn: _TurnRunner,
+        payload: dict,
+        upload: AudioUploadBuffer | None,
+        utterance: asyncio.Future | None,
+    ):
+        if actor.state.status == "completed":
+            await websocket.send_json({"type": "completed", "message": "Collector session already completed"})
+            return
+
+        user_text = await _read_user_text(websocket, openai_service, payload, "collector_input.webm", upload, utterance)
+        if user_text is None:
+            return
+
+        draft = await actor.write_through(
+            db.run(
+                lambda session: prepare_collector_turn(
+                    collector_session_id=collector_session_id,
+                    user_message=user_text,
+                    user_id=effective_user_id,
+                    db=session,
+                    openai_service=sync_openai_service,
+                    state=actor.state,
+                )
             )
+        )
+        turn.store_input(
+            lambda text: db.run(_record_assistant_message, "collector", draft.collector_session_id, draft.user_id, text)
+        )
 
-            if next_question is None:
-                interview_session.current_index = len(questions)
-                interview_session.status = "completed"
-                status = "completed"
-                question_index = None
-                interview_cache.clear_session(interview_session.id)
+        handoff_task = None
+        if draft.completed and handoff == "interview":
+            # The collector is completed and the interview saved, so the turn
+            # now runs to the first question even if the candidate barges in.
+            # The session row and first-question audio are prepared while the
+            # closing message is generated and spoken.
+            turn.hold()
+            handoff_task = asyncio.create_task(
+                _prepare_handoff(db, openai_service, draft.interview_id, draft.user_id)
+            )
+        try:
+            await finish_turn(turn, draft, user_text, handoff_task)
+        finally:
+            if handoff_task and not handoff_task.done():
+                handoff_task.cancel()
+
+    async def finish_turn(
+        turn: _TurnRunner,
+        draft: CollectorTurnDraft,
+        user_text: str,
+        handoff_task: asyncio.Task | None,
+    ):
+        nonlocal interview_turns
+
+        # The socket owns the "streamed" audio policy: the reply's speech is
+        # rendered exactly once, below, and never inline in the turn.
+        assistant_text = draft.assistant_message
+        audio_sent = False
+        audio_bytes = None
+        speech = True
+        if assistant_text is None:
+            prompt = draft.reply_prompt
+            next_field_prompt = HANDOFF_PROMPT if handoff_task else prompt.next_field_prompt
+            if audio_mode == "binary" and provider_guard.available(SPEECH):
+                try:
+                    assistant_text, speech = await _stream_reply(
+                        websocket,
+                        openai_service,
+                        "assistant_turn",
+                        openai_service.stream_collector_reply(prompt.field_name, prompt.user_response, next_field_prompt),
+                        turn.spoken,
+                    )
+                    audio_sent = True
+                except _ReplyFailed:
+                    if not next_field_prompt:
+                        raise
+                    # The field is already saved, so the candidate still hears the next prompt.
+                    turn.spoken.clear()
+                    assistant_text = next_field_prompt
             else:
-                interview_session.current_index = next_index
-                status = "active"
-                question_index = next_index
-
-            session_repo.save(interview_session)
-
-            transcript_repo.add(
-                session_type="interview",
-                session_id=interview_session.id,
-                speaker="assistant",
-                message=assistant_text,
-                user_id=user_id,
+                assistant_text = await openai_service.build_collector_reply(
+                    prompt.field_name, prompt.user_response, next_field_prompt
+                )
+        if audio_mode != "binary":
+            audio_bytes = await _speech_or_none(openai_service, assistant_text)
+            speech = audio_bytes is not None
+
+        entry_id = await turn.commit(
+            actor.write_through(
+                db.run(
+                    _record_assistant_message,
+                    "collector",
+                    draft.collector_session_id,
+                    draft.user_id,
+                    assistant_text,
+                )
             )
+        )
 
-            assistant_audio, assistant_content_type = openai_service.synthesize_speech(assistant_text)
+        delivered = await _send_assistant_message(
+            websocket,
+            openai_service,
+            {
+                "type": "assistant_turn",
+                "user_id": draft.user_id,
+                "collector_session_id": draft.collector_session_id,
+                "status": "completed" if draft.completed else "collecting",
+                "expected_field": draft.expected_field,
+                "completed": draft.completed,
+                "interview_id": draft.interview_id,
+                "user_text": user_text,
+                "assistant_text": assistant_text,
+                "resume_token": _issue_resume_token("collector", draft.collector_session_id, entry_id),
+            },
+            audio_mode,
+            audio_sent=audio_sent,
+            audio_bytes=audio_bytes,
+            spoken=turn.spoken,
+            speech=speech,
+        )
+        if delivered:
+            _remember_reply("collector", draft.collector_session_id, entry_id, audio_format, assistant_text, turn.spoken)
 
+        if not draft.completed:
+            return
+        if not handoff_task:
             await websocket.send_json(
                 {
-                    "type": "assistant_turn",
-                    "user_id": user_id,
-                    "interview_session_id": interview_session.id,
-                    "status": status,
-                    "question_index": question_index,
-                    "user_text": user_text,
-                    "assistant_text": assistant_text,
-                    "assistant_audio_base64": base64.b64encode(assistant_audio).decode("utf-8"),
-                    "assistant_audio_content_type": assistant_content_type,
+                    "type": "completed",
+                    "collector_session_id": draft.collector_session_id,
+                    "interview_id": draft.interview_id,
+                    "message": "Collector completed",
                 }
             )
+            return
+
+        opening = await handoff_task
+        await websocket.send_json(
+            {
+                "type": "completed",
+                "collector_session_id": draft.collector_session_id,
+                "interview_id": draft.interview_id,
+                "interview_session_id": opening["id"],
+                "handoff": True,
+                "message": "Collector completed, starting the interview",
+            }
+        )
+        interview_turns = _InterviewTurns(
+            websocket,
+            db,
+            openai_service,
+            session_actors.attach("interview", opening["id"], opening["state"]),
+            audio_mode,
+            reply_mode,
+            draft.user_id,
+        )
+        await interview_turns.send_opening(opening)
+
+    try:
+        opening = await db.run(_load_collector_opening, collector_session_id, user_id)
+        if not opening:
+            await websocket.send_json({"type": "error", "message": "Collector session not found"})
+            await websocket.close(code=1008)
+            return
+
+        if opening["status"] == "completed":
+            await websocket.send_json({"type": "completed", "message": "Collector session already completed"})
+            await websocket.close(code=1000)
+            return
+
+        effective_user_id = opening["user_id"]
+        actor = session_actors.attach("collector", collector_session_id, opening["state"])
+        await _send_collector_opening(
+            websocket,
+            openai_service,
+            audio_mode,
+            opening,
+            _read_resume_token(websocket, "collector", collector_session_id),
+        )
+
+        await _serve_turns(websocket, runner, stt, handle_turn)
+
+    except WebSocketDisconnect:
+        return
+    except Exception as exc:
+        await websocket.send_json({"type": "error", "message": str(exc)})
+        await websocket.close(code=1011)
+    finally:
+        await runner.close()
+        if actor:
+            session_actors.detach(actor)
+        if interview_turns:
+            session_actors.detach(interview_turns.actor)
+        await db.close()
+
+
+@router.websocket("/interviews/sessions/{interview_session_id}/voice")
+async def interview_voice_socket(websocket: WebSocket, interview_session_id: int):
+    await websocket.accept()
+    websocket = _SerializedWebSocket(websocket)
+    user_id = websocket.query_params.get("user_id")
+    audio_mode = await _read_query_choice(websocket, "audio_mode", AUDIO_MODES, "base64")
+    if not audio_mode:
+        return
+    reply_mode = await _read_query_choice(websocket, "reply_mode", REPLY_MODES, settings.interview_reply_mode)
+    if not reply_mode:
+        return
+    audio_format = await _read_audio_format(websocket, "interview", interview_session_id)
+    if not audio_format:
+        return
+
+    scheduler_user = user_id or f"interview:{interview_session_id}"
+    openai_service = AsyncOpenAIService(audio_format=audio_format, user_id=scheduler_user)
+    stt_choice = await _read_stt_mode(websocket, openai_service)
+    if not stt_choice:
+        return
+    _, stt = stt_choice
+
+    db = _SocketSession()
+    runner = _TurnRunner(websocket)
+    actor: SessionActor | None = None
+
+    try:
+        opening = await db.run(_load_interview_opening, interview_session_id, user_id)
+        if "error" in opening:
+            await websocket.send_json({"type": "error", "message": opening["error"]})
+            await websocket.close(code=1008)
+            return
+
+        if opening["status"] == "completed":
+            await websocket.send_json({"type": "completed", "message": "Interview already completed"})
+            await websocket.close(code=1000)
+            return
+
+        actor = session_actors.attach("interview", interview_session_id, opening["state"])
+        interview_turns = _InterviewTurns(websocket, db, openai_service, actor, audio_mode, reply_mode, user_id)
+        await interview_turns.send_opening(
+            opening, _read_resume_token(websocket, "interview", interview_session_id)
+        )
+
+        await _serve_turns(websocket, runner, stt, interview_turns.handle)
 
     except WebSocketDisconnect:
         return
@@ -356,4 +1530,7 @@ async def interview_voice_socket(websocket: WebSocket, interview_session_id: int
         await websocket.send_json({"type": "error", "message": str(exc)})
         await websocket.close(code=1011)
     finally:
-        db.close()
+        await runner.close()
+        if actor:
+            session_actors.detach(actor)
+        await db.close()
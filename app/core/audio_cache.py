@@ -0,0 +1,164 @@
+import hashlib
+import os
+from collections import OrderedDict
+from threading import Lock, get_ident
+
+from app.core.config import settings
+
+
+class SpeechAudioCache:
+    """Content-addressed cache for synthesized speech.
+
+    Entries are keyed by a hash of (text, tts model, voice, format) and stored
+    as files in ``directory``, evicted least-recently-used once the directory
+    exceeds ``max_disk_bytes``. Recently used clips are also kept in an
+    in-memory hot tier bounded by ``max_memory_bytes``.
+
+    Only texts registered with ``register_static`` (or stored explicitly) are
+    written, so unique per-turn replies never churn the cache.
+    """
+
+    def __init__(self, directory: str, max_disk_bytes: int, max_memory_bytes: int):
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self._lock = Lock()
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk: OrderedDict[str, int] | None = None
+        self._disk_bytes = 0
+        self._static_texts: set[str] = set()
+
+    @staticmethod
+    def key(text: str, model: str, voice: str, audio_format: str) -> str:
+        raw = "\x1f".join([model, voice, audio_format, text])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def register_static(self, texts):
+        with self._lock:
+            self._static_texts.update(texts)
+
+    def load(self):
+        """Index the cache directory up front so lookups never scan it lazily."""
+        with self._lock:
+            self._load_disk_index()
+
+    def is_static(self, text: str) -> bool:
+        return text in self._static_texts
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.audio")
+
+    def _load_disk_index(self):
+        # Called with the lock held. Rebuilds LRU order from file mtimes so the
+        # cache survives restarts.
+        if self._disk is not None:
+            return
+        self._disk = OrderedDict()
+        self._disk_bytes = 0
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".audio"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.name[: -len(".audio")], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_bytes += size
+
+    def _remember(self, key: str, audio: bytes):
+        # Called with the lock held.
+        if len(audio) > self.max_memory_bytes:
+            return
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return
+        self._memory[key] = audio
+        self._memory_bytes += len(audio)
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def get_memory(self, key: str) -> bytes | None:
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+            return audio
+
+    def contains(self, key: str) -> bool:
+        with self._lock:
+            self._load_disk_index()
+            return key in self._memory or key in self._disk
+
+    def get(self, key: str) -> bytes | None:
+        """Memory tier first, then disk. Disk hits are promoted to memory."""
+        audio = self.get_memory(key)
+        if audio is not None:
+            return audio
+
+        with self._lock:
+            self._load_disk_index()
+            if key not in self._disk:
+                return None
+            self._disk.move_to_end(key)
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as handle:
+                audio = handle.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                size = self._disk.pop(key, 0)
+                self._disk_bytes -= size
+            return None
+
+        with self._lock:
+            self._remember(key, audio)
+        return audio
+
+    def put(self, key: str, audio: bytes):
+        if not audio:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{get_ident()}.tmp"
+        with self._lock:
+            self._load_disk_index()
+            self._remember(key, audio)
+            if key in self._disk:
+                self._disk.move_to_end(key)
+                return
+
+        try:
+            with open(tmp_path, "wb") as handle:
+                handle.write(audio)
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            # The memory tier still serves the clip; a read-only or full disk
+            # must never fail the turn.
+            print(f"[audio-cache] Failed to persist {key}: {exc}")
+            return
+
+        evict = []
+        with self._lock:
+            if key not in self._disk:
+                self._disk[key] = len(audio)
+                self._disk_bytes += len(audio)
+            while self._disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+                evicted_key, size = self._disk.popitem(last=False)
+                self._disk_bytes -= size
+                evict.append(evicted_key)
+
+        for evicted_key in evict:
+            try:
+                os.remove(self._path(evicted_key))
+            except OSError:
+                pass
+
+
+speech_cache = SpeechAudioCache(
+    directory=settings.audio_cache_dir,
+    max_disk_bytes=settings.audio_cache_max_disk_bytes,
+    max_memory_bytes=settings.audio_cache_max_memory_bytes,
+)
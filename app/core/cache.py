@@ -8,6 +8,7 @@ class InterviewMemoryCache:
         self._lock = Lock()
         self._interview_questions: dict[int, tuple[float, list[str]]] = {}
         self._session_questions: dict[int, tuple[float, list[str]]] = {}
+        self._session_audio_formats: dict[tuple[str, int], tuple[float, str]] = {}
 
     def _get(self, store: dict[int, tuple[float, list[str]]], key: int) -> list[str] | None:
         with self._lock:
@@ -36,10 +37,17 @@ class InterviewMemoryCache:
     def set_session_questions(self, interview_session_id: int, questions: list[str]):
         self._set(self._session_questions, interview_session_id, questions)
 
+    def get_session_audio_format(self, session_type: str, session_id: int) -> str | None:
+        return self._get(self._session_audio_formats, (session_type, session_id))
+
+    def set_session_audio_format(self, session_type: str, session_id: int, audio_format: str):
+        self._set(self._session_audio_formats, (session_type, session_id), audio_format)
+
     def clear_session(self, interview_session_id: int):
         with self._lock:
             if interview_session_id in self._session_questions:
                 del self._session_questions[interview_session_id]
+            self._session_audio_formats.pop(("interview", interview_session_id), None)
 
 
 interview_cache = InterviewMemoryCache()
@@ -15,6 +15,91 @@ class Settings(BaseSettings):
     openai_tts_model: str = "gpt-4o-mini-tts"
     openai_tts_voice: str = "alloy"
     openai_tts_format: str = "mp3"
+    openai_max_connections: int = 100
+    openai_max_keepalive_connections: int = 20
+    openai_keepalive_expiry_seconds: float = 60.0
+    openai_http2: bool = True
+    openai_warm_connections: int = 2
+    openai_rpm_limit: int = 0
+    openai_tpm_limit: int = 0
+    openai_completion_token_estimate: int = 256
+    openai_provider: str = "openai"
+    openai_base_url: Optional[str] = None
+
+    fake_openai_profile: str = "typical"
+    fake_openai_seed: int = 0
+    fake_openai_transcript: Optional[str] = None
+
+    provider_turn_budget_seconds: float = 10.0
+    provider_chat_budget_share: float = 0.4
+    provider_speech_budget_share: float = 0.3
+    provider_transcription_budget_share: float = 0.3
+    provider_transcription_seconds_per_mb: float = 2.0
+    provider_generation_timeout_seconds: float = 60.0
+    provider_hedging: bool = True
+    provider_hedge_delay_seconds: float = 1.5
+    provider_hedge_percentile: float = 0.95
+    provider_hedge_workers: int = 32
+    provider_breaker_failures: int = 5
+    provider_breaker_reset_seconds: float = 30.0
+
+    voice_audio_chunk_bytes: int = 16384
+    voice_upload_max_bytes: int = 25 * 1024 * 1024
+    voice_upload_spool_bytes: int = 1024 * 1024
+    voice_sentence_min_chars: int = 24
+    voice_tts_pipeline_concurrency: int = 3
+    voice_resume_cache_max_bytes: int = 16 * 1024 * 1024
+
+    stt_sample_rate: int = 16000
+    stt_vad_frame_ms: int = 30
+    stt_vad_energy_threshold: float = 500.0
+    stt_segment_pause_ms: int = 300
+    stt_endpoint_silence_ms: int = 800
+    stt_max_segment_ms: int = 10000
+    stt_preroll_ms: int = 150
+    stt_stream_concurrency: int = 2
+    stt_split_min_ms: int = 30000
+    stt_split_target_ms: int = 15000
+    stt_split_max_ms: int = 25000
+    stt_split_concurrency: int = 4
+
+    audio_normalize_workers: int = 2
+    audio_trim_padding_ms: int = 200
+
+    audio_cache_dir: str = "/tmp/audio_cache"
+    audio_cache_max_disk_bytes: int = 256 * 1024 * 1024
+    audio_cache_max_memory_bytes: int = 32 * 1024 * 1024
+    audio_cache_prewarm: bool = True
+
+    question_audio_dir: str = "/tmp/question_audio"
+    question_audio_prerender: bool = True
+    question_audio_concurrency: int = 4
+    question_audio_max_disk_bytes: int = 512 * 1024 * 1024
+
+    question_set_cache_ttl_seconds: int = 24 * 3600
+    question_set_cache_variants: int = 3
+    question_set_cache_max_keys: int = 1024
+    question_set_cache_wait_seconds: float = 60.0
+
+    question_bank_worker: bool = True
+    question_bank_refresh_seconds: int = 600
+    question_bank_popular_setups: int = 20
+    question_bank_popular_window_days: int = 7
+    question_bank_target_per_setup: int = 40
+    question_bank_batch_size: int = 10
+    question_bank_min_pool_ratio: float = 2.0
+
+    question_shard_size: int = 8
+    question_shard_max: int = 4
+    question_dedup_similarity: float = 0.8
+    question_top_up_attempts: int = 2
+
+    question_stream_enabled: bool = True
+    question_stream_workers: int = 4
+    question_stream_wait_seconds: float = 120.0
+
+    interview_reply_mode: str = "combined"
+    interview_ack_max_tokens: int = 60
 
     database_url: str = "sqlite:////tmp/interview.db"
 
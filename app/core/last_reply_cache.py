@@ -0,0 +1,58 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+
+from app.core.config import settings
+
+
+@dataclass
+class LastReply:
+    """Audio of the assistant message a session's client heard last.
+
+    ``entry_id`` is the transcript entry the message was stored as; ``clips``
+    are the independently playable segments it was sent as.
+    """
+
+    entry_id: int
+    text: str
+    audio_format: str
+    clips: list[tuple[str, bytes]]
+
+    @property
+    def size(self) -> int:
+        return sum(len(audio) for _, audio in self.clips)
+
+
+class LastReplyCache:
+    """Per-session LRU of the last assistant reply, so a reconnect can replay it without TTS."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._replies: OrderedDict[tuple[str, int], LastReply] = OrderedDict()
+        self._bytes = 0
+
+    def get(self, session_type: str, session_id: int, entry_id: int, audio_format: str) -> LastReply | None:
+        with self._lock:
+            reply = self._replies.get((session_type, session_id))
+            if not reply or reply.entry_id != entry_id or reply.audio_format != audio_format:
+                return None
+            self._replies.move_to_end((session_type, session_id))
+            return reply
+
+    def put(self, session_type: str, session_id: int, reply: LastReply):
+        if not reply.clips or reply.size > self.max_bytes:
+            return
+        key = (session_type, session_id)
+        with self._lock:
+            previous = self._replies.pop(key, None)
+            if previous:
+                self._bytes -= previous.size
+            self._replies[key] = reply
+            self._bytes += reply.size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._replies.popitem(last=False)
+                self._bytes -= evicted.size
+
+
+last_reply_cache = LastReplyCache(settings.voice_resume_cache_max_bytes)
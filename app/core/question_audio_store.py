@@ -0,0 +1,108 @@
+import os
+import shutil
+from collections import OrderedDict
+from threading import Lock, get_ident
+
+from app.core.audio_cache import SpeechAudioCache
+from app.core.config import settings
+
+
+class QuestionAudioStore:
+    """On-disk store of pre-rendered question prompts, one directory per interview.
+
+    Files are named by question index and a hash of the spoken text and TTS
+    settings, so a lookup only hits when the stored clip says exactly what the
+    caller is about to say. Once the store exceeds ``max_disk_bytes`` the
+    least-recently-used interviews are removed whole.
+    """
+
+    def __init__(self, directory: str, max_disk_bytes: int):
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._lock = Lock()
+        # Bytes on disk per interview id, least recently used first.
+        self._interviews: OrderedDict[str, int] | None = None
+        self._disk_bytes = 0
+
+    def _path(self, interview_id: int, question_index: int, text: str, audio_format: str | None = None) -> str:
+        audio_format = audio_format or settings.openai_tts_format
+        digest = SpeechAudioCache.key(
+            text,
+            settings.openai_tts_model,
+            settings.openai_tts_voice,
+            audio_format,
+        )[:16]
+        return os.path.join(
+            self.directory,
+            str(interview_id),
+            f"{question_index}-{digest}.{audio_format}",
+        )
+
+    def _load_index(self):
+        # Called with the lock held. Rebuilds LRU order from file mtimes so the
+        # limit still holds across restarts.
+        if self._interviews is not None:
+            return
+        self._interviews = OrderedDict()
+        self._disk_bytes = 0
+        os.makedirs(self.directory, exist_ok=True)
+        entries = []
+        for interview in os.scandir(self.directory):
+            if not interview.is_dir():
+                continue
+            size, mtime = 0, interview.stat().st_mtime
+            for clip in os.scandir(interview.path):
+                if clip.is_file() and not clip.name.endswith(".tmp"):
+                    stat = clip.stat()
+                    size += stat.st_size
+                    mtime = max(mtime, stat.st_mtime)
+            entries.append((mtime, interview.name, size))
+        for _, name, size in sorted(entries):
+            self._interviews[name] = size
+            self._disk_bytes += size
+
+    def _touch(self, interview_id: int):
+        with self._lock:
+            self._load_index()
+            if str(interview_id) in self._interviews:
+                self._interviews.move_to_end(str(interview_id))
+
+    def contains(self, interview_id: int, question_index: int, text: str, audio_format: str | None = None) -> bool:
+        return os.path.exists(self._path(interview_id, question_index, text, audio_format))
+
+    def get(self, interview_id: int, question_index: int, text: str, audio_format: str | None = None) -> bytes | None:
+        try:
+            with open(self._path(interview_id, question_index, text, audio_format), "rb") as handle:
+                audio = handle.read()
+        except OSError:
+            return None
+        self._touch(interview_id)
+        return audio
+
+    def put(self, interview_id: int, question_index: int, text: str, audio: bytes, audio_format: str | None = None):
+        path = self._path(interview_id, question_index, text, audio_format)
+        with self._lock:
+            self._load_index()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        replaced = os.path.getsize(path) if os.path.exists(path) else 0
+        tmp_path = f"{path}.{os.getpid()}.{get_ident()}.tmp"
+        with open(tmp_path, "wb") as handle:
+            handle.write(audio)
+        os.replace(tmp_path, path)
+
+        name = str(interview_id)
+        evict = []
+        with self._lock:
+            self._interviews[name] = self._interviews.get(name, 0) + len(audio) - replaced
+            self._interviews.move_to_end(name)
+            self._disk_bytes += len(audio) - replaced
+            while self._disk_bytes > self.max_disk_bytes and len(self._interviews) > 1:
+                evicted, size = self._interviews.popitem(last=False)
+                self._disk_bytes -= size
+                evict.append(evicted)
+
+        for evicted in evict:
+            shutil.rmtree(os.path.join(self.directory, evicted), ignore_errors=True)
+
+
+question_audio_store = QuestionAudioStore(settings.question_audio_dir, settings.question_audio_max_disk_bytes)
@@ -0,0 +1,203 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from time import time
+from typing import Any, Awaitable, Callable
+
+from app.core.config import settings
+from app.schemas.interview import InterviewSetupPayload
+
+QuestionSetKey = tuple[str, str, str, tuple[str, ...], int]
+
+
+def _fold(value: str) -> str:
+    return " ".join(value.split()).casefold()
+
+
+def question_set_key(payload: InterviewSetupPayload) -> QuestionSetKey:
+    """Canonical form of a setup: case-folded, whitespace-collapsed, techstack sorted and deduplicated."""
+    techstack = tuple(sorted({_fold(item) for item in payload.techstack if item.strip()}))
+    return (_fold(payload.role), _fold(payload.interview_type), _fold(payload.level), techstack, payload.amount)
+
+
+class _Entry:
+    def __init__(self):
+        self.variants: list[tuple[float, list[str]]] = []
+        self.next_variant = 0
+
+
+class QuestionSetClaim:
+    """The right to generate a setup's next variant; settle it exactly once with store() or fail()."""
+
+    def __init__(self, cache: "QuestionSetCache", key: QuestionSetKey, future: Future):
+        self._cache = cache
+        self._key = key
+        self._future = future
+
+    def store(self, questions: list[str]):
+        self._cache._store(self._key, self._future, questions)
+
+    def fail(self, exc: BaseException):
+        self._cache._fail(self._key, self._future, exc)
+
+
+class QuestionSetCache:
+    """Generated question sets shared by identical interview setups.
+
+    Up to ``variants`` sets are kept per canonical setup, each for
+    ``ttl_seconds``. Until a setup has that many, each request generates a
+    new variant; afterwards requests rotate through the stored ones. Only
+    one generation per setup runs at a time: concurrent requests are served
+    a stored variant if there is one and otherwise wait for that generation,
+    for at most ``wait_seconds`` before generating on their own. The least
+    recently used setups are evicted beyond ``max_keys``.
+    """
+
+    def __init__(self, ttl_seconds: int, variants: int, max_keys: int, wait_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.variants = variants
+        self.max_keys = max_keys
+        self.wait_seconds = wait_seconds
+        self._lock = Lock()
+        self._entries: OrderedDict[QuestionSetKey, _Entry] = OrderedDict()
+        self._in_flight: dict[QuestionSetKey, Future] = {}
+        # What each in-flight generation shares with the requests waiting on it.
+        self._live: dict[QuestionSetKey, Any] = {}
+
+    def _fresh_entry(self, key: QuestionSetKey) -> _Entry | None:
+        # Called with the lock held.
+        entry = self._entries.get(key)
+        if entry:
+            now = time()
+            entry.variants = [variant for variant in entry.variants if variant[0] > now]
+            self._entries.move_to_end(key)
+        return entry
+
+    @staticmethod
+    def _rotate(entry: _Entry) -> list[str]:
+        questions = entry.variants[entry.next_variant % len(entry.variants)][1]
+        entry.next_variant += 1
+        return list(questions)
+
+    def _claim(self, key: QuestionSetKey, live: Any = None) -> tuple[list[str] | None, Future | None, bool, Any]:
+        """(stored questions, future to wait on or fulfil, whether the caller must generate, what it shares)."""
+        with self._lock:
+            entry = self._fresh_entry(key)
+            in_flight = self._in_flight.get(key)
+            if entry and entry.variants and (len(entry.variants) >= self.variants or in_flight):
+                return self._rotate(entry), None, False, None
+            if in_flight:
+                return None, in_flight, False, self._live.get(key)
+
+            future = Future()
+            self._in_flight[key] = future
+            if live is not None:
+                self._live[key] = live
+            return None, future, True, None
+
+    def _wait(self, future: Future) -> list[str] | None:
+        """The in-flight generation's questions, or None once ``wait_seconds`` have passed."""
+        try:
+            return list(future.result(timeout=self.wait_seconds))
+        except TimeoutError:
+            return None
+
+    def _add_variant(self, key: QuestionSetKey, questions: list[str]):
+        # Called with the lock held.
+        entry = self._entries.setdefault(key, _Entry())
+        self._entries.move_to_end(key)
+        entry.variants.append((time() + self.ttl_seconds, list(questions)))
+        del entry.variants[: -self.variants]
+        while len(self._entries) > self.max_keys:
+            self._entries.popitem(last=False)
+
+    def _store(self, key: QuestionSetKey, future: Future, questions: list[str]):
+        with self._lock:
+            self._add_variant(key, questions)
+            del self._in_flight[key]
+            self._live.pop(key, None)
+        future.set_result(list(questions))
+
+    def claim(
+        self, payload: InterviewSetupPayload, live: Any = None
+    ) -> tuple[list[str] | None, QuestionSetClaim | None, Any]:
+        """``get_or_generate`` for generation that ends in the background, such as streaming.
+
+        Returns (stored questions, None, None) when ``get_or_generate`` would
+        serve them without generating, or (None, claim, None) when the caller
+        is to generate and settle the claim once its generation ends; ``live``
+        (e.g. its question stream) is then handed to identical setups arriving
+        meanwhile as (None, None, live), to follow instead of waiting for the
+        whole set. If the generation in flight shares nothing, they wait for
+        it as ``get_or_generate`` does. (None, None, None) means generate
+        without a claim: the cache is disabled or the wait timed out.
+        """
+        if self.variants <= 0:
+            return None, None, None
+        key = question_set_key(payload)
+        questions, future, owner, shared = self._claim(key, live)
+        if questions is not None:
+            return questions, None, None
+        if owner:
+            return None, QuestionSetClaim(self, key, future), None
+        if shared is not None:
+            return None, None, shared
+        return self._wait(future), None, None
+
+    def _fail(self, key: QuestionSetKey, future: Future, exc: BaseException):
+        with self._lock:
+            del self._in_flight[key]
+            self._live.pop(key, None)
+        if isinstance(exc, asyncio.CancelledError):
+            # Waiters must not mistake the owner's cancellation for their own.
+            exc = RuntimeError("Question generation was cancelled")
+        future.set_exception(exc)
+
+    def get_or_generate(self, payload: InterviewSetupPayload, generate: Callable[[], list[str]]) -> list[str]:
+        if self.variants <= 0:
+            return generate()
+        key = question_set_key(payload)
+        questions, future, owner, _ = self._claim(key)
+        if questions is not None:
+            return questions
+        if not owner:
+            questions = self._wait(future)
+            return questions if questions is not None else generate()
+        try:
+            questions = generate()
+        except BaseException as exc:
+            self._fail(key, future, exc)
+            raise
+        self._store(key, future, questions)
+        return questions
+
+    async def get_or_generate_async(
+        self, payload: InterviewSetupPayload, generate: Callable[[], Awaitable[list[str]]]
+    ) -> list[str]:
+        if self.variants <= 0:
+            return await generate()
+        key = question_set_key(payload)
+        questions, future, owner, _ = self._claim(key)
+        if questions is not None:
+            return questions
+        if not owner:
+            try:
+                return list(await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), self.wait_seconds))
+            except TimeoutError:
+                return await generate()
+        try:
+            questions = await generate()
+        except BaseException as exc:
+            self._fail(key, future, exc)
+            raise
+        self._store(key, future, questions)
+        return questions
+
+
+question_set_cache = QuestionSetCache(
+    ttl_seconds=settings.question_set_cache_ttl_seconds,
+    variants=settings.question_set_cache_variants,
+    max_keys=settings.question_set_cache_max_keys,
+    wait_seconds=settings.question_set_cache_wait_seconds,
+)
@@ -1,11 +1,16 @@
 from app.models.collector_session import CollectorSession
 from app.models.interview import Interview
 from app.models.interview_session import InterviewSession
+from app.models.question_bank import BankQuestion, BankQuestionTag
+from app.models.question_generation import QuestionGeneration
 from app.models.transcript import TranscriptEntry
 
 __all__ = [
+    "BankQuestion",
+    "BankQuestionTag",
     "CollectorSession",
     "Interview",
     "InterviewSession",
+    "QuestionGeneration",
     "TranscriptEntry",
 ]
@@ -0,0 +1,29 @@
+from datetime import datetime
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class BankQuestion(Base):
+    __tablename__ = "question_bank"
+    __table_args__ = (Index("ix_question_bank_setup", "role", "interview_type", "level"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    role: Mapped[str] = mapped_column(String(100), nullable=False)
+    interview_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    level: Mapped[str] = mapped_column(String(50), nullable=False)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    text_key: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    tags_csv: Mapped[str] = mapped_column(Text, nullable=False)
+    source_interview_id: Mapped[int | None] = mapped_column(Integer, nullable=True, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+
+class BankQuestionTag(Base):
+    """Inverted index from a tech tag to the bank questions tagged with it."""
+
+    __tablename__ = "question_bank_tags"
+
+    tag: Mapped[str] = mapped_column(String(100), primary_key=True)
+    question_id: Mapped[int] = mapped_column(Integer, ForeignKey("question_bank.id"), primary_key=True)
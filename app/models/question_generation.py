@@ -0,0 +1,24 @@
+from datetime import datetime
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+GENERATING = "generating"
+DONE = "done"
+FAILED = "failed"
+
+
+class QuestionGeneration(Base):
+    """Progress of an interview's streamed question generation.
+
+    While ``status`` is generating, the interview row holds fewer questions
+    than ``amount``; interviews created from a finished set have no row here.
+    """
+
+    __tablename__ = "question_generations"
+
+    interview_id: Mapped[int] = mapped_column(Integer, ForeignKey("interviews.id"), primary_key=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,6 +1,7 @@
 import json
 from typing import Any, Dict
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.models.collector_session import CollectorSession
@@ -37,6 +38,21 @@ class CollectorRepository:
         self.db.commit()
         self.db.refresh(session)
 
+    def write_state(
+        self,
+        collector_session_id: int,
+        payload: Dict[str, Any],
+        current_field: str,
+        status: str,
+        user_id: str | None = None,
+    ):
+        """Write-through update by id that never loads or refreshes the row."""
+        values = {"payload_json": json.dumps(payload), "current_field": current_field, "status": status}
+        if user_id is not None:
+            values["user_id"] = user_id
+        self.db.execute(update(CollectorSession).where(CollectorSession.id == collector_session_id).values(**values))
+        self.db.commit()
+
     @staticmethod
     def parse_payload(session: CollectorSession) -> Dict[str, Any]:
         return json.loads(session.payload_json)
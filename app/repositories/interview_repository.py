@@ -1,10 +1,12 @@
 import json
+from datetime import datetime
 from typing import List
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from app.models.interview import Interview
+from app.models.question_generation import QuestionGeneration
 from app.schemas.interview import InterviewSetupPayload
 
 
@@ -42,6 +44,31 @@ class InterviewRepository:
             return None
         return interview
 
+    def load_question_progress(self, interview_id: int) -> tuple[List[str], str | None, str | None]:
+        """Stored questions, read straight from the database, with the status and error of their
+        streamed generation, if any."""
+        row = self.db.execute(
+            select(Interview.questions_json, QuestionGeneration.status, QuestionGeneration.error)
+            .outerjoin(QuestionGeneration, QuestionGeneration.interview_id == Interview.id)
+            .where(Interview.id == interview_id)
+        ).first()
+        if row is None:
+            return [], None, None
+        return (json.loads(row.questions_json) if row.questions_json else []), row.status, row.error
+
+    def write_questions(self, interview_id: int, questions: List[str]):
+        """Write-through update of a streamed interview's questions."""
+        self.db.execute(
+            update(Interview).where(Interview.id == interview_id).values(questions_json=json.dumps(questions))
+        )
+        self.db.commit()
+
+    def set_generation_status(self, interview_id: int, status: str, error: str | None = None):
+        self.db.merge(
+            QuestionGeneration(interview_id=interview_id, status=status, error=error, updated_at=datetime.utcnow())
+        )
+        self.db.commit()
+
     @staticmethod
     def parse_questions(interview: Interview) -> List[str]:
         return json.loads(interview.questions_json)
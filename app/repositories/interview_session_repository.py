@@ -1,4 +1,4 @@
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from app.models.interview_session import InterviewSession
@@ -28,6 +28,15 @@ class InterviewSessionRepository:
         self.db.commit()
         self.db.refresh(session)
 
+    def write_progress(self, interview_session_id: int, current_index: int, status: str):
+        """Write-through update by id that never loads or refreshes the row."""
+        self.db.execute(
+            update(InterviewSession)
+            .where(InterviewSession.id == interview_session_id)
+            .values(current_index=current_index, status=status)
+        )
+        self.db.commit()
+
     def list_by_interview_id(self, interview_id: int) -> list[InterviewSession]:
         stmt = select(InterviewSession).where(InterviewSession.interview_id == interview_id)
         return list(self.db.scalars(stmt).all())
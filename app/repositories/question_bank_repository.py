@@ -0,0 +1,112 @@
+import hashlib
+import math
+import random
+from typing import List
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.question_set_cache import question_set_key
+from app.models.question_bank import BankQuestion, BankQuestionTag
+from app.schemas.interview import InterviewSetupPayload
+
+
+class QuestionBankRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def _text_key(role: str, interview_type: str, level: str, text: str) -> str:
+        folded = " ".join(text.split()).casefold()
+        raw = "\x1f".join([role, interview_type, level, folded])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def add(
+        self, payload: InterviewSetupPayload, questions: List[str], source_interview_id: int | None = None
+    ) -> int:
+        """Store questions under the setup's canonical role/type/level and tech tags; returns how many were new."""
+        role, interview_type, level, tags, _ = question_set_key(payload)
+        keyed = {self._text_key(role, interview_type, level, text): text for text in questions if text.strip()}
+        if not keyed or not tags:
+            return 0
+        existing = set(self.db.scalars(select(BankQuestion.text_key).where(BankQuestion.text_key.in_(keyed))))
+        new = [(key, text) for key, text in keyed.items() if key not in existing]
+        try:
+            for key, text in new:
+                question = BankQuestion(
+                    role=role,
+                    interview_type=interview_type,
+                    level=level,
+                    text=text,
+                    text_key=key,
+                    tags_csv=",".join(tags),
+                    source_interview_id=source_interview_id,
+                )
+                self.db.add(question)
+                self.db.flush()
+                self.db.add_all(BankQuestionTag(tag=tag, question_id=question.id) for tag in tags)
+            self.db.commit()
+        except IntegrityError:
+            # Another worker stored the same questions first.
+            self.db.rollback()
+            return 0
+        return len(new)
+
+    def _candidates(self, payload: InterviewSetupPayload) -> list[tuple[str, frozenset[str]]]:
+        """Questions of the setup whose tags all belong to the requested techstack."""
+        role, interview_type, level, tags, _ = question_set_key(payload)
+        tagged = select(BankQuestionTag.question_id).where(BankQuestionTag.tag.in_(tags))
+        rows = self.db.execute(
+            select(BankQuestion.text, BankQuestion.tags_csv).where(
+                BankQuestion.role == role,
+                BankQuestion.interview_type == interview_type,
+                BankQuestion.level == level,
+                BankQuestion.id.in_(tagged),
+            )
+        ).all()
+        requested = set(tags)
+        candidates = []
+        for text, tags_csv in rows:
+            question_tags = frozenset(tags_csv.split(","))
+            if question_tags <= requested:
+                candidates.append((text, question_tags))
+        return candidates
+
+    def coverage(self, payload: InterviewSetupPayload) -> int:
+        return len(self._candidates(payload))
+
+    def assemble(self, payload: InterviewSetupPayload) -> List[str] | None:
+        """Pick ``amount`` questions from the bank, or None when coverage is missing.
+
+        Every requested tech must be covered by at least one question, and the
+        bank must hold ``question_bank_min_pool_ratio`` times the amount so
+        that interviews for the same setup still differ.
+        """
+        candidates = self._candidates(payload)
+        requested = set(question_set_key(payload)[3])
+        if len(candidates) < math.ceil(payload.amount * settings.question_bank_min_pool_ratio):
+            return None
+        if set().union(*(question_tags for _, question_tags in candidates)) != requested:
+            return None
+
+        random.shuffle(candidates)
+        picked: list[str] = []
+        # One question per tech first, so a small interview still covers the stack.
+        for tag in sorted(requested):
+            for text, question_tags in candidates:
+                if tag in question_tags and text not in picked:
+                    picked.append(text)
+                    break
+        for text, _ in candidates:
+            if len(picked) >= payload.amount:
+                break
+            if text not in picked:
+                picked.append(text)
+        picked = picked[: payload.amount]
+        random.shuffle(picked)
+        return picked
+
+    def last_indexed_interview_id(self) -> int:
+        return self.db.scalar(select(func.max(BankQuestion.source_interview_id))) or 0
@@ -17,6 +17,7 @@ class TranscriptRepository:
         speaker: str,
         message: str,
         user_id: str | None = None,
+        refresh: bool = True,
     ) -> TranscriptEntry:
         entry = TranscriptEntry(
             session_type=session_type,
@@ -26,10 +27,26 @@ class TranscriptRepository:
             message=message,
         )
         self.db.add(entry)
+        if not refresh:
+            # Keep the flushed values (id included) instead of letting the
+            # commit expire them, so reading them back costs no SELECT.
+            self.db.flush()
+            self.db.expunge(entry)
         self.db.commit()
-        self.db.refresh(entry)
+        if refresh:
+            self.db.refresh(entry)
         return entry
 
+    def last(self, session_type: str, session_id: int, user_id: str | None = None) -> TranscriptEntry | None:
+        stmt = select(TranscriptEntry).where(
+            TranscriptEntry.session_type == session_type,
+            TranscriptEntry.session_id == session_id,
+        )
+        if user_id:
+            stmt = stmt.where(TranscriptEntry.user_id == user_id)
+        stmt = stmt.order_by(TranscriptEntry.created_at.desc(), TranscriptEntry.id.desc()).limit(1)
+        return self.db.scalars(stmt).first()
+
     def list(self, session_type: str, session_id: int, user_id: str | None = None) -> List[TranscriptEntry]:
         stmt = select(TranscriptEntry).where(
             TranscriptEntry.session_type == session_type,
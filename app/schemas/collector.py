@@ -1,7 +1,16 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
+# How the assistant's speech for a turn is delivered. "inline" embeds base64
+# audio in the response, "streamed" leaves rendering to a caller that streams
+# it (voice sockets), "none" skips TTS for text-only clients.
+AudioPolicy = Literal["none", "inline", "streamed"]
+
+# Speech output formats a client can negotiate per session; see
+# SPEECH_FORMATS in app.services.openai_service.
+AudioFormat = Literal["mp3", "opus", "aac", "flac", "wav", "pcm"]
+
 
 class CollectorStartResponse(BaseModel):
     collector_session_id: int
@@ -15,11 +24,15 @@ class CollectorStartResponse(BaseModel):
 class CollectorStartRequest(BaseModel):
     user_id: Optional[str] = None
     candidate_name: Optional[str] = None
+    audio_policy: Literal["none", "inline"] = "inline"
+    audio_format: Optional[AudioFormat] = None
 
 
 class CollectorTurnRequest(BaseModel):
     user_message: str = Field(min_length=1)
     user_id: Optional[str] = None
+    audio_policy: Literal["none", "inline"] = "inline"
+    audio_format: Optional[AudioFormat] = None
 
 
 class CollectorTurnResponse(BaseModel):
@@ -1,8 +1,10 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
+from app.schemas.collector import AudioFormat
+
 
 class InterviewSetupPayload(BaseModel):
     user_id: Optional[str] = None
@@ -32,18 +34,23 @@ class InterviewListItem(BaseModel):
 
 class InterviewSessionStartRequest(BaseModel):
     user_id: Optional[str] = None
+    audio_policy: Literal["none", "inline"] = "inline"
+    audio_format: Optional[AudioFormat] = None
 
 
 class InterviewSessionStartResponse(BaseModel):
     interview_session_id: int
     user_id: Optional[str] = None
     assistant_message: str
+    assistant_audio_base64: Optional[str] = None
+    assistant_audio_content_type: Optional[str] = None
     question_index: int
 
 
 class InterviewTurnRequest(BaseModel):
     user_message: str = Field(min_length=1)
     user_id: Optional[str] = None
+    reply_mode: Optional[Literal["combined", "split"]] = None
 
 
 class InterviewTurnResponse(BaseModel):
@@ -0,0 +1,174 @@
+import asyncio
+import math
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+import numpy as np
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+# NumPy releases the GIL for the array work, so a small dedicated pool keeps
+# normalization off the event loop and bounds how many recordings are
+# processed at once.
+_normalize_pool = ThreadPoolExecutor(
+    max_workers=settings.audio_normalize_workers,
+    thread_name_prefix="audio-normalize",
+)
+
+
+def _to_float_mono(pcm: bytes, channels: int, sample_width: int) -> np.ndarray:
+    """Decode little-endian PCM to float32 mono on the 16-bit scale."""
+    if sample_width == 1:
+        samples = (np.frombuffer(pcm, dtype=np.uint8).astype(np.float32) - 128.0) * 256.0
+    elif sample_width == 2:
+        samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32)
+    elif sample_width == 3:
+        raw = np.frombuffer(pcm[: len(pcm) - len(pcm) % 3], dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        packed = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        samples = (np.where(packed >= 1 << 23, packed - (1 << 24), packed) / 256.0).astype(np.float32)
+    elif sample_width == 4:
+        samples = (np.frombuffer(pcm, dtype="<i4") / 65536.0).astype(np.float32)
+    else:
+        raise ValueError(f"Unsupported sample width: {sample_width}")
+
+    if channels > 1:
+        samples = samples[: len(samples) - len(samples) % channels].reshape(-1, channels).mean(axis=1)
+    return samples
+
+
+def _to_pcm16(samples: np.ndarray) -> bytes:
+    return np.clip(np.rint(samples), -32768, 32767).astype("<i2").tobytes()
+
+
+def _vad_frame() -> int:
+    return max(1, settings.stt_sample_rate * settings.stt_vad_frame_ms // 1000)
+
+
+def _speech_frames(samples: np.ndarray) -> np.ndarray:
+    """Indices of the ``stt_vad_frame_ms`` frames (at ``stt_sample_rate``) above the VAD threshold."""
+    frame = _vad_frame()
+    frames = samples.size // frame
+    if frames == 0:
+        return np.empty(0, dtype=np.intp)
+    rms = np.sqrt(np.mean(np.square(samples[: frames * frame].reshape(frames, frame)), axis=1))
+    return np.flatnonzero(rms >= settings.stt_vad_energy_threshold)
+
+
+class _Resampler:
+    """Linear-interpolation resampler with a moving-average anti-alias filter when downsampling.
+
+    It works block by block: the filter history and the input position of
+    the next output sample carry over between blocks, and only the input the
+    next output still needs is kept.
+    """
+
+    def __init__(self, sample_rate: int, target_rate: int):
+        self.ratio = sample_rate / target_rate
+        width = int(round(self.ratio))
+        self._kernel = np.full(width, 1.0 / width, dtype=np.float32) if width > 1 else None
+        self._history = np.zeros(max(0, width - 1), dtype=np.float32)
+        self._pending = np.empty(0, dtype=np.float32)
+        self._pending_start = 0
+        self._emitted = 0
+
+    def feed(self, samples: np.ndarray, final: bool = False) -> np.ndarray:
+        if self.ratio == 1:
+            return samples
+        if self._kernel is not None and samples.size:
+            padded = np.concatenate([self._history, samples])
+            self._history = padded[padded.size - self._history.size:]
+            samples = np.convolve(padded, self._kernel, mode="valid").astype(np.float32)
+        self._pending = np.concatenate([self._pending, samples])
+        available = self._pending_start + self._pending.size
+        if final:
+            total = int(available / self.ratio)
+        else:
+            # Output k sits at input position k * ratio and needs the sample after it.
+            total = math.floor((available - 1) / self.ratio) + 1 if available else 0
+        count = max(0, total - self._emitted)
+        if count == 0:
+            return np.empty(0, dtype=np.float32)
+
+        positions = np.arange(self._emitted, self._emitted + count, dtype=np.float64) * self.ratio
+        resampled = np.interp(
+            positions - self._pending_start, np.arange(self._pending.size), self._pending
+        ).astype(np.float32)
+        self._emitted += count
+        consumed = min(self._pending.size, max(0, int(self._emitted * self.ratio) - self._pending_start))
+        self._pending = self._pending[consumed:]
+        self._pending_start += consumed
+        return resampled
+
+
+class PcmNormalizer:
+    """Downmixes, resamples to ``stt_sample_rate`` and trims leading silence, one block at a time.
+
+    Blocks may be of any size; a partial sample frame is carried over to the
+    next one. Audio before the first frame above the VAD threshold is held
+    back, at most ``max_leading_ms`` of it, and dropped except for
+    ``audio_trim_padding_ms`` once speech starts. If speech never starts the
+    held audio is returned untouched by flush() and ``heard_speech`` stays
+    False. Returns 16-bit mono PCM.
+    """
+
+    def __init__(self, sample_rate: int, channels: int = 1, sample_width: int = 2, max_leading_ms: int | None = None):
+        self.channels = channels
+        self.sample_width = sample_width
+        self._frame_bytes = channels * sample_width
+        self._partial = b""
+        self._resampler = _Resampler(sample_rate, settings.stt_sample_rate)
+        max_leading_ms = settings.stt_split_min_ms if max_leading_ms is None else max_leading_ms
+        self._max_leading = settings.stt_sample_rate * max_leading_ms // 1000
+        self._padding = settings.stt_sample_rate * settings.audio_trim_padding_ms // 1000
+        self._leading = np.empty(0, dtype=np.float32)
+        self._speaking = False
+
+    @property
+    def heard_speech(self) -> bool:
+        return self._speaking
+
+    def feed(self, pcm: bytes) -> bytes:
+        data = self._partial + pcm
+        whole = len(data) - len(data) % self._frame_bytes
+        self._partial = data[whole:]
+        samples = _to_float_mono(data[:whole], self.channels, self.sample_width)
+        return self._emit(self._resampler.feed(samples))
+
+    def flush(self) -> bytes:
+        pcm = self._emit(self._resampler.feed(np.empty(0, dtype=np.float32), final=True))
+        if not self._speaking:
+            pcm += _to_pcm16(self._leading)
+            self._leading = np.empty(0, dtype=np.float32)
+        return pcm
+
+    def _emit(self, samples: np.ndarray) -> bytes:
+        if self._speaking:
+            return _to_pcm16(samples)
+        held = np.concatenate([self._leading, samples])
+        speech = _speech_frames(held)
+        if speech.size:
+            self._speaking = True
+            self._leading = np.empty(0, dtype=np.float32)
+            return _to_pcm16(held[max(0, int(speech[0]) * _vad_frame() - self._padding):])
+        self._leading = held[max(0, held.size - self._max_leading):]
+        return b""
+
+
+def trim_trailing_silence(pcm: bytes) -> bytes:
+    """Drop trailing ``stt_sample_rate`` 16-bit frames below the VAD threshold, keeping some padding.
+
+    Audio with no frame above the threshold is returned untouched.
+    """
+    samples = np.frombuffer(pcm, dtype="<i2").astype(np.float32)
+    speech = _speech_frames(samples)
+    if speech.size == 0:
+        return pcm
+    padding = settings.stt_sample_rate * settings.audio_trim_padding_ms // 1000
+    end = min(samples.size, (int(speech[-1]) + 1) * _vad_frame() + padding)
+    return pcm[: end * 2]
+
+
+async def run_in_normalize_pool(fn: Callable[..., T], *args) -> T:
+    return await asyncio.get_running_loop().run_in_executor(_normalize_pool, fn, *args)
@@ -0,0 +1,101 @@
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO
+
+from starlette.datastructures import FormData
+from starlette.formparsers import MultiPartException, MultiPartParser
+from starlette.requests import Request
+
+from app.core.config import settings
+
+# Allowance for multipart boundaries, part headers and the small form fields
+# when checking Content-Length against the audio size cap.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+
+class AudioUploadBuffer:
+    """Bounded per-socket buffer for user audio sent as binary frames.
+
+    Chunks are appended to a spooled temp file that stays in memory for short
+    utterances and rolls over to disk for long ones, so the recording is never
+    held as one large bytes object or base64 string.
+    """
+
+    def __init__(self, max_bytes: int | None = None, spool_bytes: int | None = None):
+        self.max_bytes = max_bytes or settings.voice_upload_max_bytes
+        self.spool_bytes = spool_bytes or settings.voice_upload_spool_bytes
+        self.size = 0
+        self._file: SpooledTemporaryFile | None = None
+
+    def append(self, chunk: bytes):
+        if self.size + len(chunk) > self.max_bytes:
+            raise ValueError(f"Audio upload exceeds {self.max_bytes} bytes")
+        if self._file is None:
+            self._file = SpooledTemporaryFile(max_size=self.spool_bytes)
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def open(self) -> BinaryIO:
+        """Return the buffered audio rewound to the start, ready for reading."""
+        if self._file is None:
+            raise ValueError("No audio received")
+        self._file.seek(0)
+        return self._file
+
+    def reset(self):
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self.size = 0
+
+    def close(self):
+        self.reset()
+
+
+class UploadTooLarge(MultiPartException):
+    pass
+
+
+class _BoundedMultiPartParser(MultiPartParser):
+    """Multipart parser that spools file parts at our threshold and caps their size.
+
+    Raising from ``on_part_data`` aborts parsing mid-stream, and the parser
+    closes the temp files it already opened.
+    """
+
+    spool_max_size = settings.voice_upload_spool_bytes
+
+    def __init__(self, *args, max_file_bytes: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.max_file_bytes = max_file_bytes
+        self.file_bytes = 0
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._current_part.file is not None:
+            self.file_bytes += end - start
+            if self.file_bytes > self.max_file_bytes:
+                raise UploadTooLarge(f"Audio upload exceeds {self.max_file_bytes} bytes")
+        super().on_part_data(data, start, end)
+
+
+async def read_audio_form(request: Request, max_bytes: int | None = None) -> FormData:
+    """Parse a multipart audio upload straight from the request stream.
+
+    File parts go to spooled temp files (in memory up to
+    ``voice_upload_spool_bytes``, on disk beyond), so the upload is never held
+    as one bytes object. A request whose Content-Length already exceeds the
+    cap is rejected before its body is read; otherwise the file data is
+    counted as it arrives and parsing stops at the first byte over the cap.
+    The caller closes the returned form.
+    """
+    max_bytes = max_bytes or settings.voice_upload_max_bytes
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes + MULTIPART_OVERHEAD_BYTES:
+        raise UploadTooLarge(f"Audio upload exceeds {max_bytes} bytes")
+    if not request.headers.get("content-type", "").startswith("multipart/form-data"):
+        raise MultiPartException("Expected a multipart/form-data upload")
+
+    parser = _BoundedMultiPartParser(request.headers, request.stream(), max_file_bytes=max_bytes)
+    return await parser.parse()
@@ -0,0 +1,408 @@
+"""Offline stand-in for the OpenAI API, for load and capacity tests.
+
+The backend answers the chat, speech, transcription and model endpoints the
+app uses with deterministic content: interview questions, short
+acknowledgements, transcripts and silent audio. Every reply is delayed and
+sometimes failed according to a latency profile. It runs in-process as an
+httpx transport (``OPENAI_PROVIDER=fake``) or as a local HTTP server that
+the real client reaches through ``OPENAI_BASE_URL``:
+
+    python -m app.services.fake_openai --port 8900 --profile typical
+"""
+import argparse
+import asyncio
+import io
+import json
+import math
+import random
+import re
+import time
+import wave
+import zlib
+from dataclasses import dataclass, field
+from threading import Lock
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.services.question_shards import QuestionDeduper
+
+# Per endpoint: log-normal latency given by its median and 99th percentile,
+# the gap between streamed chat tokens, extra STT time per MB of audio, and
+# the share of calls answered with a 503, a 429 or no answer at all.
+PROFILES: dict[str, dict[str, dict[str, float]]] = {
+    "instant": {},
+    "typical": {
+        "chat": {"median_ms": 450, "p99_ms": 2500, "token_ms": 12},
+        "speech": {"median_ms": 350, "p99_ms": 1500},
+        "transcription": {"median_ms": 400, "p99_ms": 2000, "per_mb_ms": 300},
+    },
+    "degraded": {
+        "chat": {"median_ms": 1200, "p99_ms": 9000, "token_ms": 35, "error_rate": 0.03, "timeout_rate": 0.02},
+        "speech": {"median_ms": 900, "p99_ms": 6000, "error_rate": 0.08, "timeout_rate": 0.04},
+        "transcription": {"median_ms": 900, "p99_ms": 5000, "per_mb_ms": 800, "error_rate": 0.03},
+    },
+}
+# How long a simulated hang lasts when the caller set no timeout.
+HANG_SECONDS = 300.0
+# 99th percentile of the standard normal distribution.
+Z_99 = 2.326
+SPEECH_SAMPLE_RATE = 24000
+# Characters of text spoken per second of generated silence.
+SPEECH_CHARS_PER_SECOND = 15
+SPEECH_CHUNK_BYTES = 8192
+# One silent MPEG-1 Layer III frame: 128 kbit/s, 44.1 kHz, mono, 26 ms.
+MP3_FRAME = bytes([0xFF, 0xFB, 0x90, 0xC0]) + bytes(413)
+MP3_FRAME_SECONDS = 1152 / 44100
+
+TOPICS = [
+    "error handling", "unit testing", "performance tuning", "concurrency control",
+    "data modeling", "security hardening", "observability tooling", "deployment pipelines",
+    "caching layers", "API design", "incident debugging", "code review",
+    "dependency management", "horizontal scaling", "memory profiling", "schema migrations",
+]
+QUESTION_TEMPLATES = [
+    "How would you approach {topic} in a {tech} project?",
+    "Describe a time you had to improve {topic} while working with {tech}.",
+    "What trade-offs do you weigh around {topic} when using {tech}?",
+    "Walk me through how you would debug a {topic} problem in {tech}.",
+    "Which {tech} tools or patterns help you with {topic}, and why?",
+    "How would you explain {topic} in {tech} to a new teammate?",
+    "What mistakes do teams commonly make with {topic} in {tech}?",
+    "How do you measure whether {topic} is good enough in a {tech} codebase?",
+]
+ACKNOWLEDGEMENTS = [
+    "Thanks, that is a clear answer.",
+    "Good, that makes sense.",
+    "Thank you, that gives me a good picture.",
+    "Great, I appreciate the detail.",
+]
+TRANSCRIPTS = [
+    "I would start by measuring the problem and then fix the biggest bottleneck first.",
+    "In my last project I handled that with small, well tested changes.",
+    "I think the main trade-off is between simplicity and flexibility.",
+    "I would write a failing test, reproduce the issue and then fix it.",
+]
+
+
+def _line(prompt: str, label: str) -> str | None:
+    match = re.search(rf"^{label}: (.*)$", prompt, re.MULTILINE)
+    return match.group(1).strip() if match else None
+
+
+@dataclass
+class FakeReply:
+    """A response and its timing: ``first_byte_delay`` before the headers, then each chunk after its delay."""
+
+    status: int
+    headers: dict[str, str]
+    chunks: list[tuple[float, bytes]] = field(default_factory=list)
+    first_byte_delay: float = 0.0
+
+
+class FakeOpenAIBackend:
+    def __init__(self, profile: dict[str, dict[str, float]], seed: int = 0):
+        self.profile = profile
+        self._random = random.Random(seed)
+        self._lock = Lock()
+
+    @classmethod
+    def from_settings(cls) -> "FakeOpenAIBackend":
+        return cls(load_profile(settings.fake_openai_profile), settings.fake_openai_seed)
+
+    def _sample(self, endpoint: str) -> tuple[float, str | None]:
+        """(latency in seconds, failure kind or None) for one call."""
+        spec = self.profile.get(endpoint, {})
+        median = spec.get("median_ms", 0.0) / 1000
+        p99 = max(spec.get("p99_ms", 0.0) / 1000, median)
+        with self._lock:
+            latency = median
+            if median > 0:
+                latency = median * math.exp(math.log(p99 / median) / Z_99 * self._random.gauss(0.0, 1.0))
+            draw = self._random.random()
+        failure = None
+        for kind in ("timeout", "error", "rate_limit"):
+            rate = spec.get(f"{kind}_rate", 0.0)
+            if draw < rate:
+                failure = kind
+                break
+            draw -= rate
+        return latency, failure
+
+    def reply(self, method: str, path: str, body: bytes, content_type: str = "") -> FakeReply:
+        if path.endswith("/chat/completions"):
+            endpoint = "chat"
+        elif path.endswith("/audio/speech"):
+            endpoint = "speech"
+        elif path.endswith("/audio/transcriptions"):
+            endpoint = "transcription"
+        elif "/models/" in path and method == "GET":
+            model = path.rsplit("/", 1)[-1]
+            return self._json(200, {"id": model, "object": "model", "created": 0, "owned_by": "fake"})
+        else:
+            return self._json(404, {"error": {"message": f"Unknown endpoint {path}", "type": "invalid_request_error"}})
+
+        latency, failure = self._sample(endpoint)
+        if failure == "timeout":
+            return FakeReply(504, {}, first_byte_delay=HANG_SECONDS)
+        if failure == "error":
+            reply = self._json(503, {"error": {"message": "Simulated server error", "type": "server_error"}})
+        elif failure == "rate_limit":
+            reply = self._json(429, {"error": {"message": "Simulated rate limit", "type": "rate_limit_error"}})
+            reply.headers["retry-after"] = "1"
+        elif endpoint == "chat":
+            return self._chat(json.loads(body), latency)
+        elif endpoint == "speech":
+            reply = self._speech(json.loads(body))
+        else:
+            reply = self._transcription(body, content_type)
+            latency += len(body) / (1024 * 1024) * self.profile.get(endpoint, {}).get("per_mb_ms", 0.0) / 1000
+        reply.first_byte_delay = latency
+        return reply
+
+    @staticmethod
+    def _json(status: int, data: dict) -> FakeReply:
+        return FakeReply(status, {"content-type": "application/json"}, [(0.0, json.dumps(data).encode())])
+
+    def _chat(self, request: dict, latency: float) -> FakeReply:
+        prompt = "\n".join(str(message.get("content") or "") for message in request.get("messages", []))
+        content = self._questions(prompt) if _line(prompt, "Amount") else self._turn_reply(prompt)
+        pieces = [word + " " for word in content.split(" ")]
+        pieces[-1] = pieces[-1][:-1]
+        token_seconds = self.profile.get("chat", {}).get("token_ms", 0.0) / 1000
+        model = request.get("model", "fake")
+        if not request.get("stream"):
+            message = {"role": "assistant", "content": content}
+            data = {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+                "usage": {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(pieces),
+                          "total_tokens": len(prompt) // 4 + len(pieces)},
+            }
+            reply = self._json(200, data)
+            reply.first_byte_delay = latency + token_seconds * len(pieces)
+            return reply
+
+        chunks = []
+        for index, piece in enumerate(pieces):
+            delta = {"role": "assistant", "content": piece} if index == 0 else {"content": piece}
+            data = {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": None}],
+            }
+            chunks.append((token_seconds if index else 0.0, f"data: {json.dumps(data)}\n\n".encode()))
+        chunks.append((0.0, b"data: [DONE]\n\n"))
+        return FakeReply(200, {"content-type": "text/event-stream"}, chunks, latency)
+
+    @staticmethod
+    def _questions(prompt: str) -> str:
+        """``Amount`` distinct questions; shards and top-ups get their own, as a real model would."""
+        amount = int(_line(prompt, "Amount") or 1)
+        techstack = [item.strip() for item in (_line(prompt, "Tech Stack") or "").split(",") if item.strip()]
+        techstack = techstack or ["software"]
+        focus = _line(prompt, "Focus") or ""
+        shard = 0
+        band = re.match(r"Difficulty band (\d+) of", focus)
+        if band:
+            shard = int(band.group(1)) - 1
+        elif focus.startswith("Only ask about "):
+            focused = [item.strip() for item in focus[len("Only ask about "):].rstrip(".").split(",")]
+            shard = techstack.index(focused[0]) if focused[0] in techstack else 0
+            techstack = focused
+        deduper = QuestionDeduper()
+        avoided = re.findall(r"^- (.*)$", prompt, re.MULTILINE)
+        deduper.filter(avoided)
+
+        questions: list[str] = []
+        for k in range(shard * (amount + 1), shard * (amount + 1) + 4 * len(TOPICS) * len(QUESTION_TEMPLATES)):
+            template = QUESTION_TEMPLATES[k % len(QUESTION_TEMPLATES)]
+            topic = TOPICS[(k // len(QUESTION_TEMPLATES)) % len(TOPICS)]
+            question = template.format(topic=topic, tech=techstack[k % len(techstack)])
+            if deduper.add(question):
+                questions.append(question)
+                if len(questions) >= amount:
+                    break
+        return json.dumps({"questions": questions})
+
+    @staticmethod
+    def _turn_reply(prompt: str) -> str:
+        answer = _line(prompt, "Candidate answer") or _line(prompt, "User response") or ""
+        acknowledgement = ACKNOWLEDGEMENTS[zlib.crc32(answer.encode()) % len(ACKNOWLEDGEMENTS)]
+        following = _line(prompt, "Next question") or _line(prompt, "Next prompt")
+        if following and following != "NONE":
+            return f"{acknowledgement} {following}"
+        if following == "NONE" or "close the interview" in prompt:
+            return f"{acknowledgement} That concludes our interview, thank you for your time."
+        return acknowledgement
+
+    @staticmethod
+    def _speech(request: dict) -> FakeReply:
+        seconds = max(0.5, len(request.get("input", "")) / SPEECH_CHARS_PER_SECOND)
+        audio_format = request.get("response_format", "mp3")
+        audio = silent_audio(audio_format, seconds)
+        chunks = [(0.0, audio[offset:offset + SPEECH_CHUNK_BYTES]) for offset in range(0, len(audio), SPEECH_CHUNK_BYTES)]
+        content_type = "audio/mpeg" if audio_format == "mp3" else f"audio/{audio_format}"
+        return FakeReply(200, {"content-type": content_type}, chunks)
+
+    def _transcription(self, body: bytes, content_type: str) -> FakeReply:
+        audio = _multipart_file(body, content_type)
+        text = settings.fake_openai_transcript or TRANSCRIPTS[zlib.crc32(audio) % len(TRANSCRIPTS)]
+        return self._json(200, {"text": text})
+
+
+def silent_audio(audio_format: str, seconds: float) -> bytes:
+    """Silence of about ``seconds``: valid mp3, wav and 24 kHz pcm; zero-filled placeholders otherwise."""
+    samples = int(SPEECH_SAMPLE_RATE * seconds)
+    if audio_format == "pcm":
+        return bytes(samples * 2)
+    if audio_format == "wav":
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(SPEECH_SAMPLE_RATE)
+            wav.writeframes(bytes(samples * 2))
+        return buffer.getvalue()
+    frames = math.ceil(seconds / MP3_FRAME_SECONDS)
+    if audio_format == "mp3":
+        return MP3_FRAME * frames
+    return bytes(len(MP3_FRAME) * frames)
+
+
+def _multipart_file(body: bytes, content_type: str) -> bytes:
+    """The ``file`` part of a multipart upload, or the whole body if there is none."""
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if not match:
+        return body
+    for part in body.split(b"--" + match.group(1).encode()):
+        head, _, content = part.partition(b"\r\n\r\n")
+        if b'name="file"' in head:
+            return content[:-2] if content.endswith(b"\r\n") else content
+    return body
+
+
+def load_profile(value: str) -> dict[str, dict[str, float]]:
+    """A profile by name, or a JSON object of per-endpoint settings (``"base"`` names a profile to extend)."""
+    if not value.lstrip().startswith("{"):
+        if value not in PROFILES:
+            raise ValueError(f"Unknown fake OpenAI profile: {value}. Use one of: {', '.join(PROFILES)}")
+        return PROFILES[value]
+    custom = json.loads(value)
+    profile = {endpoint: dict(spec) for endpoint, spec in PROFILES[custom.pop("base", "instant")].items()}
+    for endpoint, spec in custom.items():
+        profile.setdefault(endpoint, {}).update(spec)
+    return profile
+
+
+def _read_timeout(request: httpx.Request) -> float | None:
+    return (request.extensions.get("timeout") or {}).get("read")
+
+
+class FakeOpenAITransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Serves FakeOpenAIBackend replies in-process to both the sync and the async client.
+
+    Delays honour the request's read timeout the way a network transport
+    would, by raising httpx.ReadTimeout once it has passed.
+    """
+
+    def __init__(self, backend: FakeOpenAIBackend):
+        self.backend = backend
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        reply = self.backend.reply(
+            request.method, request.url.path, request.read(), request.headers.get("content-type", "")
+        )
+        timeout = _read_timeout(request)
+
+        def wait(delay: float):
+            if timeout is not None and delay > timeout:
+                time.sleep(timeout)
+                raise httpx.ReadTimeout("Simulated read timeout", request=request)
+            time.sleep(delay)
+
+        def body():
+            for delay, chunk in reply.chunks:
+                wait(delay)
+                yield chunk
+
+        wait(reply.first_byte_delay)
+        return httpx.Response(reply.status, headers=reply.headers, content=body(), request=request)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        reply = self.backend.reply(
+            request.method, request.url.path, await request.aread(), request.headers.get("content-type", "")
+        )
+        timeout = _read_timeout(request)
+
+        async def wait(delay: float):
+            if timeout is not None and delay > timeout:
+                await asyncio.sleep(timeout)
+                raise httpx.ReadTimeout("Simulated read timeout", request=request)
+            await asyncio.sleep(delay)
+
+        async def body():
+            for delay, chunk in reply.chunks:
+                await wait(delay)
+                yield chunk
+
+        await wait(reply.first_byte_delay)
+        return httpx.Response(reply.status, headers=reply.headers, content=body(), request=request)
+
+
+_transport: FakeOpenAITransport | None = None
+_transport_lock = Lock()
+
+
+def fake_transport() -> FakeOpenAITransport:
+    """The process-wide fake transport, built from the FAKE_OPENAI_* settings on first use."""
+    global _transport
+    with _transport_lock:
+        if _transport is None:
+            _transport = FakeOpenAITransport(FakeOpenAIBackend.from_settings())
+        return _transport
+
+
+def create_app(backend: FakeOpenAIBackend) -> FastAPI:
+    """The fake as an HTTP server, answering under ``/v1`` like the real API."""
+    app = FastAPI(title="Fake OpenAI")
+
+    @app.api_route("/v1/{path:path}", methods=["GET", "POST"])
+    async def handle(path: str, request: Request):
+        reply = backend.reply(
+            request.method, f"/v1/{path}", await request.body(), request.headers.get("content-type", "")
+        )
+        await asyncio.sleep(reply.first_byte_delay)
+
+        async def body():
+            for delay, chunk in reply.chunks:
+                await asyncio.sleep(delay)
+                yield chunk
+
+        return StreamingResponse(body(), status_code=reply.status, headers=reply.headers)
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the fake OpenAI API for offline load tests.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--profile", default=settings.fake_openai_profile, help="profile name or JSON object")
+    parser.add_argument("--seed", type=int, default=settings.fake_openai_seed)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    uvicorn.run(create_app(FakeOpenAIBackend(load_profile(args.profile), args.seed)), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
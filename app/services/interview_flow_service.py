@@ -128,6 +128,11 @@ NUMBER_WORDS = {
     "thirty": 30,
 }
 
+AMOUNT_ERRORS = (
+    "Please provide a number between 1 and 30.",
+    "Amount must be between 1 and 30.",
+)
+
 
 @dataclass
 class CollectorProgress:
@@ -148,6 +153,31 @@ class InterviewFlowService:
             "Are you ready to begin?"
         )
 
+    @staticmethod
+    def build_question_prompt(question: str, question_index: int) -> str:
+        """What the interviewer says when (re)opening a session at ``question_index``."""
+        if question_index == 0:
+            return f"Great, let’s begin. First question: {question}"
+        return f"Welcome back. Next question: {question}"
+
+    @staticmethod
+    def build_next_question_prompt(question: str) -> str:
+        """Transition to the next question in split-reply mode, after the live acknowledgement."""
+        return f"Next question: {question}"
+
+    @staticmethod
+    def build_split_reply(acknowledgement: str, next_question: str | None) -> str:
+        if next_question is None:
+            return acknowledgement
+        return f"{acknowledgement} {InterviewFlowService.build_next_question_prompt(next_question)}"
+
+    @staticmethod
+    def build_fallback_turn_reply(next_question: str | None) -> str:
+        """Fixed interview reply for when the live one fails partway through."""
+        if next_question is None:
+            return "Thank you, that was the last question. The interview is complete."
+        return f"Thank you. {InterviewFlowService.build_next_question_prompt(next_question)}"
+
     @staticmethod
     def detect_turn_intent(field_name: str, user_message: str) -> str:
         text = " ".join(user_message.lower().strip().split())
@@ -190,6 +220,35 @@ class InterviewFlowService:
             return "No worries at all. Take your time, and tell me when you’re ready to start."
         return FIELD_PROMPTS[field_name]
 
+    @staticmethod
+    def build_invalid_value_reply(field_name: str, error: Exception | str) -> str:
+        return f"Thanks. I need a valid value for {field_name}: {error}"
+
+    @staticmethod
+    def build_unclear_value_reply(field_name: str) -> str:
+        return f"Thanks. Could you provide {field_name} in a clear format?"
+
+    @staticmethod
+    def build_correction_failed_reply(field_name: str, error: Exception | str) -> str:
+        return f"Got it. I couldn’t update {field_name} yet: {error}"
+
+    @staticmethod
+    def static_assistant_messages() -> list[str]:
+        """Every assistant message that does not depend on user input.
+
+        These are the texts worth keeping pre-synthesized in the speech cache.
+        """
+        messages = [InterviewFlowService.build_opening_prompt(None)]
+        messages.extend(FIELD_PROMPTS.values())
+        for field_name in COLLECT_FIELDS:
+            for intent in ("repeat", "examples", "clarify", "not_ready"):
+                messages.append(InterviewFlowService.build_intent_reply(field_name, intent))
+            messages.append(InterviewFlowService.build_unclear_value_reply(field_name))
+        for error in AMOUNT_ERRORS:
+            messages.append(InterviewFlowService.build_invalid_value_reply("amount", error))
+            messages.append(InterviewFlowService.build_correction_failed_reply("amount", error))
+        return list(dict.fromkeys(messages))
+
     @staticmethod
     def get_previous_field(current_field: str) -> str | None:
         idx = COLLECT_FIELDS.index(current_field)
@@ -283,7 +342,7 @@ class InterviewFlowService:
         if normalized in NUMBER_WORDS:
             return NUMBER_WORDS[normalized]
 
-        raise ValueError("Please provide a number between 1 and 30.")
+        raise ValueError(AMOUNT_ERRORS[0])
 
     @staticmethod
     def normalize_field_value(field_name: str, user_message: str):
@@ -297,7 +356,7 @@ class InterviewFlowService:
         if field_name == "amount":
             amount = InterviewFlowService.parse_amount(value)
             if amount < 1 or amount > 30:
-                raise ValueError("Amount must be between 1 and 30.")
+                raise ValueError(AMOUNT_ERRORS[1])
             return amount
         return value
 
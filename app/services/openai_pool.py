@@ -0,0 +1,210 @@
+import asyncio
+import importlib.util
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from weakref import WeakSet
+
+import httpx
+from fastapi.concurrency import run_in_threadpool
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from app.core.config import settings
+from app.services.fake_openai import fake_transport
+from app.services.provider_scheduler import admit_request, admit_request_async, observe_response
+
+logger = logging.getLogger(__name__)
+
+# A warm-up request must never hold up startup for long.
+WARMUP_TIMEOUT_SECONDS = 5.0
+# The fake provider accepts any key; this one stands in when none is configured.
+FAKE_API_KEY = "sk-fake"
+
+
+class ConnectionMetrics:
+    """Counts requests per upstream connection, so pool reuse can be checked in production.
+
+    httpx exposes the socket a response came over as its ``network_stream``;
+    a stream seen before means the request reused a kept-alive connection.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._streams: WeakSet = WeakSet()
+        self.requests = 0
+        self.new_connections = 0
+        self.reused_connections = 0
+
+    def observe(self, response: httpx.Response):
+        stream = response.extensions.get("network_stream")
+        with self._lock:
+            self.requests += 1
+            if stream is None:
+                return
+            if stream in self._streams:
+                self.reused_connections += 1
+            else:
+                self._streams.add(stream)
+                self.new_connections += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            observed = self.new_connections + self.reused_connections
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused_connections": self.reused_connections,
+                "reuse_ratio": round(self.reused_connections / observed, 3) if observed else None,
+            }
+
+
+def http2_enabled() -> bool:
+    """HTTP/2 multiplexes concurrent calls over one connection, but needs the optional h2 package."""
+    return settings.openai_http2 and importlib.util.find_spec("h2") is not None
+
+
+def provider_api_key() -> str | None:
+    """The key to call the provider with, or None when calls cannot be made."""
+    if settings.openai_provider == "fake":
+        return settings.openai_api_key or FAKE_API_KEY
+    return settings.openai_api_key
+
+
+def _provider_options() -> dict:
+    """httpx client options for ``openai_provider``: the real network, or the in-process fake."""
+    if settings.openai_provider == "openai":
+        return {}
+    if settings.openai_provider == "fake":
+        return {"transport": fake_transport()}
+    raise ValueError(f"Unsupported OPENAI_PROVIDER: {settings.openai_provider}. Use openai or fake.")
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.openai_max_connections,
+        max_keepalive_connections=settings.openai_max_keepalive_connections,
+        keepalive_expiry=settings.openai_keepalive_expiry_seconds,
+    )
+
+
+class OpenAIClientPool:
+    """One sync and one async OpenAI client per worker process, sharing their connection pools.
+
+    The async client is bound to the event loop it was first used on; a
+    different loop (only seen in tests) gets a fresh client.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._sync_client: OpenAI | None = None
+        self._async_client: AsyncOpenAI | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self.sync_metrics = ConnectionMetrics()
+        self.async_metrics = ConnectionMetrics()
+
+    def sync_client(self, api_key: str) -> OpenAI:
+        with self._lock:
+            if self._sync_client is None:
+                http_client = DefaultHttpxClient(
+                    limits=_limits(),
+                    http2=http2_enabled(),
+                    event_hooks={
+                        "request": [admit_request],
+                        "response": [self.sync_metrics.observe, observe_response],
+                    },
+                    **_provider_options(),
+                )
+                self._sync_client = OpenAI(api_key=api_key, base_url=settings.openai_base_url, http_client=http_client)
+            return self._sync_client
+
+    def async_client(self, api_key: str) -> AsyncOpenAI:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._async_client is None or self._async_loop is not loop:
+
+                async def observe(response: httpx.Response):
+                    self.async_metrics.observe(response)
+                    observe_response(response)
+
+                http_client = DefaultAsyncHttpxClient(
+                    limits=_limits(),
+                    http2=http2_enabled(),
+                    event_hooks={"request": [admit_request_async], "response": [observe]},
+                    **_provider_options(),
+                )
+                self._async_client = AsyncOpenAI(
+                    api_key=api_key, base_url=settings.openai_base_url, http_client=http_client
+                )
+                self._async_loop = loop
+            return self._async_client
+
+    async def warm(self):
+        """Open ``openai_warm_connections`` connections per client before the first real call.
+
+        Each warm-up is a cheap model lookup; failures are logged as a warning
+        and ignored, since the first real call will simply connect on its own.
+        The fake provider runs in-process and has no connections to warm.
+        """
+        api_key = provider_api_key()
+        if not api_key or settings.openai_warm_connections <= 0 or settings.openai_provider == "fake":
+            return
+        count = settings.openai_warm_connections
+        async_client = self.async_client(api_key).with_options(
+            max_retries=0, timeout=WARMUP_TIMEOUT_SECONDS
+        )
+        sync_client = self.sync_client(api_key).with_options(
+            max_retries=0, timeout=WARMUP_TIMEOUT_SECONDS
+        )
+
+        def retrieve_sync(_):
+            try:
+                return sync_client.models.retrieve(settings.openai_model)
+            except Exception as exc:
+                return exc
+
+        def warm_sync():
+            # Sequential calls would reuse one connection; overlap them instead.
+            with ThreadPoolExecutor(max_workers=count) as pool:
+                return list(pool.map(retrieve_sync, range(count)))
+
+        connections_before = self.sync_metrics.new_connections + self.async_metrics.new_connections
+        sync_results, *async_results = await asyncio.gather(
+            run_in_threadpool(warm_sync),
+            *(async_client.models.retrieve(settings.openai_model) for _ in range(count)),
+            return_exceptions=True,
+        )
+        if isinstance(sync_results, BaseException):
+            sync_results = [sync_results] * count
+        failures = [result for result in [*sync_results, *async_results] if isinstance(result, BaseException)]
+        opened = self.sync_metrics.new_connections + self.async_metrics.new_connections - connections_before
+        if failures or opened == 0:
+            logger.warning(
+                "openai warm-up incomplete: requested=%d opened=%d failed=%d http2=%s error=%r",
+                2 * count, opened, len(failures), http2_enabled(), failures[0] if failures else None,
+            )
+        else:
+            logger.info("openai warm-up done: requested=%d opened=%d http2=%s", 2 * count, opened, http2_enabled())
+
+    async def close(self):
+        with self._lock:
+            sync_client, self._sync_client = self._sync_client, None
+            async_client, self._async_client = self._async_client, None
+            self._async_loop = None
+        if sync_client is not None:
+            sync_client.close()
+        if async_client is not None:
+            await async_client.close()
+
+    def metrics(self) -> dict:
+        return {
+            "provider": settings.openai_provider,
+            "http2": http2_enabled(),
+            "max_connections": settings.openai_max_connections,
+            "max_keepalive_connections": settings.openai_max_keepalive_connections,
+            "keepalive_expiry_seconds": settings.openai_keepalive_expiry_seconds,
+            "sync": self.sync_metrics.snapshot(),
+            "async": self.async_metrics.snapshot(),
+        }
+
+
+openai_pool = OpenAIClientPool()
@@ -1,19 +1,291 @@
+import asyncio
 import json
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from queue import Queue
+from threading import Event
+from typing import AsyncIterator, BinaryIO, Iterator, List
 
-from openai import OpenAI
+from fastapi.concurrency import run_in_threadpool
 
+from app.core.audio_cache import speech_cache
 from app.core.config import settings
+from app.core.question_set_cache import question_set_cache
 from app.schemas.interview import InterviewSetupPayload
+from app.services.openai_pool import openai_pool, provider_api_key
+from app.services.provider_guard import (
+    CHAT,
+    SPEECH,
+    TRANSCRIPTION,
+    provider_guard,
+    transcription_deadline,
+    turn_deadline,
+)
+from app.services.provider_scheduler import PRIORITY_HEADER, Priority, scheduler_headers
+from app.services.question_shards import QuestionDeduper, merge_shards, plan_shards
 
 
-class OpenAIService:
+# Speech formats a session may negotiate, with the content type sent to
+# clients. "pcm" is OpenAI's raw 24 kHz 16-bit little-endian mono stream.
+SPEECH_FORMATS = {
+    "mp3": "audio/mp3",
+    "opus": "audio/ogg; codecs=opus",
+    "aac": "audio/aac",
+    "flac": "audio/flac",
+    "wav": "audio/wav",
+    "pcm": "audio/pcm; rate=24000; bits=16; channels=1",
+}
+
+
+def _require_api_key() -> str:
+    api_key = provider_api_key()
+    if not api_key:
+        raise RuntimeError("OPENAI_API_KEY is not configured. Set it in deployment environment variables.")
+    return api_key
+
+
+def _scheduled(client, priority: Priority, user_id: str | None):
+    """The shared client, tagging every request with its scheduler priority and user."""
+    return client.with_options(default_headers=scheduler_headers(priority, user_id))
+
+
+def _file_size(audio_file: BinaryIO) -> int:
+    position = audio_file.tell()
+    size = audio_file.seek(0, 2)
+    audio_file.seek(position)
+    return size
+
+
+# Question generation is bulk work: it always queues behind conversation turns.
+GENERATION_HEADERS = {PRIORITY_HEADER: str(int(Priority.BACKGROUND))}
+# Marks the end of one shard's stream on the queue shared by all shards.
+_SHARD_DONE = object()
+
+
+def _speech_format(audio_format: str | None) -> str:
+    audio_format = audio_format or settings.openai_tts_format
+    if audio_format not in SPEECH_FORMATS:
+        raise ValueError(f"Unsupported audio format: {audio_format}")
+    return audio_format
+
+
+class QuestionArrayParser:
+    """Incrementally extracts the strings of a streamed ``{"questions": [...]}`` document.
+
+    Text before the array (a code fence, the opening brace) is skipped; each
+    string is returned as soon as its closing quote arrives.
+    """
+
     def __init__(self):
-        if not settings.openai_api_key:
-            raise RuntimeError("OPENAI_API_KEY is not configured. Set it in deployment environment variables.")
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        self._buffer = ""
+        self._pos = 0
+        self._in_array = False
+        self.complete = False
+
+    def feed(self, text: str) -> list[str]:
+        self._buffer += text
+        questions = []
+        buffer = self._buffer
+        while not self.complete:
+            if not self._in_array:
+                key = buffer.find('"questions"', self._pos)
+                bracket = buffer.find("[", key) if key >= 0 else -1
+                if bracket < 0:
+                    break
+                self._in_array = True
+                self._pos = bracket + 1
+                continue
+
+            while self._pos < len(buffer) and buffer[self._pos] in " \t\r\n,":
+                self._pos += 1
+            if self._pos >= len(buffer):
+                break
+            if buffer[self._pos] == "]":
+                self.complete = True
+                break
+            if buffer[self._pos] != '"':
+                raise ValueError("OpenAI returned invalid question payload.")
+            end = self._string_end(buffer, self._pos)
+            if end < 0:
+                break
+            question = json.loads(buffer[self._pos:end + 1]).strip()
+            if question:
+                questions.append(question)
+            self._pos = end + 1
+        return questions
+
+    @staticmethod
+    def _string_end(buffer: str, start: int) -> int:
+        index = start + 1
+        while index < len(buffer):
+            char = buffer[index]
+            if char == "\\":
+                index += 2
+                continue
+            if char == '"':
+                return index
+            index += 1
+        return -1
+
+
+def _shard_results(results: list) -> list[list[str]]:
+    """Shard batches with failed shards left empty for the top-up; fails only if every shard failed."""
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if len(errors) == len(results):
+        raise errors[0]
+    return [[] if isinstance(result, BaseException) else result for result in results]
+
+
+class OpenAIService:
+    def __init__(
+        self, audio_format: str | None = None, priority: Priority = Priority.INTERACTIVE, user_id: str | None = None
+    ):
+        self.client = _scheduled(openai_pool.sync_client(_require_api_key()), priority, user_id)
+        # Live calls get one attempt within their deadline: a retry cannot fit the turn budget.
+        self.live_client = self.client.with_options(max_retries=0)
+        self.audio_format = _speech_format(audio_format)
+
+    def generate_interview_questions(self, payload: InterviewSetupPayload, use_cache: bool = True) -> List[str]:
+        """Questions for a setup, shared through the question-set cache by identical setups.
 
-    def generate_interview_questions(self, payload: InterviewSetupPayload) -> List[str]:
+        ``use_cache=False`` always generates a fresh set, for callers that
+        want new questions rather than a stored variant.
+        """
+        if not use_cache:
+            return self._generate_questions(payload)
+        return question_set_cache.get_or_generate(payload, lambda: self._generate_questions(payload))
+
+    def stream_interview_questions(self, payload: InterviewSetupPayload) -> Iterator[str]:
+        """Yield questions one by one while the model is still writing the rest.
+
+        Large sets stream from several shards at once, in arrival order.
+        Near-duplicates are skipped, and the set is topped up to exactly
+        ``payload.amount``. Raises ValueError if it cannot be completed.
+        """
+        shards, _ = plan_shards(payload)
+        if len(shards) == 1:
+            source = self._stream_batch(payload)
+        else:
+            source = self._stream_shards([(shard.payload, shard.focus) for shard in shards])
+        deduper = QuestionDeduper()
+        questions = []
+        try:
+            for question in source:
+                if not deduper.add(question):
+                    continue
+                questions.append(question)
+                yield question
+                if len(questions) >= payload.amount:
+                    return
+        finally:
+            source.close()
+        yield from self._top_up(payload, questions, deduper)
+
+    def _stream_batch(
+        self, payload: InterviewSetupPayload, focus: str | None = None, avoid: list[str] | None = None
+    ) -> Iterator[str]:
+        with provider_guard.guard(CHAT):
+            stream = self.client.chat.completions.create(
+                model=settings.openai_model,
+                temperature=0.5,
+                messages=self._question_messages(payload, focus, avoid),
+                stream=True,
+                extra_headers=GENERATION_HEADERS,
+                timeout=settings.provider_generation_timeout_seconds,
+            )
+            parser = QuestionArrayParser()
+            count = 0
+            with stream:
+                for chunk in stream:
+                    if not chunk.choices or not chunk.choices[0].delta.content:
+                        continue
+                    for question in parser.feed(chunk.choices[0].delta.content):
+                        yield question
+                        count += 1
+        if not parser.complete and count == 0:
+            raise ValueError("OpenAI returned invalid question payload.")
+
+    def _stream_shards(self, shards: list[tuple[InterviewSetupPayload, str | None]]) -> Iterator[str]:
+        queue: Queue = Queue()
+        stop = Event()
+
+        def produce(payload: InterviewSetupPayload, focus: str | None):
+            try:
+                for question in self._stream_batch(payload, focus):
+                    if stop.is_set():
+                        return
+                    queue.put(question)
+            except Exception as exc:
+                queue.put(exc)
+            finally:
+                queue.put(_SHARD_DONE)
+
+        with ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="question-shard") as pool:
+            try:
+                for payload, focus in shards:
+                    pool.submit(produce, payload, focus)
+                finished, errors = 0, []
+                while finished < len(shards):
+                    item = queue.get()
+                    if item is _SHARD_DONE:
+                        finished += 1
+                    elif isinstance(item, Exception):
+                        errors.append(item)
+                    else:
+                        yield item
+                if len(errors) == len(shards):
+                    raise errors[0]
+            finally:
+                stop.set()
+
+    def _generate_questions(self, payload: InterviewSetupPayload) -> List[str]:
+        """Generate a full set, split into concurrent shards when it is large."""
+        shards, interleave = plan_shards(payload)
+        if len(shards) == 1:
+            batches = [self._generate_batch(payload)]
+        else:
+            with ThreadPoolExecutor(max_workers=len(shards), thread_name_prefix="question-shard") as pool:
+                futures = [pool.submit(self._generate_batch, shard.payload, shard.focus) for shard in shards]
+            batches = _shard_results([future.exception() or future.result() for future in futures])
+        deduper = QuestionDeduper()
+        questions = deduper.filter(merge_shards(batches, interleave))[: payload.amount]
+        return questions + self._top_up(payload, questions, deduper)
+
+    def _generate_batch(
+        self, payload: InterviewSetupPayload, focus: str | None = None, avoid: list[str] | None = None
+    ) -> List[str]:
+        with provider_guard.guard(CHAT):
+            response = self.client.chat.completions.create(
+                model=settings.openai_model,
+                temperature=0.5,
+                messages=self._question_messages(payload, focus, avoid),
+                extra_headers=GENERATION_HEADERS,
+                timeout=settings.provider_generation_timeout_seconds,
+            )
+        return self._parse_questions(response.choices[0].message.content)
+
+    def _top_up(self, payload: InterviewSetupPayload, questions: list[str], deduper: QuestionDeduper) -> List[str]:
+        """Questions that bring ``questions`` up to ``payload.amount``, asking for the shortfall again."""
+        added: list[str] = []
+        for _ in range(settings.question_top_up_attempts):
+            missing = payload.amount - len(questions) - len(added)
+            if missing <= 0:
+                break
+            batch = self._generate_batch(
+                payload.model_copy(update={"amount": missing}), avoid=questions + added
+            )
+            added.extend(deduper.filter(batch)[:missing])
+        if len(questions) + len(added) < payload.amount:
+            raise ValueError("OpenAI returned too few distinct questions.")
+        return added
+
+    @staticmethod
+    def _question_messages(
+        payload: InterviewSetupPayload, focus: str | None = None, avoid: list[str] | None = None
+    ) -> list[dict]:
+        extra = f"Focus: {focus}\n" if focus else ""
+        if avoid:
+            extra += "Do not repeat or rephrase any of these questions:\n" + "".join(f"- {q}\n" for q in avoid)
         prompt = (
             "You are an expert technical interviewer. "
             "Generate interview questions for a candidate with this configuration:\n"
@@ -21,7 +293,8 @@ class OpenAIService:
             f"Interview Type: {payload.interview_type}\n"
             f"Level: {payload.level}\n"
             f"Tech Stack: {', '.join(payload.techstack)}\n"
-            f"Amount: {payload.amount}\n\n"
+            f"Amount: {payload.amount}\n"
+            f"{extra}\n"
             "Rules:\n"
             "1) Return exactly the requested number of questions.\n"
             "2) Questions should be concise and clear.\n"
@@ -29,26 +302,23 @@ class OpenAIService:
             "4) No headings or numbering in the question text itself.\n"
             "Return JSON only in this format: {\"questions\": [\"...\", \"...\"]}."
         )
+        return [
+            {"role": "system", "content": "You return valid JSON only."},
+            {"role": "user", "content": prompt},
+        ]
 
-        response = self.client.chat.completions.create(
-            model=settings.openai_model,
-            temperature=0.5,
-            messages=[
-                {"role": "system", "content": "You return valid JSON only."},
-                {"role": "user", "content": prompt},
-            ],
-        )
-
-        raw = response.choices[0].message.content or "{}"
-        cleaned = self._strip_json_fences(raw)
+    @classmethod
+    def _parse_questions(cls, raw: str | None) -> List[str]:
+        """The non-empty questions of a response; the caller tops up any shortfall."""
+        cleaned = cls._strip_json_fences(raw or "{}")
         data = json.loads(cleaned)
-        questions = data.get("questions", [])
+        questions = data.get("questions", []) if isinstance(data, dict) else None
 
-        if not isinstance(questions, list) or len(questions) != payload.amount:
+        if not isinstance(questions, list):
             raise ValueError("OpenAI returned invalid question payload.")
 
         normalized = [str(q).strip() for q in questions if str(q).strip()]
-        if len(normalized) != payload.amount:
+        if not normalized:
             raise ValueError("OpenAI returned empty or malformed questions.")
 
         return normalized
@@ -63,6 +333,21 @@ class OpenAIService:
         return stripped
 
     def build_collector_reply(self, field_name: str, user_response: str, next_field_prompt: str | None) -> str:
+        return self._turn_reply(self._collector_reply_messages(field_name, user_response, next_field_prompt))
+
+    def _turn_reply(self, messages: list[dict], **options) -> str:
+        """A short live completion within the chat deadline, hedged against tail latency."""
+
+        def attempt(timeout: float):
+            return self.live_client.chat.completions.create(
+                model=settings.openai_model, temperature=0.7, messages=messages, timeout=timeout, **options
+            )
+
+        response = provider_guard.hedged(CHAT, attempt)
+        return (response.choices[0].message.content or "").strip()
+
+    @staticmethod
+    def _collector_reply_messages(field_name: str, user_response: str, next_field_prompt: str | None) -> list[dict]:
         user_prompt = (
             "You are a warm voice interview assistant collecting setup details. "
             "Acknowledge the user's answer naturally in one short sentence. "
@@ -71,22 +356,19 @@ class OpenAIService:
             f"User response: {user_response}\n"
             f"Next prompt: {next_field_prompt or 'NONE'}"
         )
-
-        response = self.client.chat.completions.create(
-            model=settings.openai_model,
-            temperature=0.7,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "Speak naturally and briefly, with no bullet points.",
-                },
-                {"role": "user", "content": user_prompt},
-            ],
-        )
-
-        return (response.choices[0].message.content or "").strip()
+        return [
+            {
+                "role": "system",
+                "content": "Speak naturally and briefly, with no bullet points.",
+            },
+            {"role": "user", "content": user_prompt},
+        ]
 
     def build_interview_turn_reply(self, user_answer: str, current_question: str, next_question: str | None) -> str:
+        return self._turn_reply(self._interview_reply_messages(user_answer, current_question, next_question))
+
+    @staticmethod
+    def _interview_reply_messages(user_answer: str, current_question: str, next_question: str | None) -> list[dict]:
         user_prompt = (
             "You are a realistic interview voice AI. "
             "Acknowledge the candidate's answer naturally in one short sentence. "
@@ -96,41 +378,92 @@ class OpenAIService:
             f"Candidate answer: {user_answer}\n"
             f"Next question: {next_question or 'NONE'}"
         )
+        return [
+            {
+                "role": "system",
+                "content": "Human, concise, professional interviewer style. No bullets.",
+            },
+            {"role": "user", "content": user_prompt},
+        ]
 
-        response = self.client.chat.completions.create(
-            model=settings.openai_model,
-            temperature=0.7,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "Human, concise, professional interviewer style. No bullets.",
-                },
-                {"role": "user", "content": user_prompt},
-            ],
+    def build_interview_ack(self, user_answer: str, current_question: str, is_last: bool) -> str:
+        return self._turn_reply(
+            self._interview_ack_messages(user_answer, current_question, is_last),
+            max_tokens=settings.interview_ack_max_tokens,
         )
 
-        return (response.choices[0].message.content or "").strip()
+    @staticmethod
+    def _interview_ack_messages(user_answer: str, current_question: str, is_last: bool) -> list[dict]:
+        # Split-reply mode: the next question is spoken from pre-rendered audio,
+        # so the model only writes the short, unique part of the turn.
+        if is_last:
+            instruction = "Acknowledge the candidate's answer and close the interview politely in one sentence."
+        else:
+            instruction = (
+                "Acknowledge the candidate's answer naturally in exactly one short sentence. "
+                "Do not ask a question and do not mention what comes next."
+            )
+        user_prompt = (
+            "You are a realistic interview voice AI. "
+            f"{instruction}\n\n"
+            f"Question just answered: {current_question}\n"
+            f"Candidate answer: {user_answer}"
+        )
+        return [
+            {
+                "role": "system",
+                "content": "Human, concise, professional interviewer style. No bullets.",
+            },
+            {"role": "user", "content": user_prompt},
+        ]
 
     def transcribe_audio(self, filename: str, file_bytes: bytes) -> str:
-        from io import BytesIO
+        with provider_guard.guard(TRANSCRIPTION):
+            transcription = self.live_client.audio.transcriptions.create(
+                model=settings.openai_transcribe_model,
+                file=self._audio_buffer(filename, file_bytes),
+                timeout=transcription_deadline(len(file_bytes)),
+            )
+        return transcription.text.strip()
 
+    @staticmethod
+    def _audio_buffer(filename: str, file_bytes: bytes) -> BytesIO:
         audio_buffer = BytesIO(file_bytes)
         audio_buffer.name = filename
+        return audio_buffer
 
-        transcription = self.client.audio.transcriptions.create(
-            model=settings.openai_transcribe_model,
-            file=audio_buffer,
-        )
-        return transcription.text.strip()
+    def synthesize_speech(self, text: str, cacheable: bool = False) -> tuple[bytes, str]:
+        """TTS through the speech cache; static prompts (or ``cacheable`` texts) are stored."""
+        cache_key = self.speech_cache_key(text, self.audio_format)
+        cached = speech_cache.get(cache_key)
+        if cached is not None:
+            return cached, self.speech_content_type(self.audio_format)
+
+        with provider_guard.guard(SPEECH):
+            speech = self.live_client.audio.speech.create(
+                model=settings.openai_tts_model,
+                voice=settings.openai_tts_voice,
+                input=text,
+                response_format=self.audio_format,
+                timeout=turn_deadline(SPEECH),
+            )
+        audio_bytes, content_type = self._speech_result(speech, self.audio_format)
+        if cacheable or speech_cache.is_static(text):
+            speech_cache.put(cache_key, audio_bytes)
+        return audio_bytes, content_type
 
-    def synthesize_speech(self, text: str) -> tuple[bytes, str]:
-        speech = self.client.audio.speech.create(
-            model=settings.openai_tts_model,
-            voice=settings.openai_tts_voice,
-            input=text,
-            response_format=settings.openai_tts_format,
+    @staticmethod
+    def speech_content_type(audio_format: str | None = None) -> str:
+        return SPEECH_FORMATS[_speech_format(audio_format)]
+
+    @staticmethod
+    def speech_cache_key(text: str, audio_format: str | None = None) -> str:
+        return speech_cache.key(
+            text, settings.openai_tts_model, settings.openai_tts_voice, _speech_format(audio_format)
         )
 
+    @staticmethod
+    def _speech_result(speech, audio_format: str | None = None) -> tuple[bytes, str]:
         audio_bytes = b""
         if hasattr(speech, "read"):
             audio_bytes = speech.read()
@@ -140,5 +473,192 @@ class OpenAIService:
         if not audio_bytes:
             raise ValueError("OpenAI TTS returned empty audio")
 
-        content_type = f"audio/{settings.openai_tts_format}"
+        return audio_bytes, OpenAIService.speech_content_type(audio_format)
+
+
+class AsyncOpenAIService:
+    """Async counterpart of OpenAIService for code running on the event loop.
+
+    Prompts and response parsing are shared with OpenAIService so both paths
+    produce identical conversations; only the transport differs.
+    """
+
+    def __init__(
+        self, audio_format: str | None = None, priority: Priority = Priority.LIVE, user_id: str | None = None
+    ):
+        self.client = _scheduled(openai_pool.async_client(_require_api_key()), priority, user_id)
+        self.live_client = self.client.with_options(max_retries=0)
+        self.audio_format = _speech_format(audio_format)
+
+    async def generate_interview_questions(self, payload: InterviewSetupPayload) -> List[str]:
+        return await question_set_cache.get_or_generate_async(payload, lambda: self._generate_questions(payload))
+
+    async def _generate_questions(self, payload: InterviewSetupPayload) -> List[str]:
+        shards, interleave = plan_shards(payload)
+        if len(shards) == 1:
+            batches = [await self._generate_batch(payload)]
+        else:
+            results = await asyncio.gather(
+                *(self._generate_batch(shard.payload, shard.focus) for shard in shards), return_exceptions=True
+            )
+            batches = _shard_results(results)
+        deduper = QuestionDeduper()
+        questions = deduper.filter(merge_shards(batches, interleave))[: payload.amount]
+        for _ in range(settings.question_top_up_attempts):
+            missing = payload.amount - len(questions)
+            if missing <= 0:
+                break
+            batch = await self._generate_batch(payload.model_copy(update={"amount": missing}), avoid=questions)
+            questions += deduper.filter(batch)[:missing]
+        if len(questions) < payload.amount:
+            raise ValueError("OpenAI returned too few distinct questions.")
+        return questions
+
+    async def _generate_batch(
+        self, payload: InterviewSetupPayload, focus: str | None = None, avoid: list[str] | None = None
+    ) -> List[str]:
+        with provider_guard.guard(CHAT):
+            response = await self.client.chat.completions.create(
+                model=settings.openai_model,
+                temperature=0.5,
+                messages=OpenAIService._question_messages(payload, focus, avoid),
+                extra_headers=GENERATION_HEADERS,
+                timeout=settings.provider_generation_timeout_seconds,
+            )
+        return OpenAIService._parse_questions(response.choices[0].message.content)
+
+    async def build_collector_reply(self, field_name: str, user_response: str, next_field_prompt: str | None) -> str:
+        return await self._turn_reply(
+            OpenAIService._collector_reply_messages(field_name, user_response, next_field_prompt)
+        )
+
+    async def build_interview_turn_reply(self, user_answer: str, current_question: str, next_question: str | None) -> str:
+        return await self._turn_reply(
+            OpenAIService._interview_reply_messages(user_answer, current_question, next_question)
+        )
+
+    async def _turn_reply(self, messages: list[dict], **options) -> str:
+        async def attempt(timeout: float):
+            return await self.live_client.chat.completions.create(
+                model=settings.openai_model, temperature=0.7, messages=messages, timeout=timeout, **options
+            )
+
+        response = await provider_guard.hedged_async(CHAT, attempt)
+        return (response.choices[0].message.content or "").strip()
+
+    async def stream_collector_reply(
+        self, field_name: str, user_response: str, next_field_prompt: str | None
+    ) -> AsyncIterator[str]:
+        messages = OpenAIService._collector_reply_messages(field_name, user_response, next_field_prompt)
+        async for delta in self._stream_chat(messages, temperature=0.7):
+            yield delta
+
+    async def stream_interview_turn_reply(
+        self, user_answer: str, current_question: str, next_question: str | None
+    ) -> AsyncIterator[str]:
+        messages = OpenAIService._interview_reply_messages(user_answer, current_question, next_question)
+        async for delta in self._stream_chat(messages, temperature=0.7):
+            yield delta
+
+    async def build_interview_ack(self, user_answer: str, current_question: str, is_last: bool) -> str:
+        return await self._turn_reply(
+            OpenAIService._interview_ack_messages(user_answer, current_question, is_last),
+            max_tokens=settings.interview_ack_max_tokens,
+        )
+
+    async def stream_interview_ack(self, user_answer: str, current_question: str, is_last: bool) -> AsyncIterator[str]:
+        messages = OpenAIService._interview_ack_messages(user_answer, current_question, is_last)
+        async for delta in self._stream_chat(messages, temperature=0.7, max_tokens=settings.interview_ack_max_tokens):
+            yield delta
+
+    async def _stream_chat(
+        self, messages: list[dict], temperature: float, max_tokens: int | None = None
+    ) -> AsyncIterator[str]:
+        options = {"max_tokens": max_tokens} if max_tokens else {}
+        # The deadline bounds the wait for the first token and every gap after it.
+        with provider_guard.guard(CHAT):
+            stream = await self.live_client.chat.completions.create(
+                model=settings.openai_model,
+                temperature=temperature,
+                messages=messages,
+                stream=True,
+                timeout=turn_deadline(CHAT),
+                **options,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+    async def transcribe_audio(self, filename: str, file_bytes: bytes) -> str:
+        return await self.transcribe_file(filename, OpenAIService._audio_buffer(filename, file_bytes))
+
+    async def transcribe_file(self, filename: str, audio_file: BinaryIO) -> str:
+        """Transcribe an open file object without copying it into memory first."""
+        with provider_guard.guard(TRANSCRIPTION):
+            transcription = await self.live_client.audio.transcriptions.create(
+                model=settings.openai_transcribe_model,
+                file=(filename, audio_file),
+                timeout=transcription_deadline(_file_size(audio_file)),
+            )
+        return transcription.text.strip()
+
+    async def synthesize_speech(self, text: str, cacheable: bool = False) -> tuple[bytes, str]:
+        cache_key = self.speech_cache_key(text, self.audio_format)
+        cached = await self._cached_speech(cache_key)
+        if cached is not None:
+            return cached, self.speech_content_type(self.audio_format)
+
+        with provider_guard.guard(SPEECH):
+            speech = await self.live_client.audio.speech.create(
+                model=settings.openai_tts_model,
+                voice=settings.openai_tts_voice,
+                input=text,
+                response_format=self.audio_format,
+                timeout=turn_deadline(SPEECH),
+            )
+        audio_bytes, content_type = OpenAIService._speech_result(speech, self.audio_format)
+        if cacheable or speech_cache.is_static(text):
+            await run_in_threadpool(speech_cache.put, cache_key, audio_bytes)
         return audio_bytes, content_type
+
+    async def stream_speech(self, text: str, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        """Yield TTS audio as it arrives instead of waiting for the whole clip."""
+        chunk_size = chunk_size or settings.voice_audio_chunk_bytes
+        cache_key = self.speech_cache_key(text, self.audio_format)
+        cached = await self._cached_speech(cache_key)
+        if cached is not None:
+            for offset in range(0, len(cached), chunk_size):
+                yield cached[offset:offset + chunk_size]
+            return
+
+        store = speech_cache.is_static(text)
+        chunks = []
+        with provider_guard.guard(SPEECH):
+            async with self.live_client.audio.speech.with_streaming_response.create(
+                model=settings.openai_tts_model,
+                voice=settings.openai_tts_voice,
+                input=text,
+                response_format=self.audio_format,
+                timeout=turn_deadline(SPEECH),
+            ) as speech:
+                async for chunk in speech.iter_bytes(chunk_size):
+                    if store:
+                        chunks.append(chunk)
+                    yield chunk
+        if store:
+            await run_in_threadpool(speech_cache.put, cache_key, b"".join(chunks))
+
+    @staticmethod
+    async def _cached_speech(cache_key: str) -> bytes | None:
+        cached = speech_cache.get_memory(cache_key)
+        if cached is None and speech_cache.contains(cache_key):
+            cached = await run_in_threadpool(speech_cache.get, cache_key)
+        return cached
+
+    @staticmethod
+    def speech_content_type(audio_format: str | None = None) -> str:
+        return OpenAIService.speech_content_type(audio_format)
+
+    @staticmethod
+    def speech_cache_key(text: str, audio_format: str | None = None) -> str:
+        return OpenAIService.speech_cache_key(text, audio_format)
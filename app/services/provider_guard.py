@@ -0,0 +1,307 @@
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from threading import Lock
+from typing import Awaitable, Callable, Iterator, TypeVar
+
+import httpx
+import openai
+
+from app.core.config import settings
+from app.services.provider_scheduler import AdmissionTimeout
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Provider endpoints; each has its own circuit breaker.
+CHAT = "chat"
+SPEECH = "speech"
+TRANSCRIPTION = "transcription"
+
+# Latencies of hedged calls kept per endpoint to derive the hedge delay.
+LATENCY_WINDOW = 200
+# Below this many samples the fixed provider_hedge_delay_seconds is used.
+MIN_LATENCY_SAMPLES = 20
+
+_hedge_pool = ThreadPoolExecutor(
+    max_workers=settings.provider_hedge_workers,
+    thread_name_prefix="provider-hedge",
+)
+
+
+class ProviderUnavailable(RuntimeError):
+    """Raised instead of calling the provider while an endpoint's circuit breaker is open."""
+
+
+def turn_deadline(endpoint: str) -> float:
+    """Seconds a live call may take: the endpoint's share of the per-turn latency budget."""
+    share = {
+        CHAT: settings.provider_chat_budget_share,
+        SPEECH: settings.provider_speech_budget_share,
+        TRANSCRIPTION: settings.provider_transcription_budget_share,
+    }[endpoint]
+    return settings.provider_turn_budget_seconds * share
+
+
+def transcription_deadline(size_bytes: int) -> float:
+    """Turn deadline for STT, extended by ``provider_transcription_seconds_per_mb`` for long uploads."""
+    size_mb = size_bytes / (1024 * 1024)
+    return turn_deadline(TRANSCRIPTION) + size_mb * settings.provider_transcription_seconds_per_mb
+
+
+def _is_provider_failure(exc: BaseException) -> bool:
+    """Timeouts, connection errors and 5xx count against an endpoint.
+
+    Other API errors (including 429, which the scheduler handles) and local
+    errors such as unparsable output show the endpoint is answering. A
+    request that timed out waiting for admission never reached the provider.
+    """
+    if isinstance(exc, AdmissionTimeout) or isinstance(exc.__cause__, AdmissionTimeout):
+        return False
+    if isinstance(exc, (openai.APIConnectionError, httpx.TimeoutException, httpx.TransportError, TimeoutError)):
+        return True
+    return isinstance(exc, openai.APIStatusError) and exc.status_code >= 500
+
+
+class CircuitBreaker:
+    """Fails calls fast after ``provider_breaker_failures`` consecutive provider failures.
+
+    While open, calls raise ProviderUnavailable without reaching the
+    provider. After ``provider_breaker_reset_seconds`` the breaker is half
+    open: one probe call goes through, and its success closes the breaker
+    while its failure opens it again.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = Lock()
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+        self.last_error: str | None = None
+        self._opened_at = 0.0
+        self._probing = False
+
+    def _probe_due(self, now: float) -> bool:
+        return now - self._opened_at >= settings.provider_breaker_reset_seconds
+
+    def available(self) -> bool:
+        """Whether a call would be let through right now (without claiming the half-open probe)."""
+        with self._lock:
+            if self.state == "open":
+                return self._probe_due(time.monotonic())
+            return self.state == "closed" or not self._probing
+
+    def _acquire(self) -> bool:
+        """Admit a call or raise ProviderUnavailable; returns whether the call is the half-open probe."""
+        with self._lock:
+            if self.state == "open" and self._probe_due(time.monotonic()):
+                self.state = "half_open"
+            if self.state == "closed":
+                return False
+            if self.state == "half_open" and not self._probing:
+                self._probing = True
+                return True
+            self.rejected += 1
+        raise ProviderUnavailable(f"OpenAI {self.name} is unavailable; retrying after the breaker resets")
+
+    def _release(self, probe: bool, exc: BaseException | None):
+        with self._lock:
+            if probe:
+                self._probing = False
+            if exc is not None and not isinstance(exc, Exception):
+                # Cancelled or abandoned: says nothing about the endpoint.
+                return
+            if exc is None or not _is_provider_failure(exc):
+                if self.state != "closed":
+                    logger.info("provider breaker closed: endpoint=%s", self.name)
+                self.state = "closed"
+                self.consecutive_failures = 0
+                return
+            self.failures += 1
+            self.consecutive_failures += 1
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            if probe or (self.state == "closed" and self.consecutive_failures >= settings.provider_breaker_failures):
+                self.state = "open"
+                self._opened_at = time.monotonic()
+                self.times_opened += 1
+                logger.warning(
+                    "provider breaker opened: endpoint=%s failures=%d error=%s",
+                    self.name, self.consecutive_failures, self.last_error,
+                )
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        probe = self._acquire()
+        try:
+            yield
+        except BaseException as exc:
+            self._release(probe, exc)
+            raise
+        self._release(probe, None)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            retry_in = None
+            if self.state == "open":
+                remaining = settings.provider_breaker_reset_seconds - (time.monotonic() - self._opened_at)
+                retry_in = round(max(0.0, remaining), 1)
+            return {
+                "state": self.state,
+                "consecutive_failures": self.consecutive_failures,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "times_opened": self.times_opened,
+                "retry_in_seconds": retry_in,
+                "last_error": self.last_error,
+            }
+
+
+class _Latencies:
+    def __init__(self):
+        self._lock = Lock()
+        self._samples: deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def add(self, seconds: float, hedged: bool, hedge_won: bool):
+        with self._lock:
+            self._samples.append(seconds)
+            self.calls += 1
+            self.hedged += hedged
+            self.hedge_wins += hedge_won
+
+    def percentile(self, fraction: float) -> float | None:
+        with self._lock:
+            if len(self._samples) < MIN_LATENCY_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1)]
+
+    def snapshot(self) -> dict:
+        p50 = self.percentile(0.5)
+        p95 = self.percentile(0.95)
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "hedged": self.hedged,
+                "hedge_wins": self.hedge_wins,
+                "p50_seconds": round(p50, 3) if p50 is not None else None,
+                "p95_seconds": round(p95, 3) if p95 is not None else None,
+            }
+
+
+def _first_success(futures: list[Future]) -> tuple[object, int]:
+    """Result and index of the first future to succeed; the first error if all fail."""
+    pending, error = set(futures), None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                return future.result(), futures.index(future)
+            error = error or future.exception()
+    raise error
+
+
+class ProviderGuard:
+    """Circuit breakers and hedged calls for the provider endpoints.
+
+    Hedging targets short live chat calls: when the first attempt has not
+    answered after the endpoint's recent ``provider_hedge_percentile``
+    latency, a duplicate is sent and whichever answers first wins. Since a
+    hedged call always takes at least that long, the share of hedged calls
+    settles near ``1 - provider_hedge_percentile``.
+    """
+
+    def __init__(self):
+        self.breakers = {name: CircuitBreaker(name) for name in (CHAT, SPEECH, TRANSCRIPTION)}
+        self._latencies = {CHAT: _Latencies()}
+
+    def available(self, endpoint: str) -> bool:
+        return self.breakers[endpoint].available()
+
+    def guard(self, endpoint: str):
+        return self.breakers[endpoint].guard()
+
+    def _hedge_delay(self, endpoint: str, deadline: float) -> float | None:
+        if not settings.provider_hedging or self.breakers[endpoint].state != "closed":
+            return None
+        delay = self._latencies[endpoint].percentile(settings.provider_hedge_percentile)
+        delay = settings.provider_hedge_delay_seconds if delay is None else delay
+        return delay if delay < deadline else None
+
+    def hedged(self, endpoint: str, attempt: Callable[[float], T]) -> T:
+        """Run ``attempt(timeout)`` within the endpoint's turn deadline, hedged as described above."""
+        deadline = turn_deadline(endpoint)
+        with self.guard(endpoint):
+            start = time.monotonic()
+            delay = self._hedge_delay(endpoint, deadline)
+            hedged, winner = False, 0
+            if delay is None:
+                result = attempt(deadline)
+            else:
+                first = _hedge_pool.submit(attempt, deadline)
+                if wait([first], timeout=delay).done:
+                    result = first.result()
+                else:
+                    hedged = True
+                    second = _hedge_pool.submit(attempt, deadline - delay)
+                    result, winner = _first_success([first, second])
+            self._latencies[endpoint].add(time.monotonic() - start, hedged, winner == 1)
+            return result
+
+    async def hedged_async(self, endpoint: str, attempt: Callable[[float], Awaitable[T]]) -> T:
+        deadline = turn_deadline(endpoint)
+        with self.guard(endpoint):
+            start = time.monotonic()
+            delay = self._hedge_delay(endpoint, deadline)
+            if delay is None:
+                result = await attempt(deadline)
+                self._latencies[endpoint].add(time.monotonic() - start, False, False)
+                return result
+
+            tasks = [asyncio.ensure_future(attempt(deadline))]
+            try:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done:
+                    tasks.append(asyncio.ensure_future(attempt(deadline - delay)))
+                error = None
+                pending = set(tasks)
+                while pending:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception() is None:
+                            hedged = len(tasks) > 1
+                            hedge_won = hedged and task is tasks[-1]
+                            self._latencies[endpoint].add(time.monotonic() - start, hedged, hedge_won)
+                            return task.result()
+                        error = error or task.exception()
+                raise error
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    def any_open(self) -> bool:
+        return any(breaker.state == "open" for breaker in self.breakers.values())
+
+    def metrics(self) -> dict:
+        return {
+            "turn_budget_seconds": settings.provider_turn_budget_seconds,
+            "deadlines_seconds": {name: round(turn_deadline(name), 3) for name in self.breakers},
+            "breakers": {name: breaker.snapshot() for name, breaker in self.breakers.items()},
+            "hedging": {
+                "enabled": settings.provider_hedging,
+                **{name: latencies.snapshot() for name, latencies in self._latencies.items()},
+            },
+        }
+
+
+provider_guard = ProviderGuard()
@@ -0,0 +1,286 @@
+import asyncio
+import json
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from enum import IntEnum
+from threading import Event, Lock, Timer
+from typing import Callable
+
+import httpx
+
+from app.core.config import settings
+
+# Internal request headers carrying a call's priority and fairness key from
+# the service to the transport hooks; they are stripped before sending.
+PRIORITY_HEADER = "x-scheduler-priority"
+USER_HEADER = "x-scheduler-user"
+ANONYMOUS_USER = "anonymous"
+# Characters per token when estimating the prompt size of a chat request.
+CHARS_PER_TOKEN = 4
+# Pause after a 429 that carries no usable Retry-After header.
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+
+
+class AdmissionTimeout(httpx.PoolTimeout):
+    """A request waited longer than its timeout for admission.
+
+    It is an httpx timeout, so the OpenAI client retries it like any other;
+    the provider itself was never called.
+    """
+
+
+class Priority(IntEnum):
+    """Admission classes, most urgent first."""
+
+    LIVE = 0
+    INTERACTIVE = 1
+    BACKGROUND = 2
+
+
+def scheduler_headers(priority: Priority, user_id: str | None = None) -> dict[str, str]:
+    return {PRIORITY_HEADER: str(int(priority)), USER_HEADER: user_id or ANONYMOUS_USER}
+
+
+class _MinuteBudget:
+    """Token bucket refilled continuously at ``per_minute`` units per minute; 0 means unlimited."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.available = float(per_minute)
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated
+        self.updated = now
+        self.available = min(self.capacity, self.available + elapsed * self.capacity / 60.0)
+
+    def delay(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` fits; a request larger than the whole budget waits for a full bucket."""
+        if self.capacity <= 0:
+            return 0.0
+        self._refill(now)
+        missing = min(amount, self.capacity) - self.available
+        return max(0.0, missing * 60.0 / self.capacity)
+
+    def consume(self, amount: float):
+        if self.capacity > 0:
+            self.available -= min(amount, self.capacity)
+
+
+@dataclass
+class _Waiter:
+    priority: Priority
+    user: str
+    tokens: int
+    wake: Callable[[], None]
+    enqueued: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _ClassMetrics:
+    admitted: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def snapshot(self, queued: int) -> dict:
+        return {
+            "queued": queued,
+            "admitted": self.admitted,
+            "avg_wait_ms": round(self.total_wait / self.admitted * 1000, 1) if self.admitted else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+        }
+
+
+class ProviderScheduler:
+    """Admits OpenAI requests against requests- and tokens-per-minute budgets.
+
+    Waiting requests are served strictly by Priority. Within a class, users
+    take turns: each admission moves that user to the back of the class, so
+    one user's burst cannot starve the others. A 429 from the provider
+    pauses every admission for its Retry-After. Admission is about rate
+    only; an admitted request holds no slot while it runs.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self._lock = Lock()
+        self._requests = _MinuteBudget(requests_per_minute)
+        self._tokens = _MinuteBudget(tokens_per_minute)
+        self._queues: list[OrderedDict[str, deque[_Waiter]]] = [OrderedDict() for _ in Priority]
+        self._metrics = [_ClassMetrics() for _ in Priority]
+        self._paused_until = 0.0
+        self._timer: Timer | None = None
+        self.throttled = 0
+
+    def admit(self, priority: Priority, user: str, tokens: int = 0, timeout: float | None = None):
+        """Block the calling thread until the request may be sent.
+
+        Raises TimeoutError if it is not admitted within ``timeout`` seconds.
+        """
+        admitted = Event()
+        waiter = _Waiter(priority, user, tokens, admitted.set)
+        self._enqueue(waiter)
+        if not admitted.wait(timeout) and self._withdraw(waiter):
+            raise TimeoutError(f"Not admitted within {timeout:.1f}s")
+
+    async def admit_async(self, priority: Priority, user: str, tokens: int = 0, timeout: float | None = None):
+        loop = asyncio.get_running_loop()
+        admitted = loop.create_future()
+
+        def wake():
+            loop.call_soon_threadsafe(lambda: admitted.done() or admitted.set_result(None))
+
+        waiter = _Waiter(priority, user, tokens, wake)
+        self._enqueue(waiter)
+        try:
+            await asyncio.wait_for(admitted, timeout)
+        except asyncio.TimeoutError:
+            if self._withdraw(waiter):
+                raise TimeoutError(f"Not admitted within {timeout:.1f}s") from None
+        except asyncio.CancelledError:
+            self._withdraw(waiter)
+            raise
+
+    def throttle(self, retry_after: float):
+        with self._lock:
+            self.throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            self._dispatch()
+
+    def _enqueue(self, waiter: _Waiter):
+        with self._lock:
+            self._queues[waiter.priority].setdefault(waiter.user, deque()).append(waiter)
+            self._dispatch()
+
+    def _withdraw(self, waiter: _Waiter) -> bool:
+        """Drop a waiter from its queue; False if it was already admitted."""
+        with self._lock:
+            queue = self._queues[waiter.priority]
+            pending = queue.get(waiter.user)
+            if not pending or waiter not in pending:
+                return False
+            pending.remove(waiter)
+            if not pending:
+                del queue[waiter.user]
+            self._dispatch()
+            return True
+
+    def _next_waiter(self) -> _Waiter | None:
+        for queue in self._queues:
+            if queue:
+                return queue[next(iter(queue))][0]
+        return None
+
+    def _dispatch(self):
+        """Admit waiters in order while the budgets allow; called with the lock held."""
+        while True:
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            now = time.monotonic()
+            delay = max(
+                self._paused_until - now,
+                self._requests.delay(1, now),
+                self._tokens.delay(waiter.tokens, now),
+            )
+            if delay > 0:
+                self._schedule(delay)
+                return
+
+            self._requests.consume(1)
+            self._tokens.consume(waiter.tokens)
+            queue = self._queues[waiter.priority]
+            pending = queue[waiter.user]
+            pending.popleft()
+            if pending:
+                queue.move_to_end(waiter.user)
+            else:
+                del queue[waiter.user]
+
+            wait = now - waiter.enqueued
+            metrics = self._metrics[waiter.priority]
+            metrics.admitted += 1
+            metrics.total_wait += wait
+            metrics.max_wait = max(metrics.max_wait, wait)
+            waiter.wake()
+
+    def _schedule(self, delay: float):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = Timer(delay, self._on_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+            self._dispatch()
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "requests_per_minute": int(self._requests.capacity),
+                "tokens_per_minute": int(self._tokens.capacity),
+                "throttled": self.throttled,
+                "paused_ms": round(max(0.0, self._paused_until - time.monotonic()) * 1000),
+                "classes": {
+                    priority.name.lower(): self._metrics[priority].snapshot(
+                        sum(len(pending) for pending in self._queues[priority].values())
+                    )
+                    for priority in Priority
+                },
+            }
+
+
+provider_scheduler = ProviderScheduler(settings.openai_rpm_limit, settings.openai_tpm_limit)
+
+
+def _request_ticket(request: httpx.Request) -> tuple[Priority, str, int, float | None]:
+    """Pop the scheduler headers, estimate the request's token cost and read its admission timeout.
+
+    Waiting for admission is bounded like waiting for a pooled connection:
+    by the request's pool timeout, which the OpenAI client sets from the
+    call's timeout or deadline.
+    """
+    priority = Priority(int(request.headers.pop(PRIORITY_HEADER, Priority.INTERACTIVE)))
+    user = request.headers.pop(USER_HEADER, ANONYMOUS_USER)
+    tokens = 0
+    if request.url.path.endswith("/chat/completions"):
+        body = _json_body(request)
+        completion = body.get("max_tokens") or settings.openai_completion_token_estimate
+        tokens = len(request.content) // CHARS_PER_TOKEN + completion
+    timeout = request.extensions.get("timeout", {}).get("pool")
+    return priority, user, tokens, timeout
+
+
+def _json_body(request: httpx.Request) -> dict:
+    try:
+        return json.loads(request.content)
+    except ValueError:
+        return {}
+
+
+def _retry_after(response: httpx.Response) -> float:
+    try:
+        return max(0.0, float(response.headers.get("retry-after", "")))
+    except ValueError:
+        return DEFAULT_RETRY_AFTER_SECONDS
+
+
+def admit_request(request: httpx.Request):
+    try:
+        provider_scheduler.admit(*_request_ticket(request))
+    except TimeoutError as exc:
+        raise AdmissionTimeout(str(exc), request=request) from exc
+
+
+async def admit_request_async(request: httpx.Request):
+    try:
+        await provider_scheduler.admit_async(*_request_ticket(request))
+    except TimeoutError as exc:
+        raise AdmissionTimeout(str(exc), request=request) from exc
+
+
+def observe_response(response: httpx.Response):
+    if response.status_code == 429:
+        provider_scheduler.throttle(_retry_after(response))
@@ -0,0 +1,90 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from app.core.config import settings
+from app.core.question_audio_store import question_audio_store
+from app.services.interview_flow_service import InterviewFlowService
+from app.services.openai_pool import provider_api_key
+from app.services.openai_service import OpenAIService
+from app.services.provider_scheduler import Priority
+
+# One pool for every interview, so a burst of new interviews cannot exceed
+# question_audio_concurrency parallel TTS requests.
+_render_pool = ThreadPoolExecutor(
+    max_workers=settings.question_audio_concurrency,
+    thread_name_prefix="question-audio",
+)
+# Renders submitted but not finished yet, so a caller about to synthesize the
+# same prompt can wait for the pool instead of paying for a second TTS call.
+_pending_renders: dict[tuple[int, int, str], Future] = {}
+
+
+def _render_question_prompt(openai_service: OpenAIService, interview_id: int, question_index: int, text: str):
+    if question_audio_store.contains(interview_id, question_index, text):
+        return
+    try:
+        audio_bytes, _ = openai_service.synthesize_speech(text)
+        question_audio_store.put(interview_id, question_index, text, audio_bytes)
+    except Exception as exc:
+        print(f"[question-audio] Failed to render interview {interview_id} question {question_index}: {exc}")
+
+
+def question_prompts(questions: list[str], start: int = 0) -> list[tuple[int, str]]:
+    """Every (question index, text) the interviewer may speak verbatim for a question.
+
+    That is the opening/resume prompt for each index plus, when split replies
+    are the default reply mode, the transition that follows a live
+    acknowledgement for every question after the first. Sockets that opt into
+    split replies otherwise synthesize (and then store) transitions on first
+    use. ``start`` is the index of the first question given.
+    """
+    split = settings.interview_reply_mode == "split"
+    prompts = []
+    for index, question in enumerate(questions, start):
+        prompts.append((index, InterviewFlowService.build_question_prompt(question, index)))
+        if split and index > 0:
+            prompts.append((index, InterviewFlowService.build_next_question_prompt(question)))
+    return prompts
+
+
+def schedule_question_audio(interview_id: int, questions: list[str], start: int = 0) -> list[Future]:
+    """Render the spoken prompts of an interview's questions in the background.
+
+    ``start`` is the index of ``questions[0]``, so questions that arrive
+    one at a time during streamed generation can be scheduled as they come.
+    """
+    if not settings.question_audio_prerender or not provider_api_key():
+        return []
+
+    openai_service = OpenAIService(priority=Priority.BACKGROUND)
+    futures = []
+    for index, text in question_prompts(questions, start):
+        key = (interview_id, index, text)
+        future = _render_pool.submit(_render_question_prompt, openai_service, interview_id, index, text)
+        _pending_renders[key] = future
+        future.add_done_callback(lambda _, key=key: _pending_renders.pop(key, None))
+        futures.append(future)
+    return futures
+
+
+def pending_question_audio(interview_id: int, question_index: int, text: str) -> Future | None:
+    """The background render of a default-format prompt, if it is still running."""
+    return _pending_renders.get((interview_id, question_index, text))
+
+
+def load_question_audio(
+    interview_id: int, question_index: int, text: str, audio_format: str | None = None
+) -> bytes | None:
+    return question_audio_store.get(interview_id, question_index, text, audio_format)
+
+
+def store_question_audio(
+    interview_id: int, question_index: int, text: str, audio_bytes: bytes, audio_format: str | None = None
+):
+    """Keep a live-synthesized question clip so later sessions in the same format reuse it.
+
+    Only the default format is pre-rendered; other formats fill in on first use.
+    """
+    try:
+        question_audio_store.put(interview_id, question_index, text, audio_bytes, audio_format)
+    except OSError as exc:
+        print(f"[question-audio] Failed to store interview {interview_id} question {question_index}: {exc}")
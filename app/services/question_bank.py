@@ -0,0 +1,126 @@
+import json
+from datetime import datetime, timedelta
+from threading import Event, Thread
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.question_set_cache import question_set_key
+from app.db.session import SessionLocal
+from app.models.interview import Interview
+from app.repositories.question_bank_repository import QuestionBankRepository
+from app.schemas.interview import InterviewSetupPayload
+from app.services.openai_pool import provider_api_key
+from app.services.openai_service import OpenAIService
+from app.services.provider_scheduler import Priority
+
+# Interviews read per query while indexing existing interviews into the bank.
+INDEX_BATCH_SIZE = 200
+
+_stop = Event()
+
+
+def _setup_payload(role: str, interview_type: str, level: str, techstack_csv: str, amount: int) -> InterviewSetupPayload:
+    techstack = [item.strip() for item in techstack_csv.split(",") if item.strip()]
+    return InterviewSetupPayload(
+        role=role, interview_type=interview_type, level=level, techstack=techstack or ["general"], amount=amount
+    )
+
+
+def index_new_interviews(db: Session, after_id: int | None = None) -> tuple[int, int]:
+    """Copy the questions of interviews after ``after_id`` into the bank.
+
+    Without ``after_id`` indexing resumes after the newest interview already
+    in the bank. Returns (questions added, last interview id read).
+    """
+    bank = QuestionBankRepository(db)
+    last_id = bank.last_indexed_interview_id() if after_id is None else after_id
+    added = 0
+    while True:
+        interviews = list(
+            db.scalars(
+                select(Interview).where(Interview.id > last_id).order_by(Interview.id).limit(INDEX_BATCH_SIZE)
+            )
+        )
+        if not interviews:
+            return added, last_id
+        for interview in interviews:
+            try:
+                questions = json.loads(interview.questions_json)
+            except ValueError:
+                continue
+            payload = _setup_payload(
+                interview.role, interview.interview_type, interview.level, interview.techstack_csv, interview.amount
+            )
+            added += bank.add(payload, questions, source_interview_id=interview.id)
+        last_id = interviews[-1].id
+
+
+def popular_setups(db: Session) -> list[InterviewSetupPayload]:
+    """The most requested setups of the recent window, merged by canonical setup."""
+    since = datetime.utcnow() - timedelta(days=settings.question_bank_popular_window_days)
+    rows = db.execute(
+        select(
+            Interview.role, Interview.interview_type, Interview.level, Interview.techstack_csv, func.count(Interview.id)
+        )
+        .where(Interview.created_at >= since)
+        .group_by(Interview.role, Interview.interview_type, Interview.level, Interview.techstack_csv)
+        .order_by(func.count(Interview.id).desc())
+        .limit(settings.question_bank_popular_setups * 4)
+    ).all()
+    counts: dict[tuple, tuple[int, InterviewSetupPayload]] = {}
+    for role, interview_type, level, techstack_csv, count in rows:
+        payload = _setup_payload(role, interview_type, level, techstack_csv, settings.question_bank_batch_size)
+        key = question_set_key(payload)[:4]
+        previous = counts.get(key, (0, payload))[0]
+        counts[key] = (previous + count, payload)
+    ranked = sorted(counts.values(), key=lambda item: item[0], reverse=True)
+    return [payload for _, payload in ranked[: settings.question_bank_popular_setups]]
+
+
+def top_up_popular_setups(db: Session, openai_service: OpenAIService) -> int:
+    """Generate one batch for every popular setup below ``question_bank_target_per_setup``."""
+    bank = QuestionBankRepository(db)
+    added = 0
+    for payload in popular_setups(db):
+        if bank.coverage(payload) >= settings.question_bank_target_per_setup:
+            continue
+        try:
+            questions = openai_service.generate_interview_questions(payload, use_cache=False)
+        except Exception as exc:
+            print(f"[question-bank] Failed to generate for {payload.role}/{payload.level}: {exc}")
+            continue
+        added += bank.add(payload, questions)
+    return added
+
+
+def _run_worker():
+    # Interviews assembled from the bank add no rows to it, so the position
+    # is kept here rather than re-derived from the bank every cycle.
+    indexed_up_to = None
+    while not _stop.is_set():
+        db = SessionLocal()
+        try:
+            indexed, indexed_up_to = index_new_interviews(db, indexed_up_to)
+            generated = 0
+            if provider_api_key():
+                generated = top_up_popular_setups(db, OpenAIService(priority=Priority.BACKGROUND))
+            if indexed or generated:
+                print(f"[question-bank] Indexed {indexed} and generated {generated} questions")
+        except Exception as exc:
+            print(f"[question-bank] Refresh failed: {exc}")
+        finally:
+            db.close()
+        _stop.wait(settings.question_bank_refresh_seconds)
+
+
+def start_question_bank_worker():
+    if not settings.question_bank_worker:
+        return
+    _stop.clear()
+    Thread(target=_run_worker, name="question-bank", daemon=True).start()
+
+
+def stop_question_bank_worker():
+    _stop.set()
@@ -0,0 +1,74 @@
+import math
+import re
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.schemas.interview import InterviewSetupPayload
+
+_WORD = re.compile(r"[a-z0-9+#]+")
+
+
+@dataclass
+class QuestionShard:
+    """One of the concurrent generation calls a large question set is split into."""
+
+    payload: InterviewSetupPayload
+    focus: str | None = None
+
+
+def plan_shards(payload: InterviewSetupPayload) -> tuple[list[QuestionShard], bool]:
+    """Split a setup into shards of about ``question_shard_size`` questions.
+
+    Shards cover separate parts of the techstack when it has at least one
+    tech per shard, and otherwise difficulty bands of the level. Returns the
+    shards and whether their results should be interleaved (tech shards) or
+    kept in order (difficulty bands, easiest first).
+    """
+    count = min(settings.question_shard_max, math.ceil(payload.amount / max(1, settings.question_shard_size)))
+    if count <= 1:
+        return [QuestionShard(payload)], False
+
+    base, extra = divmod(payload.amount, count)
+    amounts = [base + (index < extra) for index in range(count)]
+    techstack = list(dict.fromkeys(item.strip() for item in payload.techstack if item.strip()))
+    by_tech = len(techstack) >= count
+    shards = []
+    for index, amount in enumerate(amounts):
+        if by_tech:
+            focus = f"Only ask about {', '.join(techstack[index::count])}."
+        else:
+            focus = (
+                f"Difficulty band {index + 1} of {count} for this level, where band 1 is the most "
+                f"foundational and band {count} the most advanced."
+            )
+        shards.append(QuestionShard(payload.model_copy(update={"amount": amount}), focus))
+    return shards, by_tech
+
+
+def merge_shards(batches: list[list[str]], interleave: bool) -> list[str]:
+    if not interleave:
+        return [question for batch in batches for question in batch]
+    merged = []
+    for row in range(max((len(batch) for batch in batches), default=0)):
+        merged.extend(batch[row] for batch in batches if row < len(batch))
+    return merged
+
+
+class QuestionDeduper:
+    """Drops questions whose word sets overlap an accepted one by ``question_dedup_similarity`` or more."""
+
+    def __init__(self):
+        self._accepted: list[frozenset[str]] = []
+
+    def add(self, question: str) -> bool:
+        words = frozenset(_WORD.findall(question.casefold()))
+        if not words:
+            return False
+        for other in self._accepted:
+            if len(words & other) / len(words | other) >= settings.question_dedup_similarity:
+                return False
+        self._accepted.append(words)
+        return True
+
+    def filter(self, questions: list[str]) -> list[str]:
+        return [question for question in questions if self.add(question)]
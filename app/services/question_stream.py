@@ -0,0 +1,255 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Condition, Lock
+from typing import Awaitable, Callable
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.cache import interview_cache
+from app.core.config import settings
+from app.core.question_set_cache import QuestionSetClaim, question_set_cache
+from app.db.session import SessionLocal
+from app.models.question_generation import DONE, FAILED, GENERATING
+from app.repositories.interview_repository import InterviewRepository
+from app.repositories.question_bank_repository import QuestionBankRepository
+from app.schemas.interview import InterviewSetupPayload
+from app.services.openai_service import OpenAIService
+from app.services.question_audio import schedule_question_audio
+
+# How often a worker without the stream re-reads a generating interview.
+PENDING_POLL_SECONDS = 0.5
+
+_generation_pool = ThreadPoolExecutor(
+    max_workers=settings.question_stream_workers,
+    thread_name_prefix="question-stream",
+)
+# Streams still generating in this worker, by interview id. Other workers
+# follow generation through the interview's QuestionGeneration row instead.
+_streams: dict[int, "QuestionStream"] = {}
+_streams_lock = Lock()
+
+
+class QuestionsUnavailable(RuntimeError):
+    """The questions a turn needs do not exist: generation failed, or has not caught up in time."""
+
+
+class QuestionStream:
+    """Questions of one interview as streamed generation produces them.
+
+    A question-set cache ``claim`` held for the setup is settled when
+    generation ends, with the full set or the error. A stream can also
+    ``follow`` another one for the same setup instead of generating.
+
+    Until ``attach`` names the interview row, questions are only collected;
+    afterwards each one is written to the row, cached and queued for audio
+    pre-rendering as it arrives, and the row's generation status (generating,
+    then done or failed) is kept in the database for every worker to see.
+    """
+
+    def __init__(self, payload: InterviewSetupPayload, claim: QuestionSetClaim | None = None):
+        self.payload = payload
+        self.claim = claim
+        self.questions: list[str] = []
+        self.done = False
+        self.error: Exception | None = None
+        self.interview_id: int | None = None
+        self._persisted = 0
+        self._followers: list[QuestionStream] = []
+        self._condition = Condition()
+        self._persist_lock = Lock()
+
+    def snapshot(self) -> list[str]:
+        with self._condition:
+            return list(self.questions)
+
+    def wait_for(self, count: int, timeout: float | None = None) -> list[str]:
+        """Block until ``count`` questions exist or generation ends; returns the questions so far."""
+        with self._condition:
+            self._condition.wait_for(lambda: len(self.questions) >= count or self.done, timeout)
+            return list(self.questions)
+
+    def follow(self, source: "QuestionStream"):
+        """Take every question of ``source``, so far and from now on, and end with it."""
+        with source._condition:
+            # Copied under the source's lock so no question is missed or repeated.
+            for question in source.questions:
+                self._append(question)
+            if not source.done:
+                source._followers.append(self)
+                return
+            error = source.error
+        self._finish(error)
+
+    def _append(self, question: str):
+        with self._condition:
+            self.questions.append(question)
+            followers = list(self._followers)
+            self._condition.notify_all()
+        for follower in followers:
+            follower._append(question)
+        self._persist()
+
+    def _finish(self, error: Exception | None = None):
+        with self._condition:
+            self.done = True
+            self.error = error
+            followers = list(self._followers)
+            self._condition.notify_all()
+        for follower in followers:
+            follower._finish(error)
+        if self.claim is not None:
+            if error is None:
+                self.claim.store(self.snapshot())
+            else:
+                self.claim.fail(error)
+        self._persist()
+
+    def attach(self, interview_id: int, stored: list[str]):
+        """Link the stream to the interview row created with its first ``stored`` questions."""
+        db = SessionLocal()
+        try:
+            InterviewRepository(db).set_generation_status(interview_id, GENERATING)
+        finally:
+            db.close()
+        with self._persist_lock:
+            self.interview_id = interview_id
+            self._persisted = len(stored)
+        with _streams_lock:
+            _streams[interview_id] = self
+        interview_cache.set_interview_questions(interview_id, stored)
+        schedule_question_audio(interview_id, stored)
+        self._persist()
+
+    def _persist(self):
+        with self._persist_lock:
+            if self.interview_id is None:
+                return
+            questions, done = self.snapshot(), self.done
+            if len(questions) > self._persisted or done:
+                self._write(questions, done)
+            if done:
+                with _streams_lock:
+                    _streams.pop(self.interview_id, None)
+
+    def _write(self, questions: list[str], done: bool):
+        start = self._persisted
+        db = SessionLocal()
+        try:
+            repo = InterviewRepository(db)
+            repo.write_questions(self.interview_id, questions)
+            if done:
+                if self.error is None:
+                    repo.set_generation_status(self.interview_id, DONE)
+                else:
+                    repo.set_generation_status(self.interview_id, FAILED, str(self.error))
+                QuestionBankRepository(db).add(self.payload, questions, source_interview_id=self.interview_id)
+        except Exception as exc:
+            print(f"[question-stream] Failed to store interview {self.interview_id} questions: {exc}")
+            return
+        finally:
+            db.close()
+        self._persisted = len(questions)
+        interview_cache.set_interview_questions(self.interview_id, questions)
+        schedule_question_audio(self.interview_id, questions[start:], start)
+
+
+def _generate(openai_service: OpenAIService, stream: QuestionStream):
+    try:
+        for question in openai_service.stream_interview_questions(stream.payload):
+            stream._append(question)
+    except Exception as exc:
+        print(f"[question-stream] Generation stopped after {len(stream.questions)} questions: {exc}")
+        stream._finish(exc)
+        return
+    stream._finish()
+
+
+def open_question_stream(
+    openai_service: OpenAIService, payload: InterviewSetupPayload
+) -> tuple[list[str] | None, QuestionStream | None]:
+    """A cached question set for ``payload``, or a stream of its questions.
+
+    The stream takes the question-set cache's claim for the setup and
+    generates; an identical setup claiming meanwhile gets a stream following
+    that one, so both can start on the first question.
+    """
+    stream = QuestionStream(payload)
+    questions, claim, source = question_set_cache.claim(payload, live=stream)
+    if questions is not None:
+        return questions, None
+    if source is not None:
+        stream.follow(source)
+    else:
+        stream.claim = claim
+        _generation_pool.submit(_generate, openai_service, stream)
+    return None, stream
+
+
+QuestionProgress = tuple[list[str], str | None, str | None]
+
+
+def _settled(questions: list[str], status: str | None, error: str | None, count: int) -> bool:
+    """Whether ``questions`` is an answer: ``count`` long, or final because generation is over."""
+    if len(questions) >= count or status in (None, DONE):
+        return True
+    if status == FAILED:
+        raise QuestionsUnavailable(f"Question generation failed: {error}")
+    return False
+
+
+def _stream_questions(stream: QuestionStream, count: int) -> list[str]:
+    questions = stream.wait_for(count, settings.question_stream_wait_seconds)
+    status = (FAILED if stream.error else DONE) if stream.done else GENERATING
+    if not _settled(questions, status, str(stream.error), count):
+        raise QuestionsUnavailable("Questions are still being generated; try again shortly")
+    return questions
+
+
+def _pending_stream(interview_id: int) -> QuestionStream | None:
+    with _streams_lock:
+        return _streams.get(interview_id)
+
+
+def ensure_questions(
+    interview_id: int, questions: list[str], count: int, reload: Callable[[], QuestionProgress]
+) -> list[str]:
+    """``questions`` extended to at least ``count`` items, or the interview's final list.
+
+    A shorter list is only returned once generation is done, so callers may
+    treat running past its end as completing the interview. The worker
+    running the stream waits on it; any other reloads the stored questions
+    every ``PENDING_POLL_SECONDS``. Raises QuestionsUnavailable if
+    generation failed or is still behind after ``question_stream_wait_seconds``.
+    """
+    if len(questions) >= count:
+        return questions
+    stream = _pending_stream(interview_id)
+    if stream is not None:
+        return _stream_questions(stream, count)
+    deadline = time.monotonic() + settings.question_stream_wait_seconds
+    while True:
+        questions, status, error = reload()
+        if _settled(questions, status, error, count):
+            return questions
+        if time.monotonic() >= deadline:
+            raise QuestionsUnavailable("Questions are still being generated; try again shortly")
+        time.sleep(PENDING_POLL_SECONDS)
+
+
+async def ensure_questions_async(
+    interview_id: int, questions: list[str], count: int, reload: Callable[[], Awaitable[QuestionProgress]]
+) -> list[str]:
+    if len(questions) >= count:
+        return questions
+    stream = _pending_stream(interview_id)
+    if stream is not None:
+        return await run_in_threadpool(_stream_questions, stream, count)
+    deadline = time.monotonic() + settings.question_stream_wait_seconds
+    while True:
+        questions, status, error = await reload()
+        if _settled(questions, status, error, count):
+            return questions
+        if time.monotonic() >= deadline:
+            raise QuestionsUnavailable("Questions are still being generated; try again shortly")
+        await asyncio.sleep(PENDING_POLL_SECONDS)
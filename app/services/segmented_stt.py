@@ -0,0 +1,178 @@
+import asyncio
+import wave
+from dataclasses import dataclass
+from typing import BinaryIO, Callable
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.services.audio_normalize import PcmNormalizer, run_in_normalize_pool, trim_trailing_silence
+from app.services.openai_service import AsyncOpenAIService
+from app.services.streaming_stt import EnergyVAD, StreamingTranscriber, pcm16_to_wav
+
+RAW_PCM_EXTENSIONS = (".pcm", ".raw")
+# Recording read, normalized and run through the splitter per normalization-pool hop.
+READ_FRAMES_MS = 5000
+
+
+class SilenceSplitter:
+    """Cuts 16-bit mono PCM into segments of roughly ``stt_split_target_ms``.
+
+    Once a segment reaches the target length it is closed at the end of the
+    next pause of at least ``stt_segment_pause_ms`` (or hard-cut at
+    ``stt_split_max_ms``), so words are not split across segments. Segments
+    without any speech are dropped.
+    """
+
+    def __init__(self, sample_rate: int, vad: EnergyVAD | None = None):
+        self.vad = vad or EnergyVAD(sample_rate)
+        self.target_frames = max(1, settings.stt_split_target_ms // self.vad.frame_ms)
+        self.max_frames = max(self.target_frames, settings.stt_split_max_ms // self.vad.frame_ms)
+        self.pause_frames = max(1, settings.stt_segment_pause_ms // self.vad.frame_ms)
+        self._remainder = b""
+        self._frames: list[bytes] = []
+        self._speech_frames = 0
+        self._silence_frames = 0
+
+    def feed(self, pcm: bytes) -> list[bytes]:
+        """Consume PCM and return the segments it closed, in order."""
+        data = self._remainder + pcm
+        frame_bytes = self.vad.frame_bytes
+        whole = len(data) - len(data) % frame_bytes
+        self._remainder = data[whole:]
+        segments = []
+        for offset in range(0, whole, frame_bytes):
+            frame = data[offset:offset + frame_bytes]
+            self._frames.append(frame)
+            if self.vad.is_speech(frame):
+                self._speech_frames += 1
+                self._silence_frames = 0
+            else:
+                self._silence_frames += 1
+
+            length = len(self._frames)
+            at_pause = length >= self.target_frames and self._silence_frames >= self.pause_frames
+            if at_pause or length >= self.max_frames:
+                segment = self._close()
+                if segment:
+                    segments.append(segment)
+        return segments
+
+    def flush(self) -> bytes | None:
+        """Close the last segment, including any partial trailing frame."""
+        if self._remainder:
+            self._frames.append(self._remainder)
+            self._remainder = b""
+        return self._close()
+
+    def _close(self) -> bytes | None:
+        frames, self._frames = self._frames, []
+        had_speech = self._speech_frames > 0
+        self._speech_frames = 0
+        self._silence_frames = 0
+        return b"".join(frames) if had_speech else None
+
+
+@dataclass
+class _PcmSource:
+    read: Callable[[int], bytes]
+    sample_rate: int
+    channels: int = 1
+    sample_width: int = 2
+
+
+def _open_pcm(filename: str, audio_file: BinaryIO) -> _PcmSource | None:
+    """Expose WAV or raw 16-bit mono PCM as a PCM reader; None for other formats.
+
+    Compressed uploads (webm, mp3, ...) cannot be normalized or cut without
+    decoding them, so they keep the single-request path.
+    """
+    header = audio_file.read(12)
+    audio_file.seek(0)
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        try:
+            wav = wave.open(audio_file, "rb")
+        except (wave.Error, EOFError):
+            audio_file.seek(0)
+            return None
+        return _PcmSource(wav.readframes, wav.getframerate(), wav.getnchannels(), wav.getsampwidth())
+
+    if filename.lower().endswith(RAW_PCM_EXTENSIONS):
+        return _PcmSource(lambda frames: audio_file.read(frames * 2), settings.stt_sample_rate)
+    return None
+
+
+async def transcribe_recording(openai_service: AsyncOpenAIService, filename: str, audio_file: BinaryIO) -> str:
+    """Transcribe a complete recording; WAV/PCM is normalized and long audio split.
+
+    WAV/PCM input is read in ``READ_FRAMES_MS`` blocks, each downmixed,
+    resampled to ``stt_sample_rate`` and trimmed of leading silence in the
+    normalization pool, so neither the raw nor the normalized recording is
+    ever held whole and STT receives far fewer bytes. Once more than
+    ``stt_split_min_ms`` of normalized audio has come out, the rest is cut by
+    SilenceSplitter as it is read (trailing silence ends up in a segment
+    without speech, which is dropped); every segment is sent to STT as soon
+    as it closes, at most ``stt_split_concurrency`` at a time, and the texts
+    are joined in order. Shorter audio is trimmed of trailing silence and
+    sent as one request, or not sent at all (returning "") when the VAD hears
+    no speech in it; compressed formats are sent as received.
+    """
+    source = await run_in_threadpool(_open_pcm, filename, audio_file)
+    if source is None:
+        return await openai_service.transcribe_file(filename, audio_file)
+
+    sample_rate = settings.stt_sample_rate
+    normalizer = PcmNormalizer(source.sample_rate, source.channels, source.sample_width)
+    read_frames = max(1, source.sample_rate * READ_FRAMES_MS // 1000)
+    split_min_bytes = sample_rate * settings.stt_split_min_ms // 1000 * 2
+
+    def read_normalized() -> tuple[bool, bytes]:
+        block = source.read(read_frames)
+        if not block:
+            return True, normalizer.flush()
+        return False, normalizer.feed(block)
+
+    head, done = bytearray(), False
+    while not done and len(head) < split_min_bytes:
+        done, pcm = await run_in_normalize_pool(read_normalized)
+        head += pcm
+    if done:
+        if not normalizer.heard_speech:
+            return ""
+        pcm = await run_in_normalize_pool(trim_trailing_silence, bytes(head))
+        if len(pcm) < split_min_bytes:
+            wav_bytes = await run_in_threadpool(pcm16_to_wav, pcm, sample_rate)
+            return await openai_service.transcribe_audio("audio.wav", wav_bytes)
+
+    splitter = SilenceSplitter(sample_rate)
+    semaphore = asyncio.Semaphore(settings.stt_split_concurrency)
+    tasks: list[asyncio.Task] = []
+
+    async def transcribe_segment(index: int, segment: bytes) -> str:
+        async with semaphore:
+            wav_bytes = await run_in_threadpool(pcm16_to_wav, segment, sample_rate)
+            return await openai_service.transcribe_audio(f"segment-{index}.wav", wav_bytes)
+
+    def split(pcm: bytes, last: bool) -> list[bytes]:
+        segments = splitter.feed(pcm)
+        tail = splitter.flush() if last else None
+        return segments + [tail] if tail else segments
+
+    def read_segments() -> tuple[bool, list[bytes]]:
+        last, pcm = read_normalized()
+        return last, split(pcm, last)
+
+    try:
+        segments = await run_in_threadpool(split, bytes(head), done)
+        head = None
+        while True:
+            for segment in segments:
+                tasks.append(asyncio.create_task(transcribe_segment(len(tasks), segment)))
+            if done:
+                break
+            done, segments = await run_in_normalize_pool(read_segments)
+        return StreamingTranscriber.join_segments(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
@@ -0,0 +1,100 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, TypeVar
+
+from app.models.collector_session import CollectorSession
+from app.repositories.collector_repository import CollectorRepository
+
+T = TypeVar("T")
+
+
+@dataclass
+class CollectorSessionState:
+    id: int
+    user_id: str | None
+    status: str
+    current_field: str
+    payload: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_model(cls, session: CollectorSession) -> "CollectorSessionState":
+        return cls(
+            id=session.id,
+            user_id=session.user_id,
+            status=session.status,
+            current_field=session.current_field,
+            payload=CollectorRepository.parse_payload(session),
+        )
+
+
+@dataclass
+class InterviewSessionState:
+    id: int
+    interview_id: int
+    user_id: str | None
+    status: str
+    current_index: int
+    questions: list[str]
+
+
+class SessionActor:
+    """Authoritative in-memory state of one session while sockets are attached.
+
+    Turns for the session run under ``lock``, one at a time, whichever socket
+    they arrive on. Each turn reads ``state`` instead of the database and
+    writes changes through to the repositories with ``write_through``.
+    """
+
+    def __init__(self, key: tuple[str, int], state: CollectorSessionState | InterviewSessionState):
+        self.key = key
+        self.state = state
+        self.lock = asyncio.Lock()
+        self.sockets = 0
+
+    @staticmethod
+    async def write_through(write: Awaitable[T]) -> T:
+        """Await a repository write even if the turn is cancelled meanwhile.
+
+        A threadpool write cannot be stopped once started, so a cancelled turn
+        keeps holding ``lock`` until the write (and the in-memory update that
+        goes with it) has landed; the next turn never sees a half-applied one.
+        """
+        task = asyncio.ensure_future(write)
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            await asyncio.gather(task, return_exceptions=True)
+            raise
+
+
+class SessionActorRegistry:
+    """One SessionActor per (session type, session id), shared by attached sockets.
+
+    Only touched from the event loop. The actor is dropped when its last
+    socket detaches, so the next socket starts again from the database; REST
+    routes always read and write the database directly.
+    """
+
+    def __init__(self):
+        self._actors: dict[tuple[str, int], SessionActor] = {}
+
+    def attach(self, session_type: str, session_id: int, state) -> SessionActor:
+        """Return the live actor for the session, or register one around ``state``."""
+        key = (session_type, session_id)
+        actor = self._actors.get(key)
+        if actor is None:
+            actor = SessionActor(key, state)
+            self._actors[key] = actor
+        actor.sockets += 1
+        return actor
+
+    def detach(self, actor: SessionActor):
+        actor.sockets -= 1
+        if actor.sockets <= 0 and self._actors.get(actor.key) is actor:
+            del self._actors[actor.key]
+
+    def get(self, session_type: str, session_id: int) -> SessionActor | None:
+        return self._actors.get((session_type, session_id))
+
+
+session_actors = SessionActorRegistry()
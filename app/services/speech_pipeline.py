@@ -0,0 +1,86 @@
+import asyncio
+import re
+from typing import AsyncIterator, Awaitable, Callable, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?…])[\"')\]]*\s+")
+
+
+async def iter_sentences(deltas: AsyncIterator[str], min_chars: int | None = None) -> AsyncIterator[str]:
+    """Re-chunk streamed LLM text deltas into sentences.
+
+    A sentence is emitted as soon as its terminating punctuation and the
+    following whitespace have arrived. Fragments shorter than ``min_chars`` are
+    merged into the next sentence so TTS is not called for "Great." alone.
+    """
+    min_chars = settings.voice_sentence_min_chars if min_chars is None else min_chars
+    buffer = ""
+    async for delta in deltas:
+        buffer += delta
+        start = 0
+        for match in SENTENCE_BOUNDARY.finditer(buffer):
+            candidate = buffer[start:match.end()].strip()
+            if len(candidate) < min_chars:
+                continue
+            yield candidate
+            start = match.end()
+        buffer = buffer[start:]
+
+    tail = buffer.strip()
+    if tail:
+        yield tail
+
+
+async def synthesize_in_order(
+    sentences: AsyncIterator[str],
+    synthesize: Callable[[str], Awaitable[T]],
+    max_in_flight: int | None = None,
+) -> AsyncIterator[tuple[str, T]]:
+    """Start synthesis for each sentence as soon as it arrives, yield results in order.
+
+    Up to ``max_in_flight`` synthesis calls run concurrently with the sentence
+    source, so speech for sentence N is usually ready while the LLM is still
+    writing sentence N+1.
+    """
+    max_in_flight = max_in_flight or settings.voice_tts_pipeline_concurrency
+    semaphore = asyncio.Semaphore(max_in_flight)
+    queue: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    async def run_one(sentence: str) -> T:
+        async with semaphore:
+            return await synthesize(sentence)
+
+    async def produce():
+        try:
+            async for sentence in sentences:
+                await queue.put((sentence, asyncio.create_task(run_one(sentence))))
+        except Exception as exc:
+            await queue.put(exc)
+        else:
+            await queue.put(done)
+
+    producer = asyncio.create_task(produce())
+    pending: list[asyncio.Task] = []
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            sentence, task = item
+            pending.append(task)
+            yield sentence, await task
+            pending.remove(task)
+    finally:
+        producer.cancel()
+        while not queue.empty():
+            item = queue.get_nowait()
+            if isinstance(item, tuple):
+                pending.append(item[1])
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,46 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Thread
+
+from app.core.audio_cache import speech_cache
+from app.core.config import settings
+from app.services.interview_flow_service import InterviewFlowService
+from app.services.openai_pool import provider_api_key
+from app.services.openai_service import OpenAIService
+from app.services.provider_scheduler import Priority
+
+PREWARM_CONCURRENCY = 4
+
+
+def register_static_speech() -> list[str]:
+    texts = InterviewFlowService.static_assistant_messages()
+    speech_cache.register_static(texts)
+    speech_cache.load()
+    return texts
+
+
+def prewarm_static_speech(texts: list[str]):
+    """Synthesize every static prompt that is not cached yet."""
+    openai_service = OpenAIService(priority=Priority.BACKGROUND)
+    missing = [text for text in texts if not speech_cache.contains(OpenAIService.speech_cache_key(text))]
+    if not missing:
+        print(f"[audio-cache] {len(texts)} static prompts already cached")
+        return
+
+    def render(text: str) -> bool:
+        try:
+            openai_service.synthesize_speech(text, cacheable=True)
+            return True
+        except Exception as exc:
+            print(f"[audio-cache] Failed to prewarm prompt: {exc}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=PREWARM_CONCURRENCY) as pool:
+        rendered = sum(pool.map(render, missing))
+    print(f"[audio-cache] Prewarmed {rendered}/{len(missing)} static prompts")
+
+
+def start_speech_prewarm():
+    texts = register_static_speech()
+    if not settings.audio_cache_prewarm or not provider_api_key():
+        return
+    Thread(target=prewarm_static_speech, args=(texts,), name="speech-prewarm", daemon=True).start()
@@ -0,0 +1,182 @@
+import asyncio
+import wave
+from io import BytesIO
+from typing import Awaitable, Callable
+
+import numpy as np
+
+from app.core.config import settings
+
+Transcriber = Callable[[str, bytes], Awaitable[str]]
+
+
+def pcm16_to_wav(pcm: bytes, sample_rate: int, channels: int = 1) -> bytes:
+    buffer = BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(channels)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(pcm)
+    return buffer.getvalue()
+
+
+def pcm16_rms(frame: bytes) -> float:
+    samples = np.frombuffer(frame, dtype="<i2").astype(np.float32)
+    if not samples.size:
+        return 0.0
+    return float(np.sqrt(np.mean(np.square(samples))))
+
+
+class EnergyVAD:
+    """Frame-level speech detector for 16-bit mono PCM based on RMS energy."""
+
+    def __init__(self, sample_rate: int, frame_ms: int | None = None, threshold: float | None = None):
+        self.frame_ms = frame_ms or settings.stt_vad_frame_ms
+        self.threshold = settings.stt_vad_energy_threshold if threshold is None else threshold
+        self.frame_bytes = int(sample_rate * self.frame_ms / 1000) * 2
+
+    def is_speech(self, frame: bytes) -> bool:
+        return pcm16_rms(frame) >= self.threshold
+
+
+class StreamingTranscriber:
+    """Incremental transcription of one utterance streamed as PCM chunks.
+
+    Speech is cut into segments at short pauses (or at a maximum length), and
+    each segment is sent to ``transcribe`` as soon as it closes, while the
+    candidate keeps talking. Completed segments in order form the partial
+    transcript. A long enough pause after speech marks the end of the
+    utterance, at which point only the last segment is still outstanding.
+    """
+
+    def __init__(
+        self,
+        transcribe: Transcriber,
+        sample_rate: int = 16000,
+        vad: EnergyVAD | None = None,
+        max_in_flight: int | None = None,
+    ):
+        self.transcribe = transcribe
+        self.sample_rate = sample_rate
+        self.vad = vad or EnergyVAD(sample_rate)
+        self.segment_pause_frames = max(1, settings.stt_segment_pause_ms // self.vad.frame_ms)
+        self.endpoint_frames = max(1, settings.stt_endpoint_silence_ms // self.vad.frame_ms)
+        self.max_segment_frames = max(1, settings.stt_max_segment_ms // self.vad.frame_ms)
+        self.preroll_frames = max(0, settings.stt_preroll_ms // self.vad.frame_ms)
+        self._semaphore = asyncio.Semaphore(max_in_flight or settings.stt_stream_concurrency)
+        self._reset_state()
+
+    def _reset_state(self):
+        self._remainder = b""
+        self._preroll: list[bytes] = []
+        self._segment: list[bytes] = []
+        self._speech_frames = 0
+        self._silence_frames = 0
+        self._heard_speech = False
+        self._tasks: list[asyncio.Task] = []
+        self._last_partial = ""
+        self.endpointed = False
+
+    @property
+    def heard_speech(self) -> bool:
+        return self._heard_speech
+
+    def feed(self, pcm: bytes) -> bool:
+        """Consume a chunk; return True once the end of the utterance is detected.
+
+        Audio after the endpoint is kept, and take_utterance starts the next
+        utterance with it.
+        """
+        data = self._remainder + pcm
+        frame_bytes = self.vad.frame_bytes
+        whole = len(data) - len(data) % frame_bytes
+        self._remainder = data[whole:]
+        for offset in range(0, whole, frame_bytes):
+            if self.endpointed:
+                self._remainder = data[offset:]
+                break
+            self._feed_frame(data[offset:offset + frame_bytes])
+        return self.endpointed
+
+    def _feed_frame(self, frame: bytes):
+        speech = self.vad.is_speech(frame)
+        if not self._segment:
+            if not speech:
+                self._preroll.append(frame)
+                if len(self._preroll) > self.preroll_frames:
+                    self._preroll.pop(0)
+                if self._heard_speech:
+                    self._silence_frames += 1
+                    if self._silence_frames >= self.endpoint_frames:
+                        self.endpointed = True
+                return
+            self._segment = self._preroll
+            self._preroll = []
+
+        self._segment.append(frame)
+        if speech:
+            self._heard_speech = True
+            self._speech_frames += 1
+            self._silence_frames = 0
+        else:
+            self._silence_frames += 1
+
+        if self._silence_frames >= self.segment_pause_frames or len(self._segment) >= self.max_segment_frames:
+            self._close_segment()
+            if self._silence_frames >= self.endpoint_frames:
+                self.endpointed = True
+
+    def _close_segment(self):
+        segment, self._segment = self._segment, []
+        if self._speech_frames == 0:
+            return
+        self._speech_frames = 0
+        wav_bytes = pcm16_to_wav(b"".join(segment), self.sample_rate)
+        filename = f"segment-{len(self._tasks)}.wav"
+        self._tasks.append(asyncio.get_running_loop().create_task(self._transcribe_segment(filename, wav_bytes)))
+
+    async def _transcribe_segment(self, filename: str, wav_bytes: bytes) -> str:
+        async with self._semaphore:
+            return (await self.transcribe(filename, wav_bytes)).strip()
+
+    def take_partial(self) -> str | None:
+        """Return the transcript of the completed segment prefix if it changed."""
+        texts = []
+        for task in self._tasks:
+            if not task.done() or task.cancelled() or task.exception():
+                break
+            texts.append(task.result())
+        partial = " ".join(text for text in texts if text)
+        if partial == self._last_partial:
+            return None
+        self._last_partial = partial
+        return partial
+
+    def take_utterance(self) -> asyncio.Future:
+        """Flush the open segment and hand over the utterance's pending transcriptions.
+
+        The transcriber is reset immediately, so audio fed afterwards (and any
+        fed past the endpoint) starts a new utterance while the returned future
+        resolves to the segment texts.
+        """
+        if self._segment:
+            self._close_segment()
+        tasks = self._tasks
+        carry = self._remainder if self.endpointed else b""
+        self._reset_state()
+        if carry:
+            self.feed(carry)
+        return asyncio.gather(*tasks)
+
+    @staticmethod
+    def join_segments(texts: list[str]) -> str:
+        return " ".join(text for text in texts if text).strip()
+
+    async def finish(self) -> str:
+        """Flush the open segment and return the full transcript of the utterance."""
+        return self.join_segments(await self.take_utterance())
+
+    def cancel(self):
+        for task in self._tasks:
+            task.cancel()
+        self._reset_state()
@@ -5,6 +5,11 @@ from app.api.router import api_router
 from app.core.config import settings
 from app.db.base import Base
 from app.db.session import engine
+from app.services.openai_pool import openai_pool
+from app.services.provider_guard import provider_guard
+from app.services.provider_scheduler import provider_scheduler
+from app.services.question_bank import start_question_bank_worker, stop_question_bank_worker
+from app.services.speech_prewarm import start_speech_prewarm
 from app import models  # noqa: F401
 
 app = FastAPI(title=settings.app_name)
@@ -38,6 +43,36 @@ def on_startup():
         traceback.print_exc()
 
 
+@app.on_event("startup")
+def start_audio_cache():
+    try:
+        start_speech_prewarm()
+    except Exception as exc:
+        print(f"[startup-error] Audio cache initialization failed: {exc}")
+
+
+@app.on_event("startup")
+def start_question_bank():
+    try:
+        start_question_bank_worker()
+    except Exception as exc:
+        print(f"[startup-error] Question bank worker failed to start: {exc}")
+
+
+@app.on_event("startup")
+async def warm_openai_connections():
+    try:
+        await openai_pool.warm()
+    except Exception as exc:
+        print(f"[startup-error] OpenAI connection warm-up failed: {exc}")
+
+
+@app.on_event("shutdown")
+async def close_openai_clients():
+    stop_question_bank_worker()
+    await openai_pool.close()
+
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
@@ -55,4 +90,14 @@ def health_db():
         return {"status": "error", "database": str(exc)}
 
 
+@app.get("/health/openai")
+def health_openai():
+    return {
+        "status": "degraded" if provider_guard.any_open() else "ok",
+        "pool": openai_pool.metrics(),
+        "scheduler": provider_scheduler.metrics(),
+        "resilience": provider_guard.metrics(),
+    }
+
+
 app.include_router(api_router, prefix=settings.api_prefix)
@@ -0,0 +1,77 @@
+"""Test setup: the app runs against the in-process fake OpenAI provider and a throwaway SQLite DB.
+
+Settings are read when ``app.core.config`` is imported, so the environment
+is prepared here, before any app module is.
+"""
+import os
+import tempfile
+from collections import Counter
+
+import pytest
+
+_tmp = tempfile.mkdtemp(prefix="interview-tests-")
+os.environ.pop("OPENAI_API_KEY", None)
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{_tmp}/test.db",
+    OPENAI_PROVIDER="fake",
+    FAKE_OPENAI_PROFILE="instant",
+    OPENAI_WARM_CONNECTIONS="0",
+    QUESTION_BANK_WORKER="false",
+    QUESTION_AUDIO_PRERENDER="false",
+    AUDIO_CACHE_PREWARM="false",
+    AUDIO_CACHE_DIR=f"{_tmp}/audio_cache",
+    QUESTION_AUDIO_DIR=f"{_tmp}/question_audio",
+)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+import main  # noqa: E402
+from app.services.fake_openai import PROFILES, fake_transport  # noqa: E402
+
+
+def pytest_addoption(parser):
+    parser.addoption("--benchmark", action="store_true", help="also run the wall-clock benchmarks")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: wall-clock benchmark, skipped unless --benchmark is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark; run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def fake_backend():
+    """The fake provider's backend; a test may set ``profile`` and it is reset afterwards."""
+    backend = fake_transport().backend
+    yield backend
+    backend.profile = PROFILES["instant"]
+
+
+@pytest.fixture
+def provider_calls(fake_backend, monkeypatch):
+    """Counts fake provider requests by endpoint: ``chat``, ``speech``, ``transcription``."""
+    calls = Counter()
+    reply = fake_backend.reply
+
+    def counting(method, path, body, content_type=""):
+        for endpoint, suffix in (("chat", "/chat/completions"), ("speech", "/audio/speech"),
+                                 ("transcription", "/audio/transcriptions")):
+            if path.endswith(suffix):
+                calls[endpoint] += 1
+        return reply(method, path, body, content_type)
+
+    monkeypatch.setattr(fake_backend, "reply", counting)
+    return calls
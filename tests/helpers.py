@@ -0,0 +1,60 @@
+"""Helpers shared by the test modules; the fixtures are in conftest.py."""
+import json
+import math
+from array import array
+
+from fastapi.testclient import TestClient
+
+from app.services.fake_openai import load_profile
+
+SAMPLE_RATE = 16000
+
+
+def latency_profile(**endpoints: float) -> dict:
+    """A fixed-latency profile, e.g. ``latency_profile(chat=400)`` for 400 ms chat calls."""
+    return load_profile(json.dumps({name: {"median_ms": ms, "p99_ms": ms} for name, ms in endpoints.items()}))
+
+
+def create_interview(client: TestClient, amount: int = 3, techstack: str = "python") -> int:
+    """Run the collector through every field over REST; returns the new interview id."""
+    session_id = client.post("/api/collector/start", json={"audio_policy": "none"}).json()["collector_session_id"]
+    for message in ["yes", "backend developer", "technical", "junior", techstack, str(amount)]:
+        reply = client.post(
+            f"/api/collector/{session_id}/turn", json={"user_message": message, "audio_policy": "none"}
+        ).json()
+    return reply["interview_id"]
+
+
+def start_interview_session(client: TestClient, amount: int = 3) -> int:
+    interview_id = create_interview(client, amount)
+    return client.post(f"/api/interviews/{interview_id}/start", json={"audio_policy": "none"}).json()[
+        "interview_session_id"
+    ]
+
+
+def receive_until(websocket, types: set[str]) -> list[dict | bytes]:
+    """Socket messages up to and including the first JSON message whose type is in ``types``.
+
+    An unexpected ``error`` message fails the test instead of waiting forever.
+    """
+    messages = []
+    while True:
+        message = websocket.receive()
+        if message.get("bytes") is not None:
+            messages.append(message["bytes"])
+            continue
+        data = json.loads(message["text"])
+        messages.append(data)
+        if data["type"] in types:
+            return messages
+        assert data["type"] != "error", data
+
+
+def tone(ms: int, amplitude: int = 8000) -> bytes:
+    """A 220 Hz tone as 16-bit mono PCM at SAMPLE_RATE, loud enough for the VAD to count as speech."""
+    count = SAMPLE_RATE * ms // 1000
+    return array("h", (int(amplitude * math.sin(2 * math.pi * 220 * i / SAMPLE_RATE)) for i in range(count))).tobytes()
+
+
+def silence(ms: int) -> bytes:
+    return bytes(SAMPLE_RATE * ms // 1000 * 2)
@@ -0,0 +1,38 @@
+"""Barge-in cancels the assistant's reply, never the candidate's answer."""
+from app.core.config import settings
+from app.services.streaming_stt import pcm16_to_wav
+from tests.helpers import SAMPLE_RATE, latency_profile, receive_until, start_interview_session, tone
+
+
+def _user_messages(client, session_id: int) -> list[str]:
+    items = client.get(f"/api/transcripts/interview/{session_id}").json()["items"]
+    return [item["message"] for item in items if item["speaker"] == "user"]
+
+
+def test_interrupt_during_transcription_keeps_the_answer(client, fake_backend, monkeypatch):
+    monkeypatch.setattr(settings, "fake_openai_transcript", "I would shard by tenant.")
+    session_id = start_interview_session(client)
+    fake_backend.profile = latency_profile(transcription=300, chat=300)
+    with client.websocket_connect(f"/api/interviews/sessions/{session_id}/voice?audio_mode=binary") as websocket:
+        receive_until(websocket, {"assistant_prompt"})
+        websocket.send_bytes(pcm16_to_wav(tone(500), SAMPLE_RATE))
+        websocket.send_json({"type": "audio_end", "filename": "answer.wav"})
+        websocket.send_json({"type": "interrupt"})
+        interrupted = receive_until(websocket, {"interrupted", "assistant_turn"})[-1]
+
+    assert interrupted == {"type": "interrupted", "assistant_text": None}
+    assert _user_messages(client, session_id) == ["I would shard by tenant."]
+
+
+def test_upload_chunks_do_not_barge_in(client, fake_backend):
+    session_id = start_interview_session(client)
+    fake_backend.profile = latency_profile(chat=300)
+    with client.websocket_connect(f"/api/interviews/sessions/{session_id}/voice?audio_mode=binary") as websocket:
+        receive_until(websocket, {"assistant_prompt"})
+        websocket.send_json({"type": "user_text", "text": "I would add an index."})
+        # The start of the next recording, sent while the reply is still being written.
+        websocket.send_bytes(bytes(3200))
+        messages = receive_until(websocket, {"interrupted", "assistant_turn"})
+
+    assert messages[-1]["type"] == "assistant_turn"
+    assert messages[-1]["user_text"] == "I would add an index."
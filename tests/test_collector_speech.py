@@ -0,0 +1,82 @@
+"""Each collector reply is synthesized at most once, and cached speech is not synthesized again."""
+import pytest
+
+from tests.helpers import receive_until
+
+# Field answers in collector order; every one moves the session to the next field.
+ANSWERS = ["yes", "backend developer", "technical", "junior", "python", "3"]
+
+
+def _start(client, audio_policy: str = "none", candidate_name: str | None = None) -> int:
+    body = {"audio_policy": audio_policy, "candidate_name": candidate_name}
+    return client.post("/api/collector/start", json=body).json()["collector_session_id"]
+
+
+@pytest.mark.parametrize("audio_policy, speech_calls", [("inline", 1), ("none", 0)])
+def test_rest_turn_synthesizes_once_per_policy(client, provider_calls, audio_policy, speech_calls):
+    session_id = _start(client)
+    for answer in ANSWERS:
+        provider_calls.clear()
+        reply = client.post(
+            f"/api/collector/{session_id}/turn", json={"user_message": answer, "audio_policy": audio_policy}
+        ).json()
+        assert provider_calls["speech"] == speech_calls, (answer, reply["assistant_message"])
+        assert (reply["assistant_audio_base64"] is not None) == bool(speech_calls)
+    assert reply["completed"]
+
+
+def test_static_prompt_speech_is_served_from_the_cache(client, provider_calls):
+    # The opening prompt without a name is static: the first start may render it, later ones never do.
+    _start(client, audio_policy="inline")
+    provider_calls.clear()
+    response = client.post("/api/collector/start", json={"audio_policy": "inline"}).json()
+    assert response["assistant_audio_base64"]
+    assert provider_calls["speech"] == 0
+
+
+def test_start_replies_text_only_when_the_service_cannot_be_built(client, monkeypatch):
+    def unavailable(**options):
+        raise ValueError("bad audio settings")
+
+    monkeypatch.setattr("app.api.routes.collector.OpenAIService", unavailable)
+    response = client.post("/api/collector/start", json={"audio_policy": "inline"})
+    assert response.status_code == 200
+    assert response.json()["assistant_audio_base64"] is None
+
+
+@pytest.mark.parametrize("audio_mode", ["base64", "binary"])
+def test_socket_turn_synthesizes_once(client, provider_calls, audio_mode):
+    session_id = _start(client, candidate_name="Ada")
+    url = f"/api/collector/sessions/{session_id}/voice?audio_mode={audio_mode}"
+    with client.websocket_connect(url) as websocket:
+        receive_until(websocket, {"assistant_prompt"})
+        for answer in ANSWERS:
+            provider_calls.clear()
+            websocket.send_json({"type": "user_text", "text": answer})
+            messages = receive_until(websocket, {"assistant_turn"})
+            turn = messages[-1]
+            if audio_mode == "binary":
+                segments = [m for m in messages if isinstance(m, dict) and m["type"] == "audio_segment"]
+                # Binary replies are spoken sentence by sentence, one TTS call each.
+                assert provider_calls["speech"] == len(segments) >= 1, turn["assistant_text"]
+                assert any(isinstance(m, bytes) for m in messages)
+            else:
+                assert provider_calls["speech"] == 1, turn["assistant_text"]
+                assert turn["assistant_audio_base64"]
+        receive_until(websocket, {"completed"})
+
+
+@pytest.mark.parametrize("audio_mode", ["base64", "binary"])
+def test_reconnect_replays_the_last_reply_without_synthesis(client, provider_calls, audio_mode):
+    session_id = _start(client, candidate_name="Grace")
+    url = f"/api/collector/sessions/{session_id}/voice?audio_mode={audio_mode}"
+    with client.websocket_connect(url) as websocket:
+        receive_until(websocket, {"assistant_prompt"})
+        websocket.send_json({"type": "user_text", "text": ANSWERS[0]})
+        spoken = receive_until(websocket, {"assistant_turn"})[-1]
+
+    provider_calls.clear()
+    with client.websocket_connect(url) as websocket:
+        replayed = receive_until(websocket, {"assistant_prompt"})[-1]
+    assert replayed["assistant_text"] == spoken["assistant_text"]
+    assert provider_calls["speech"] == 0
@@ -0,0 +1,70 @@
+"""The pooled OpenAI clients reuse kept-alive connections, as reported by their metrics."""
+import asyncio
+import socket
+import threading
+import time
+
+import pytest
+import uvicorn
+
+from app.core.config import settings
+from app.services.fake_openai import FakeOpenAIBackend, PROFILES, create_app
+from app.services.openai_pool import OpenAIClientPool
+
+REQUESTS = 5
+
+
+@pytest.fixture(scope="module")
+def fake_server_url():
+    """The fake provider served over real HTTP, so the clients open actual connections."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(create_app(FakeOpenAIBackend(PROFILES["instant"])), port=port, log_level="warning")
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    yield f"http://127.0.0.1:{port}/v1"
+    server.should_exit = True
+    thread.join()
+
+
+@pytest.fixture
+def pool(fake_server_url, monkeypatch):
+    monkeypatch.setattr(settings, "openai_provider", "openai")
+    monkeypatch.setattr(settings, "openai_base_url", fake_server_url)
+    client_pool = OpenAIClientPool()
+    yield client_pool
+    asyncio.run(client_pool.close())
+
+
+def test_sync_client_reuses_its_connection(pool):
+    client = pool.sync_client("sk-test")
+    for _ in range(REQUESTS):
+        client.models.retrieve(settings.openai_model)
+
+    metrics = pool.metrics()["sync"]
+    assert metrics["requests"] == REQUESTS
+    assert metrics["new_connections"] == 1
+    assert metrics["reused_connections"] == REQUESTS - 1
+
+
+def test_async_client_reuses_its_connections(pool):
+    async def run():
+        client = pool.async_client("sk-test")
+        for _ in range(REQUESTS):
+            await client.models.retrieve(settings.openai_model)
+        # Concurrent calls may open more connections, but stay within the pool.
+        await asyncio.gather(*(client.models.retrieve(settings.openai_model) for _ in range(REQUESTS)))
+        # The async client belongs to this loop, so it is closed here.
+        await pool.close()
+
+    asyncio.run(run())
+    metrics = pool.metrics()["async"]
+    assert metrics["requests"] == 2 * REQUESTS
+    assert metrics["new_connections"] <= REQUESTS
+    assert metrics["reused_connections"] >= REQUESTS
+    assert metrics["reuse_ratio"] >= 0.5
@@ -0,0 +1,34 @@
+"""Pre-rendered question audio shared between readers."""
+import asyncio
+from concurrent.futures import Future
+
+from app.api.routes import voice
+from app.core.config import settings
+from app.services.interview_flow_service import InterviewFlowService
+from app.services.question_audio import question_prompts
+
+
+def test_cancelled_reader_leaves_the_pending_render_alone(monkeypatch):
+    pending = Future()
+    monkeypatch.setattr(voice, "pending_question_audio", lambda interview_id, index, text: pending)
+
+    async def read_and_cancel():
+        service = voice.AsyncOpenAIService()
+        reader = asyncio.create_task(voice._question_audio(service, 1, 0, "What is an index?"))
+        await asyncio.sleep(0.01)
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
+
+    asyncio.run(read_and_cancel())
+    assert not pending.cancelled()
+
+
+def test_transitions_are_pre_rendered_only_for_split_replies(monkeypatch):
+    questions = ["What is an index?", "When would you denormalize?"]
+    monkeypatch.setattr(settings, "interview_reply_mode", "combined")
+    assert [index for index, _ in question_prompts(questions)] == [0, 1]
+
+    monkeypatch.setattr(settings, "interview_reply_mode", "split")
+    prompts = question_prompts(questions)
+    assert [index for index, _ in prompts] == [0, 1, 1]
+    assert prompts[-1][1] == InterviewFlowService.build_next_question_prompt(questions[1])
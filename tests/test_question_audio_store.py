@@ -0,0 +1,31 @@
+"""The on-disk question audio store stays within its byte limit."""
+import os
+
+from app.core.question_audio_store import QuestionAudioStore
+
+CLIP = b"\x00" * 1000
+
+
+def test_least_recently_used_interviews_are_evicted(tmp_path):
+    store = QuestionAudioStore(str(tmp_path), max_disk_bytes=4 * len(CLIP))
+    for interview_id in (1, 2):
+        store.put(interview_id, 0, "First question", CLIP)
+        store.put(interview_id, 1, "Second question", CLIP)
+    # Reading interview 1 makes interview 2 the least recently used.
+    assert store.get(1, 0, "First question") == CLIP
+    store.put(3, 0, "First question", CLIP)
+
+    assert sorted(os.listdir(tmp_path)) == ["1", "3"]
+    assert store.get(2, 0, "First question") is None
+    assert store.get(1, 1, "Second question") == CLIP
+
+
+def test_limit_holds_across_restarts(tmp_path):
+    store = QuestionAudioStore(str(tmp_path), max_disk_bytes=2 * len(CLIP))
+    store.put(1, 0, "First question", CLIP)
+    store.put(1, 0, "First question", CLIP)
+    store.put(2, 0, "First question", CLIP)
+
+    restarted = QuestionAudioStore(str(tmp_path), max_disk_bytes=2 * len(CLIP))
+    restarted.put(3, 0, "First question", CLIP)
+    assert sorted(os.listdir(tmp_path)) == ["2", "3"]
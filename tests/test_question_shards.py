@@ -0,0 +1,114 @@
+"""Sharded question generation: planning, near-duplicate removal, top-up and wall-clock time per shard count."""
+import json
+import re
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.schemas.interview import InterviewSetupPayload
+from app.services.fake_openai import load_profile
+from app.services.openai_service import OpenAIService
+from app.services.question_shards import QuestionDeduper, merge_shards, plan_shards
+
+GENERATORS = {
+    "batch": lambda service, payload: service.generate_interview_questions(payload, use_cache=False),
+    "stream": lambda service, payload: list(service.stream_interview_questions(payload)),
+}
+
+
+def _payload(amount: int, techstack: list[str] | None = None) -> InterviewSetupPayload:
+    return InterviewSetupPayload(
+        role="backend developer",
+        interview_type="technical",
+        level="senior",
+        techstack=techstack or ["python"],
+        amount=amount,
+    )
+
+
+def _assert_distinct(questions: list[str]):
+    assert QuestionDeduper().filter(questions) == questions
+
+
+def test_deduper_drops_rephrasings_only():
+    deduper = QuestionDeduper()
+    assert deduper.add("How would you approach caching in a Python project?")
+    assert not deduper.add("how would you approach CACHING in a python project")
+    assert not deduper.add("In a Python project, how would you approach caching?")
+    assert deduper.add("How would you approach logging in a Go project?")
+    assert not deduper.add("?!")
+
+
+def test_plan_splits_by_tech_or_difficulty_band():
+    shards, interleave = plan_shards(_payload(30, ["python", "go", "sql", "docker", "redis"]))
+    assert interleave
+    assert len(shards) == settings.question_shard_max
+    assert sum(shard.payload.amount for shard in shards) == 30
+    assert shards[0].focus == "Only ask about python, redis."
+
+    shards, interleave = plan_shards(_payload(30))
+    assert not interleave
+    assert [shard.focus.split(" for ")[0] for shard in shards] == [f"Difficulty band {n} of 4" for n in range(1, 5)]
+
+    shards, interleave = plan_shards(_payload(settings.question_shard_size))
+    assert [(shard.payload.amount, shard.focus) for shard in shards] == [(settings.question_shard_size, None)]
+    assert not interleave
+
+
+def test_merge_interleaves_tech_shards():
+    assert merge_shards([["a1", "a2"], ["b1"], ["c1", "c2"]], interleave=True) == ["a1", "b1", "c1", "a2", "c2"]
+    assert merge_shards([["a1", "a2"], ["b1"]], interleave=False) == ["a1", "a2", "b1"]
+
+
+@pytest.mark.parametrize("generate", GENERATORS.values(), ids=GENERATORS.keys())
+def test_sharded_generation_returns_exactly_amount_distinct_questions(client, provider_calls, generate):
+    payload = _payload(30, ["python", "go", "sql", "docker", "redis"])
+    questions = generate(OpenAIService(), payload)
+    assert len(questions) == 30
+    _assert_distinct(questions)
+    # One call per shard, plus a top-up if shards asked the same question about different techs.
+    shards = settings.question_shard_max
+    assert shards <= provider_calls["chat"] <= shards + settings.question_top_up_attempts
+
+
+@pytest.mark.parametrize("generate", GENERATORS.values(), ids=GENERATORS.keys())
+def test_duplicate_shards_are_topped_up(client, fake_backend, provider_calls, monkeypatch, generate):
+    reply = fake_backend.reply
+
+    def unfocused(method, path, body, content_type=""):
+        # Every shard ignores its focus, so all of them answer with the same questions.
+        if path.endswith("/chat/completions"):
+            request = json.loads(body)
+            for message in request["messages"]:
+                message["content"] = re.sub(r"^Focus: .*\n", "", message["content"], flags=re.MULTILINE)
+            body = json.dumps(request).encode()
+        return reply(method, path, body, content_type)
+
+    monkeypatch.setattr(fake_backend, "reply", unfocused)
+    payload = _payload(24)
+    shards, _ = plan_shards(payload)
+    questions = generate(OpenAIService(), payload)
+    assert len(questions) == 24
+    _assert_distinct(questions)
+    # The shards overlap entirely; the top-up asked for the rest.
+    assert provider_calls["chat"] > len(shards)
+
+
+@pytest.mark.benchmark
+def test_benchmark_generation_time_by_shard_count(client, fake_backend, monkeypatch):
+    fake_backend.profile = load_profile(json.dumps({"chat": {"median_ms": 50, "p99_ms": 50, "token_ms": 4}}))
+    payload = _payload(24)
+    seconds = {}
+    for shard_count in range(1, settings.question_shard_max + 1):
+        monkeypatch.setattr(settings, "question_shard_size", -(-payload.amount // shard_count))
+        assert len(plan_shards(payload)[0]) == shard_count
+        started = time.perf_counter()
+        questions = OpenAIService().generate_interview_questions(payload, use_cache=False)
+        seconds[shard_count] = time.perf_counter() - started
+        assert len(questions) == payload.amount
+
+    # Output tokens dominate, so the wall clock falls with the shard count.
+    timings = ", ".join(f"{count} shard(s) {wall:.2f} s" for count, wall in seconds.items())
+    assert seconds[2] < seconds[1], timings
+    assert seconds[settings.question_shard_max] < seconds[1] / 2, timings
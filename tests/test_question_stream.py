@@ -0,0 +1,52 @@
+"""Identical setups share one streamed question generation."""
+import json
+
+from app.core.config import settings
+from app.core.question_set_cache import QuestionSetCache
+from app.schemas.interview import InterviewSetupPayload
+from app.services.fake_openai import load_profile
+from app.services.openai_service import OpenAIService
+from app.services.question_stream import open_question_stream
+
+STREAM_TIMEOUT_SECONDS = 10
+
+
+def _payload(techstack: list[str]) -> InterviewSetupPayload:
+    return InterviewSetupPayload(
+        role="backend developer", interview_type="technical", level="senior", techstack=techstack, amount=6
+    )
+
+
+def test_identical_setup_follows_the_live_stream(client, fake_backend, provider_calls):
+    fake_backend.profile = load_profile(json.dumps({"chat": {"median_ms": 20, "p99_ms": 20, "token_ms": 20}}))
+    payload = _payload(["erlang", "elixir"])
+    stored, first = open_question_stream(OpenAIService(), payload)
+    assert stored is None and first.claim is not None
+    stored, second = open_question_stream(OpenAIService(), payload)
+    assert stored is None and second.claim is None
+
+    # The second setup is startable as soon as the shared stream has a question.
+    assert second.wait_for(1, STREAM_TIMEOUT_SECONDS)
+    assert not second.done
+    first.wait_for(payload.amount + 1, STREAM_TIMEOUT_SECONDS)
+    second.wait_for(payload.amount + 1, STREAM_TIMEOUT_SECONDS)
+
+    assert second.done and second.error is None
+    assert second.questions == first.questions
+    assert len(first.questions) == payload.amount
+    # One generation: a single call, plus a top-up if the model repeated itself.
+    assert provider_calls["chat"] <= 1 + settings.question_top_up_attempts
+
+
+def test_wait_for_a_generation_sharing_nothing_is_bounded():
+    cache = QuestionSetCache(ttl_seconds=60, variants=1, max_keys=8, wait_seconds=0.05)
+    payload = _payload(["cobol"])
+    questions, claim, live = cache.claim(payload)
+    assert questions is None and claim is not None and live is None
+
+    # The owner never settles; an identical setup gives up waiting and generates itself.
+    assert cache.claim(payload) == (None, None, None)
+    assert cache.get_or_generate(payload, lambda: ["own"]) == ["own"]
+
+    claim.store(["shared"])
+    assert cache.claim(payload) == (["shared"], None, None)
@@ -0,0 +1,72 @@
+"""A reply whose LLM stream breaks off midway still closes its audio and completes the turn."""
+import json
+
+import pytest
+
+from app.services.fake_openai import FakeReply
+from app.services.interview_flow_service import FIELD_PROMPTS
+from tests.helpers import receive_until, start_interview_session
+
+STREAM_ERROR = b'data: {"error": {"message": "upstream reset", "type": "server_error"}}\n\n'
+
+
+@pytest.fixture
+def break_chat_streams(fake_backend, monkeypatch):
+    """Call to make every later streamed chat reply fail midway (question generation streams too)."""
+    reply = fake_backend.reply
+
+    def broken(method, path, body, content_type=""):
+        result = reply(method, path, body, content_type)
+        if path.endswith("/chat/completions") and json.loads(body).get("stream"):
+            # Half the tokens arrive, then the provider reports an error on the stream.
+            kept = result.chunks[: len(result.chunks) // 2]
+            return FakeReply(result.status, result.headers, kept + [(0.0, STREAM_ERROR)], result.first_byte_delay)
+        return result
+
+    return lambda: monkeypatch.setattr(fake_backend, "reply", broken)
+
+
+def _audio_framing(messages: list[dict | bytes]) -> list[str]:
+    return [message["type"] for message in messages if isinstance(message, dict) and "audio" in message["type"]]
+
+
+def _assert_closed_then_replaced(messages: list[dict | bytes]):
+    framing = _audio_framing(messages)
+    # The broken stream's audio_start is closed by its audio_end before the fallback is spoken.
+    assert framing[0] == "audio_start"
+    first_end = framing.index("audio_end")
+    assert "audio_start" not in framing[1:first_end]
+    assert framing[first_end + 1:] and framing[-1] == "audio_end"
+
+
+def test_interview_reply_falls_back_to_the_next_question(client, break_chat_streams):
+    session_id = start_interview_session(client)
+    break_chat_streams()
+    with client.websocket_connect(f"/api/interviews/sessions/{session_id}/voice?audio_mode=binary") as websocket:
+        receive_until(websocket, {"assistant_prompt"})
+        websocket.send_json({"type": "user_text", "text": "I would add an index."})
+        messages = receive_until(websocket, {"assistant_turn"})
+        turn = messages[-1]
+
+        _assert_closed_then_replaced(messages)
+        assert turn["assistant_text"].startswith("Thank you. Next question: ")
+        assert turn["question_index"] == 1
+
+        # The socket stays open for the next answer.
+        websocket.send_json({"type": "user_text", "text": "I would use a queue."})
+        assert receive_until(websocket, {"assistant_turn"})[-1]["question_index"] == 2
+
+
+def test_collector_reply_falls_back_to_the_next_field_prompt(client, break_chat_streams):
+    session_id = client.post("/api/collector/start", json={"audio_policy": "none"}).json()["collector_session_id"]
+    break_chat_streams()
+    with client.websocket_connect(f"/api/collector/sessions/{session_id}/voice?audio_mode=binary") as websocket:
+        receive_until(websocket, {"assistant_prompt"})
+        websocket.send_json({"type": "user_text", "text": "yes"})
+        receive_until(websocket, {"assistant_turn"})
+        websocket.send_json({"type": "user_text", "text": "backend developer"})
+        messages = receive_until(websocket, {"assistant_turn"})
+
+    _assert_closed_then_replaced(messages)
+    assert messages[-1]["expected_field"] == "interview_type"
+    assert messages[-1]["assistant_text"] == FIELD_PROMPTS["interview_type"]
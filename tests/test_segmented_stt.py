@@ -0,0 +1,114 @@
+"""Segmented transcription of long WAV/PCM answers, and its benchmark against the single-shot path."""
+import json
+import re
+import time
+import wave
+from io import BytesIO
+
+import pytest
+
+from app.core.config import settings
+from app.services.fake_openai import FakeReply, load_profile
+from app.services.streaming_stt import pcm16_to_wav
+from tests.helpers import SAMPLE_RATE, receive_until, silence, start_interview_session, tone
+
+ANSWER_SECONDS = 60
+# Transcription latency grows with the upload, as it does with the real API.
+TRANSCRIPTION = {"median_ms": 100, "p99_ms": 100, "per_mb_ms": 1500}
+
+
+def long_answer(seconds: int) -> bytes:
+    """A WAV of 0.7 s speech-like tone bursts, each followed by a 0.5 s pause."""
+    return pcm16_to_wav((tone(700) + silence(500)) * (seconds * 10 // 12), SAMPLE_RATE)
+
+
+def _transcribe(client, wav: bytes) -> dict:
+    response = client.post("/api/transcripts/voice/transcribe", files={"audio_file": ("answer.wav", wav, "audio/wav")})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.fixture
+def uploads(fake_backend, monkeypatch) -> list[tuple[str, float]]:
+    """(filename, seconds) of every transcription request; each is transcribed as its file name.
+
+    Earlier segments answer last, so the joined text shows whether it follows
+    the recording or the order the answers came in.
+    """
+    seen: list[tuple[str, float]] = []
+    passthrough = fake_backend.reply
+
+    def reply(method, path, body, content_type=""):
+        if not path.endswith("/audio/transcriptions"):
+            return passthrough(method, path, body, content_type)
+        filename = re.search(rb'filename="([^"]+)"', body).group(1).decode()
+        with wave.open(BytesIO(body[body.index(b"RIFF"):]), "rb") as audio:
+            seen.append((filename, audio.getnframes() / audio.getframerate()))
+        index = re.match(r"segment-(\d+)", filename)
+        delay = 0.2 / (1 + int(index.group(1))) if index else 0.0
+        text = json.dumps({"text": filename}).encode()
+        return FakeReply(200, {"content-type": "application/json"}, [(0.0, text)], delay)
+
+    monkeypatch.setattr(fake_backend, "reply", reply)
+    return seen
+
+
+def test_long_answer_is_split_at_pauses_and_joined_in_order(client, uploads):
+    result = _transcribe(client, long_answer(ANSWER_SECONDS))
+
+    count = len(uploads)
+    assert count == ANSWER_SECONDS * 1000 // settings.stt_split_target_ms
+    assert result["text"] == " ".join(f"segment-{index}.wav" for index in range(count))
+    assert sorted(filename for filename, _ in uploads) == sorted(f"segment-{index}.wav" for index in range(count))
+    assert all(seconds <= settings.stt_split_max_ms / 1000 for _, seconds in uploads)
+    # The pauses between bursts stay in the segments; only the recording's trailing silence is dropped.
+    assert ANSWER_SECONDS - 1 <= sum(seconds for _, seconds in uploads) <= ANSWER_SECONDS
+
+
+def test_short_answer_is_trimmed_and_sent_whole(client, uploads):
+    result = _transcribe(client, pcm16_to_wav(silence(2000) + tone(3000) + silence(3000), SAMPLE_RATE))
+
+    assert result["text"] == "audio.wav"
+    [(_, seconds)] = uploads
+    padding = 2 * settings.audio_trim_padding_ms / 1000
+    # Speech starts and ends within a VAD frame of where the trim cuts.
+    assert 3.0 <= seconds <= 3.0 + padding + 2 * settings.stt_vad_frame_ms / 1000
+
+
+@pytest.mark.benchmark
+def test_benchmark_segmented_against_single_shot(client, fake_backend, provider_calls, monkeypatch):
+    fake_backend.profile = load_profile(json.dumps({"transcription": TRANSCRIPTION}))
+    wav = long_answer(ANSWER_SECONDS)
+
+    with monkeypatch.context() as single_shot:
+        single_shot.setattr(settings, "stt_split_min_ms", ANSWER_SECONDS * 2000)
+        started = time.perf_counter()
+        _transcribe(client, wav)
+        single_seconds = time.perf_counter() - started
+    assert provider_calls["transcription"] == 1
+
+    provider_calls.clear()
+    started = time.perf_counter()
+    _transcribe(client, wav)
+    segmented_seconds = time.perf_counter() - started
+    segments = provider_calls["transcription"]
+
+    # Segments are priced by their own size and sent concurrently.
+    assert segmented_seconds < single_seconds / 2, (
+        f"{ANSWER_SECONDS} s answer: single-shot {single_seconds:.2f} s, {segments} segments {segmented_seconds:.2f} s"
+    )
+
+
+def test_recording_without_speech_is_not_sent(client, uploads):
+    assert _transcribe(client, pcm16_to_wav(silence(5000), SAMPLE_RATE))["text"] == ""
+    assert uploads == []
+
+
+def test_socket_reports_a_recording_without_speech(client, uploads):
+    session_id = start_interview_session(client)
+    with client.websocket_connect(f"/api/interviews/sessions/{session_id}/voice") as websocket:
+        receive_until(websocket, {"assistant_prompt"})
+        websocket.send_bytes(pcm16_to_wav(silence(2000), SAMPLE_RATE))
+        websocket.send_json({"type": "audio_end", "filename": "answer.wav"})
+        assert receive_until(websocket, {"error"})[-1]["message"] == "No speech detected in the recording"
+    assert uploads == []
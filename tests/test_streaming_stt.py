@@ -0,0 +1,101 @@
+"""Streaming STT: segments are transcribed while the candidate talks and the server detects the end."""
+import asyncio
+
+from app.core.config import settings
+from app.services.streaming_stt import StreamingTranscriber
+from tests.helpers import SAMPLE_RATE, receive_until, silence, start_interview_session, tone
+
+CHUNK_MS = 60
+
+
+def answer(words: int) -> bytes:
+    """``words`` bursts of speech split by pauses long enough to close a segment, then the endpoint silence."""
+    pause = settings.stt_segment_pause_ms + 2 * settings.stt_vad_frame_ms
+    bursts = [tone(600) + silence(pause) for _ in range(words - 1)] + [tone(600)]
+    return b"".join(bursts) + silence(settings.stt_endpoint_silence_ms + 4 * settings.stt_vad_frame_ms)
+
+
+def chunks(pcm: bytes, ms: int = CHUNK_MS) -> list[bytes]:
+    size = SAMPLE_RATE * ms // 1000 * 2
+    return [pcm[offset:offset + size] for offset in range(0, len(pcm), size)]
+
+
+def test_transcriber_sends_segments_at_pauses_and_endpoints():
+    async def run():
+        calls = []
+
+        async def transcribe(filename: str, audio: bytes) -> str:
+            calls.append(filename)
+            return f"word{len(calls)}"
+
+        stt = StreamingTranscriber(transcribe, sample_rate=SAMPLE_RATE)
+        partials = []
+        endpointed = False
+        for chunk in chunks(silence(300) + answer(3)):
+            assert not endpointed, "audio after the endpoint"
+            endpointed = stt.feed(chunk)
+            await asyncio.sleep(0)
+            partial = stt.take_partial()
+            if partial is not None:
+                partials.append(partial)
+            if endpointed:
+                break
+        return endpointed, partials, await stt.finish(), calls
+
+    endpointed, partials, transcript, calls = asyncio.run(run())
+    assert endpointed
+    assert calls == ["segment-0.wav", "segment-1.wav", "segment-2.wav"]
+    assert partials[:2] == ["word1", "word1 word2"]
+    assert transcript == "word1 word2 word3"
+
+
+def test_audio_past_the_endpoint_starts_the_next_utterance():
+    async def run():
+        async def transcribe(filename: str, audio: bytes) -> str:
+            return f"{len(audio)}"
+
+        stt = StreamingTranscriber(transcribe, sample_rate=SAMPLE_RATE)
+        # The next sentence starts in the same chunk as the endpoint.
+        assert stt.feed(answer(1) + tone(600))
+        first = await stt.take_utterance()
+        heard = stt.heard_speech
+        stt.feed(silence(settings.stt_segment_pause_ms + 2 * settings.stt_vad_frame_ms))
+        return first, heard, await stt.take_utterance()
+
+    first, heard, second = asyncio.run(run())
+    assert len(first) == 1 and heard
+    # The whole 600 ms burst is in the second utterance, not only what followed the chunk.
+    assert len(second) == 1 and int(second[0]) >= len(tone(600))
+
+
+def test_transcriber_ignores_silence():
+    async def run():
+        async def transcribe(filename: str, audio: bytes) -> str:
+            raise AssertionError("silence was sent for transcription")
+
+        stt = StreamingTranscriber(transcribe, sample_rate=SAMPLE_RATE)
+        endpointed = any([stt.feed(chunk) for chunk in chunks(silence(3000))])
+        return endpointed, stt.heard_speech, await stt.finish()
+
+    assert asyncio.run(run()) == (False, False, "")
+
+
+def test_socket_streams_partials_and_endpoints_the_answer(client, provider_calls, monkeypatch):
+    monkeypatch.setattr(settings, "fake_openai_transcript", "indexes")
+    session_id = start_interview_session(client)
+    url = f"/api/interviews/sessions/{session_id}/voice?stt_mode=streaming&sample_rate={SAMPLE_RATE}&audio_mode=base64"
+    with client.websocket_connect(url) as websocket:
+        receive_until(websocket, {"assistant_prompt"})
+        provider_calls.clear()
+        for chunk in chunks(answer(3)):
+            websocket.send_bytes(chunk)
+        # No audio_end from the client: the server decides the answer is over.
+        messages = receive_until(websocket, {"assistant_turn"})
+
+    types = [message["type"] for message in messages]
+    final = next(message for message in messages if message["type"] == "transcript_final")
+    assert "transcript_partial" in types
+    assert types.index("transcript_partial") < types.index("transcript_final") < types.index("assistant_turn")
+    assert final == {"type": "transcript_final", "text": "indexes indexes indexes", "endpointed": True}
+    assert messages[-1]["user_text"] == "indexes indexes indexes"
+    assert provider_calls["transcription"] == 3
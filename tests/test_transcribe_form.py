@@ -0,0 +1,25 @@
+"""Malformed fields of the streamed transcription upload are rejected with 400."""
+import pytest
+
+from app.services.streaming_stt import pcm16_to_wav
+from tests.helpers import SAMPLE_RATE, tone
+
+URL = "/api/transcripts/voice/transcribe"
+
+
+def _audio() -> tuple[str, bytes, str]:
+    return "answer.wav", pcm16_to_wav(tone(300), SAMPLE_RATE), "audio/wav"
+
+
+@pytest.mark.parametrize("field", ["session_id", "session_type", "user_id"])
+def test_file_in_a_text_field_is_rejected(client, field):
+    files = {"audio_file": _audio(), field: ("42.txt", b"42", "text/plain")}
+    response = client.post(URL, files=files)
+    assert response.status_code == 400
+    assert response.json()["detail"] == f"{field} must be a text field"
+
+
+def test_non_integer_session_id_is_rejected(client):
+    response = client.post(URL, files={"audio_file": _audio()}, data={"session_id": "abc", "session_type": "interview"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "session_id must be an integer"
@@ -0,0 +1,73 @@
+"""Voice sockets keep provider and database calls off the event loop."""
+import asyncio
+import threading
+import time
+
+from app.services.fake_openai import fake_transport
+from tests.helpers import receive_until, start_interview_session
+
+SOCKETS = 8
+# Only a hung event loop comes near this; a passing run never waits for it.
+GATE_TIMEOUT_SECONDS = 10
+
+
+def test_concurrent_turns_do_not_block_the_event_loop(client, monkeypatch):
+    session_ids = [start_interview_session(client) for _ in range(SOCKETS)]
+    transport = fake_transport()
+    handle = transport.handle_async_request
+    in_flight = {"chat": 0, "max": 0}
+    released = threading.Event()
+
+    async def gated(request):
+        # Chat calls are held until the test releases them, so every turn is
+        # waiting on the provider at the same time if the loop keeps serving.
+        if request.url.path.endswith("/chat/completions"):
+            in_flight["chat"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["chat"])
+            deadline = time.monotonic() + GATE_TIMEOUT_SECONDS
+            try:
+                while not released.is_set() and time.monotonic() < deadline:
+                    await asyncio.sleep(0.005)
+            finally:
+                in_flight["chat"] -= 1
+        return await handle(request)
+
+    monkeypatch.setattr(transport, "handle_async_request", gated)
+    connected = threading.Barrier(SOCKETS + 1)
+    turns: list[dict] = []
+    errors: list[BaseException] = []
+
+    def take_turn(session_id: int):
+        try:
+            url = f"/api/interviews/sessions/{session_id}/voice?audio_mode=binary"
+            with client.websocket_connect(url) as websocket:
+                receive_until(websocket, {"assistant_prompt"})
+                connected.wait()
+                websocket.send_json({"type": "user_text", "text": "I would add an index."})
+                turns.append(receive_until(websocket, {"assistant_turn"})[-1])
+        except BaseException as exc:
+            errors.append(exc)
+            connected.abort()
+
+    threads = [threading.Thread(target=take_turn, args=(session_id,)) for session_id in session_ids]
+    for thread in threads:
+        thread.start()
+    try:
+        connected.wait()
+        deadline = time.monotonic() + GATE_TIMEOUT_SECONDS
+        while in_flight["chat"] < SOCKETS and time.monotonic() < deadline and not errors:
+            time.sleep(0.005)
+        all_waiting = in_flight["chat"] == SOCKETS
+        # Served while every turn is still waiting on its chat call.
+        health = client.get("/health").status_code
+        still_waiting = in_flight["chat"] == SOCKETS
+    finally:
+        released.set()
+        for thread in threads:
+            thread.join()
+
+    assert not errors, errors
+    assert all_waiting, in_flight
+    assert health == 200
+    assert still_waiting
+    assert len(turns) == SOCKETS